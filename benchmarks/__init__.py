@@ -0,0 +1,2 @@
+__author__ = "Pragya Sinha"
+__version__ = "0.1.0"
@@ -0,0 +1,87 @@
+"""
+Random-access read latency, single stream vs block compressed archives
+
+Run from the directory containing crimson_logger:
+    python -m crimson_logger.benchmarks.bench_block_archive --size-mb 64
+"""
+
+from crimson_logger.src.block_archive import open_at, write_block_archive
+import argparse
+import gzip
+import os
+import random
+import shutil
+import tempfile
+import time
+
+
+def make_log(path: str, size: int) -> None:
+    with open(path, "wb") as log_file:
+        written = 0
+        i = 0
+        while written < size:
+            line = b"[payments.ledger] INFO [02-01-2024 03:04:05] request %d handled ok\n" % i
+            log_file.write(line)
+            written += len(line)
+            i += 1
+
+
+def measure(read_at, offsets: list[int]) -> list[float]:
+    samples = []
+    for offset in offsets:
+        start = time.perf_counter()
+        read_at(offset)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--block-size", type=int, default=64 * 1024)
+    parser.add_argument("--reads", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        raw = os.path.join(work_dir, "app.log")
+        single = os.path.join(work_dir, "single.gz")
+        blocked = os.path.join(work_dir, "blocked.gz")
+        size = args.size_mb * 1024 * 1024
+        make_log(raw, size)
+
+        start = time.perf_counter()
+        with open(raw, "rb") as src, gzip.open(single, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        single_compress = time.perf_counter() - start
+
+        start = time.perf_counter()
+        table = write_block_archive(raw, blocked, args.block_size)
+        block_compress = time.perf_counter() - start
+
+        offsets = [random.randrange(size - 4096) for _ in range(args.reads)]
+
+        def read_single(offset):
+            with gzip.open(single, "rb") as stream:
+                stream.seek(offset)
+                stream.read(4096)
+
+        def read_blocked(offset):
+            with open_at(blocked, table, offset) as stream:
+                stream.read(4096)
+
+        print(f"archive of {args.size_mb} MB, 4 KB reads at {args.reads} random offsets")
+        print(f"{'archive':<10}{'size MB':>10}{'compress s':>12}{'p50 ms':>10}{'p99 ms':>10}")
+        for name, path, compress, read_at in (
+            ("single", single, single_compress, read_single),
+            ("blocked", blocked, block_compress, read_blocked),
+        ):
+            samples = measure(read_at, offsets)
+            p50 = samples[len(samples) // 2] * 1000
+            p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000
+            archive_mb = os.path.getsize(path) / 1024 / 1024
+            print(f"{name:<10}{archive_mb:>10.2f}{compress:>12.2f}{p50:>10.2f}{p99:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Allocations and throughput of the file sink text path vs bytes_io
+
+tracemalloc reports the peak of memory allocated while a batch is written
+(transient copies: line + newline, joined batch, text layer encoding) and
+the bytes still held afterwards.
+
+Run from the directory containing crimson_logger:
+    python -m crimson_logger.benchmarks.bench_bytes_io --records 200000 --batch-size 512
+"""
+
+from crimson_logger.src.crimson_file_sink import CrimsonFileSink
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.log_level import LogLevel
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+
+def make_config(path: str, bytes_io: bool) -> CrimsonLogConfig:
+    return CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        file_location=path,
+        max_file_size=1 << 40,  # keep rotation out of the numbers
+        bytes_io=bytes_io,
+    )
+
+
+def run(path: str, bytes_io: bool, batches: list[list[str]]) -> dict:
+    sink = CrimsonFileSink().configure(make_config(path, bytes_io))
+
+    start = time.perf_counter()
+    for batch in batches:
+        sink.write_batch(batch)
+        sink.flush()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    peaks = []
+    for batch in batches[:200]:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        sink.write_batch(batch)
+        sink.flush()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    sink.close()
+    return {
+        "records_per_s": sum(len(batch) for batch in batches) / elapsed,
+        "peak_per_batch": sum(peaks) / len(peaks),
+        "retained": retained,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=512)
+    args = parser.parse_args()
+
+    line = "[payments.ledger] INFO [02-01-2024 03:04:05] request {} handled ok"
+    lines = [line.format(i) for i in range(args.records)]
+    batches = [
+        lines[i : i + args.batch_size] for i in range(0, len(lines), args.batch_size)
+    ]
+
+    print(f"{args.records} records in batches of {args.batch_size}")
+    print(f"{'path':<10}{'records/s':>14}{'peak KB/batch':>16}{'retained KB':>14}")
+    with tempfile.TemporaryDirectory() as work_dir:
+        for name, bytes_io in (("text", False), ("bytes_io", True)):
+            result = run(os.path.join(work_dir, f"{name}.log"), bytes_io, batches)
+            print(
+                f"{name:<10}{result['records_per_s']:>14,.0f}"
+                f"{result['peak_per_batch'] / 1024:>16.1f}{result['retained'] / 1024:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
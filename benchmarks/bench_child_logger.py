@@ -0,0 +1,103 @@
+"""
+Per call cost of logger.info(content, namespace) vs a child logger bound
+to the namespace
+
+The sink only counts records so the numbers are the logger side of a
+call: level check, prefix, timestamp and message. Both variants use the
+same number of fixed namespaces.
+
+Run from the directory containing crimson_logger:
+    python -m crimson_logger.benchmarks.bench_child_logger --records 1000000 --namespaces 300
+"""
+
+from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.crimson_sink import CrimsonSink
+from crimson_logger.src.log_level import LogLevel
+import argparse
+import time
+
+
+class CountingSink(CrimsonSink):
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def configure(self, config):
+        return self
+
+    def write(self, message: str):
+        self.count += 1
+
+
+def build_logger(namespace_rules: int):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        namespace_levels={f"service{i}": LogLevel.INFO for i in range(namespace_rules)},
+    )
+    return (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .with_custom_sink(CountingSink())
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+
+def run(log, calls: list) -> float:
+    start = time.perf_counter_ns()
+    for call, namespace in calls:
+        log(call, namespace)
+    return (time.perf_counter_ns() - start) / len(calls)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--namespaces", type=int, default=300)
+    args = parser.parse_args()
+
+    logger = build_logger(namespace_rules=10)
+    namespaces = [f"service{i % 10}.component{i}" for i in range(args.namespaces)]
+    children = {namespace: logger.child(namespace) for namespace in namespaces}
+    calls = [
+        (f"request {i} handled", namespaces[i % len(namespaces)])
+        for i in range(args.records)
+    ]
+
+    def parent_info(content, namespace):
+        logger.info(content, namespace)
+
+    def child_info(content, namespace):
+        children[namespace].info(content)
+
+    # children are looked up per call above, this is the usual case of a
+    # module holding its child logger
+    held = children[namespaces[0]]
+    held_calls = [(content, None) for content, _ in calls]
+
+    def held_info(content, _):
+        held.info(content)
+
+    def parent_single(content, _):
+        logger.info(content, namespaces[0])
+
+    print(f"{args.records} records over {len(namespaces)} namespaces")
+    print(f"{'variant':<28}{'ns/call':>10}")
+    for name, log, variant_calls in (
+        ("logger.info(ns) mixed", parent_info, calls),
+        ("child.info() mixed", child_info, calls),
+        ("logger.info(ns) one ns", parent_single, held_calls),
+        ("child.info() one ns", held_info, held_calls),
+    ):
+        print(f"{name:<28}{run(log, variant_calls):>10.0f}")
+
+    logger.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Caller-side latency of ASYNC logging with eager vs deferred formatting
+
+Run from the directory containing crimson_logger:
+    python -m crimson_logger.benchmarks.bench_deferred_formatting --records 100000
+"""
+
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.write_mode import WriteMode
+from crimson_logger.src.thread_model import ThreadModel
+import argparse
+import os
+import tempfile
+import time
+
+
+def percentile(sorted_samples: list[int], pct: float) -> int:
+    return sorted_samples[min(len(sorted_samples) - 1, int(len(sorted_samples) * pct))]
+
+
+def run_once(deferred: bool, records: int, log_dir: str) -> list[int]:
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        thread_model=ThreadModel.MULTI,
+        write_mode=WriteMode.ASYNC,
+        file_location=os.path.join(log_dir, f"deferred-{deferred}.log"),
+        deferred_formatting=deferred,
+    )
+    logger = (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+    samples = []
+    clock = time.perf_counter_ns
+    for i in range(records):
+        start = clock()
+        logger.info("request %d for user %s took %dms", "bench", i, "bob", 12)
+        samples.append(clock() - start)
+
+    logger.close()
+    samples.sort()
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'mode':<10}{'p50 ns':>10}{'p99 ns':>10}{'mean ns':>10}")
+    with tempfile.TemporaryDirectory() as log_dir:
+        for deferred in (False, True):
+            samples = run_once(deferred, args.records, log_dir)
+            mode = "deferred" if deferred else "eager"
+            mean = sum(samples) // len(samples)
+            print(
+                f"{mode:<10}{percentile(samples, 0.5):>10}"
+                f"{percentile(samples, 0.99):>10}{mean:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Formatter.format_message calls per second, cached timestamp vs strftime per call
+
+Run from the directory containing crimson_logger:
+    python -m crimson_logger.benchmarks.bench_formatter --calls 500000
+"""
+
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.crimson_formatter import Formatter
+from crimson_logger.src.log_level import LogLevel
+from datetime import datetime
+import argparse
+import time
+
+
+def uncached(formatter: Formatter, calls: int) -> float:
+    # what format_message did before timestamps were cached
+    ts_format = formatter._ts_format
+    start = time.perf_counter()
+    for _ in range(calls):
+        formatted_ts = datetime.now().strftime(ts_format)
+        f"[bench] INFO [{formatted_ts}] message"
+    return calls / (time.perf_counter() - start)
+
+
+def cached(formatter: Formatter, calls: int) -> float:
+    format_message = formatter.format_message
+    start = time.perf_counter()
+    for _ in range(calls):
+        format_message("INFO", "message", "bench")
+    return calls / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500_000)
+    args = parser.parse_args()
+
+    for ts_format in ("dd-mm-yyyy hh:MM:ss", "dd-mm-yyyy hh:MM:ss.SSS"):
+        config = CrimsonLogConfig(
+            ts_format=ts_format,
+            db_ip_address=None,
+            db_port="",
+            log_level=LogLevel.INFO,
+        )
+        formatter = Formatter().configure(config)
+        print(f"ts_format {ts_format!r}")
+        if "SSS" not in ts_format:
+            print(f"  strftime per call {uncached(formatter, args.calls):>14,.0f} calls/sec")
+        print(f"  cached            {cached(formatter, args.calls):>14,.0f} calls/sec")
+
+
+if __name__ == "__main__":
+    main()
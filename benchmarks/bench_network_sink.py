@@ -0,0 +1,76 @@
+"""
+Network sink throughput over loopback, per record sends vs batched frames
+
+Run from the directory containing crimson_logger:
+    python -m crimson_logger.benchmarks.bench_network_sink --records 200000
+"""
+
+from crimson_logger.src.crimson_network_sink import CrimsonNetworkSink, FRAME_HEADER
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.log_level import LogLevel
+import argparse
+import socket
+import threading
+import time
+
+
+def receive(server: socket.socket, expected: int, done: threading.Event) -> None:
+    connection, _ = server.accept()
+    stream = connection.makefile("rb")
+    received = 0
+    while received < expected:
+        (length,) = FRAME_HEADER.unpack(stream.read(FRAME_HEADER.size))
+        received += stream.read(length).count(b"\n")
+    connection.close()
+    done.set()
+
+
+def run(records: int, batch_size: int) -> float:
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    done = threading.Event()
+    threading.Thread(target=receive, args=(server, records, done), daemon=True).start()
+
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address="127.0.0.1",
+        db_port=str(server.getsockname()[1]),
+        log_level=LogLevel.INFO,
+        sink_type="NETWORK",
+    )
+    sink = CrimsonNetworkSink().configure(config)
+    line = "[payments.ledger] INFO [02-01-2024 03:04:05] request handled ok"
+
+    start = time.perf_counter()
+    if batch_size == 1:
+        for _ in range(records):
+            sink.write(line)
+    else:
+        for _ in range(records // batch_size):
+            sink.write_batch([line] * batch_size)
+            sink.flush()
+    sink.flush()
+    done.wait()
+    elapsed = time.perf_counter() - start
+
+    sink.close()
+    server.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 64, 512])
+    args = parser.parse_args()
+
+    print(f"{'batch size':<12}{'records/s':>14}")
+    for batch_size in args.batch_sizes:
+        records = args.records // batch_size * batch_size
+        elapsed = run(records, batch_size)
+        print(f"{batch_size:<12}{records / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Throughput of ProcessWriter with several producer processes
+
+Run from the directory containing crimson_logger:
+    python -m crimson_logger.benchmarks.bench_process_writer --processes 8
+"""
+
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.write_mode import WriteMode
+from crimson_logger.src.thread_model import ThreadModel
+import argparse
+import gzip
+import multiprocessing
+import os
+import tempfile
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--processes", type=int, default=8)
+    parser.add_argument("--records", type=int, default=50_000, help="per process")
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        config = CrimsonLogConfig(
+            ts_format="dd-mm-yyyy hh:MM:ss",
+            db_ip_address=None,
+            db_port="",
+            log_level=LogLevel.INFO,
+            thread_model=ThreadModel.MULTI,
+            write_mode=WriteMode.PROCESS,
+            file_location=os.path.join(log_dir, "process.log"),
+            batch_size=args.batch_size,
+        )
+        logger = (
+            CrimsonLoggerBuilder()
+            .with_config(None, custom_config=config)
+            .set_sink()
+            .set_writer()
+            .set_formatter()
+            .build()
+        )
+        message = "x" * 100
+
+        def produce(worker):
+            namespace = f"worker{worker}"
+            for _ in range(args.records):
+                logger.info(message, namespace)
+
+        ctx = multiprocessing.get_context("fork")
+        workers = [ctx.Process(target=produce, args=(w,)) for w in range(args.processes)]
+
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        logger.close()
+        elapsed = time.perf_counter() - start
+
+        written = 0
+        for name in os.listdir(log_dir):
+            opener = gzip.open if name.endswith(".gz") else open
+            with opener(os.path.join(log_dir, name), "rb") as log_file:
+                written += sum(1 for _ in log_file)
+
+    total = args.processes * args.records
+    print(f"processes={args.processes} records={total} written={written}")
+    print(f"{total / elapsed:,.0f} records/sec ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
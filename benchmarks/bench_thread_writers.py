@@ -0,0 +1,81 @@
+"""
+Multi-threaded throughput of SyncWriter, AsyncWriter and BufferedWriter
+
+Run from the directory containing crimson_logger:
+    python -m crimson_logger.benchmarks.bench_thread_writers --records 200000
+"""
+
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.crimson_file_sink import CrimsonFileSink
+from crimson_logger.src.sync_writer import SyncWriter
+from crimson_logger.src.async_writer import AsyncWriter
+from crimson_logger.src.buffered_writer import BufferedWriter
+from crimson_logger.src.log_level import LogLevel
+from threading import Thread, Barrier
+import argparse
+import os
+import tempfile
+import time
+
+WRITERS = {
+    "SyncWriter": SyncWriter,
+    "AsyncWriter": AsyncWriter,
+    "BufferedWriter": BufferedWriter,
+}
+
+
+def run_once(writer_name: str, threads: int, records: int, log_dir: str) -> float:
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        file_location=os.path.join(log_dir, f"{writer_name}-{threads}.log"),
+    )
+    sink = CrimsonFileSink().configure(config, max_file_size=1 << 40)
+    writer = WRITERS[writer_name]().set_sink(sink)
+    if hasattr(writer, "start"):
+        writer.start()
+
+    per_thread = records // threads
+    message = "x" * 100
+    barrier = Barrier(threads + 1)
+
+    def produce():
+        barrier.wait()
+        for _ in range(per_thread):
+            writer.write_to_sink(message)
+
+    producers = [Thread(target=produce) for _ in range(threads)]
+    for producer in producers:
+        producer.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for producer in producers:
+        producer.join()
+    if hasattr(writer, "stop"):
+        writer.stop()
+        writer.join()
+    elapsed = time.perf_counter() - start
+
+    sink.close()
+    return per_thread * threads / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16, 64])
+    args = parser.parse_args()
+
+    print(f"{'writer':<16}{'threads':>8}{'records/sec':>16}")
+    with tempfile.TemporaryDirectory() as log_dir:
+        for threads in args.threads:
+            for writer_name in WRITERS:
+                rate = run_once(writer_name, threads, args.records, log_dir)
+                print(f"{writer_name:<16}{threads:>8}{rate:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
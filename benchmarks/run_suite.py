@@ -0,0 +1,295 @@
+"""
+Benchmark suite over writer, thread model and file sink combinations
+
+Every combination runs in its own process so peak RSS is per run.
+Reports records/sec, caller-side p50/p99/p999 latency, end-to-end
+latency until the sink has written the record, and peak RSS.
+
+Run from the directory containing crimson_logger:
+    python -m crimson_logger.benchmarks.run_suite run --output base.json
+    python -m crimson_logger.benchmarks.run_suite run --output new.json
+    python -m crimson_logger.benchmarks.run_suite compare base.json new.json --threshold 10
+"""
+
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
+from crimson_logger.src.crimson_file_sink import CrimsonFileSink
+from crimson_logger.src.crimson_sink import CrimsonSink
+from crimson_logger.src.crimson_log_index import split_line
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.write_mode import WriteMode
+from crimson_logger.src.thread_model import ThreadModel
+from threading import Thread, Barrier
+import argparse
+import itertools
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+WRITE_MODES = ["SYNC", "ASYNC"]
+THREAD_MODELS = ["SINGLE", "MULTI"]
+# max_file_size per sink configuration, "off" never rotates
+SINK_CONFIGS = {"off": 1 << 50, "small": 256 * 1024, "large": 16 * 1024 * 1024}
+MESSAGE_SIZES = [64, 512]
+THREAD_COUNTS = [1, 4, 16]
+
+# every Nth record carries its send time for end-to-end latency
+E2E_SAMPLE_EVERY = 16
+_STAMP_WIDTH = 20
+
+# metric -> True if higher is better
+METRICS = {
+    "records_per_sec": True,
+    "caller_p50_us": False,
+    "caller_p99_us": False,
+    "caller_p999_us": False,
+    "e2e_p50_us": False,
+    "e2e_p99_us": False,
+    "peak_rss_kb": False,
+}
+
+
+class TimingSink(CrimsonSink):
+    """
+    File sink that records when sampled records reached it
+    """
+
+    def __init__(self, max_file_size: int) -> None:
+        super().__init__()
+        self._max_file_size = max_file_size
+        self.e2e_ns = []
+
+    def configure(self, config: CrimsonLogConfig):
+        self._sink = CrimsonFileSink().configure(config, self._max_file_size)
+        return self
+
+    def _stamp(self, messages: list[str]) -> None:
+        now = time.perf_counter_ns()
+        for message in messages:
+            content = split_line(message)[3]
+            if content[0] != "-":
+                self.e2e_ns.append(now - int(content[:_STAMP_WIDTH]))
+
+    def write(self, message: str):
+        self._sink.write(message)
+        self._stamp([message])
+
+    def write_batch(self, messages: list[str]):
+        self._sink.write_batch(messages)
+        self._stamp(messages)
+
+    def flush(self):
+        self._sink.flush()
+
+    def close(self):
+        self._sink.close()
+
+
+def percentile_us(sorted_ns: list[int], pct: float) -> float:
+    if not sorted_ns:
+        return 0.0
+    return sorted_ns[min(len(sorted_ns) - 1, int(len(sorted_ns) * pct))] / 1000
+
+
+def run_case(params: dict) -> dict:
+    """
+    Run one combination in this process, returns metrics
+    """
+    with tempfile.TemporaryDirectory() as log_dir:
+        config = CrimsonLogConfig(
+            ts_format="dd-mm-yyyy hh:MM:ss",
+            db_ip_address=None,
+            db_port="",
+            log_level=LogLevel.INFO,
+            thread_model=ThreadModel(params["thread_model"]),
+            write_mode=WriteMode(params["write_mode"]),
+            file_location=os.path.join(log_dir, "bench.log"),
+        )
+        sink = TimingSink(SINK_CONFIGS[params["rotation"]])
+        logger = (
+            CrimsonLoggerBuilder()
+            .with_config(None, custom_config=config)
+            .with_custom_sink(sink)
+            .set_writer()
+            .set_formatter()
+            .build()
+        )
+
+        threads = params["threads"]
+        per_thread = params["records"] // threads
+        padding = "x" * max(0, params["message_size"] - _STAMP_WIDTH)
+        unstamped = "-" * _STAMP_WIDTH + padding
+        caller_ns = [[] for _ in range(threads)]
+        # SINGLE thread model logs from the thread that built the logger
+        inline = params["thread_model"] == "SINGLE"
+        barrier = Barrier(1 if inline else threads + 1)
+
+        def produce(samples):
+            clock = time.perf_counter_ns
+            info = logger.info
+            barrier.wait()
+            for i in range(per_thread):
+                start = clock()
+                if i % E2E_SAMPLE_EVERY:
+                    info(unstamped, "bench")
+                else:
+                    info(f"{start:0{_STAMP_WIDTH}d}{padding}", "bench")
+                samples.append(clock() - start)
+
+        if inline:
+            start = time.perf_counter()
+            produce(caller_ns[0])
+        else:
+            producers = [
+                Thread(target=produce, args=(caller_ns[t],)) for t in range(threads)
+            ]
+            for producer in producers:
+                producer.start()
+            barrier.wait()
+            start = time.perf_counter()
+            for producer in producers:
+                producer.join()
+        logger.close()
+        elapsed = time.perf_counter() - start
+
+    caller = sorted(itertools.chain.from_iterable(caller_ns))
+    e2e = sorted(sink.e2e_ns)
+    return {
+        "records_per_sec": per_thread * threads / elapsed,
+        "caller_p50_us": percentile_us(caller, 0.5),
+        "caller_p99_us": percentile_us(caller, 0.99),
+        "caller_p999_us": percentile_us(caller, 0.999),
+        "e2e_p50_us": percentile_us(e2e, 0.5),
+        "e2e_p99_us": percentile_us(e2e, 0.99),
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def cases(records: int):
+    for write_mode, thread_model, rotation, message_size in itertools.product(
+        WRITE_MODES, THREAD_MODELS, SINK_CONFIGS, MESSAGE_SIZES
+    ):
+        thread_counts = [1] if thread_model == "SINGLE" else THREAD_COUNTS
+        for threads in thread_counts:
+            params = {
+                "write_mode": write_mode,
+                "thread_model": thread_model,
+                "rotation": rotation,
+                "message_size": message_size,
+                "threads": threads,
+                "records": records,
+            }
+            name = (
+                f"{write_mode}-{thread_model}-rot_{rotation}"
+                f"-msg{message_size}-t{threads}"
+            )
+            yield name, params
+
+
+def run_suite(args) -> None:
+    package_parent = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    env = dict(os.environ, PYTHONPATH=package_parent)
+    results = []
+
+    for name, params in cases(args.records):
+        if args.filter and args.filter not in name:
+            continue
+        completed = subprocess.run(
+            [sys.executable, "-m", __spec__.name, "case", json.dumps(params)],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        metrics = json.loads(completed.stdout.strip().splitlines()[-1])
+        results.append({"name": name, "params": params, "metrics": metrics})
+        print(
+            f"{name:<40}{metrics['records_per_sec']:>12,.0f} rec/s"
+            f"  p99 {metrics['caller_p99_us']:>8.1f}us"
+            f"  e2e p99 {metrics['e2e_p99_us']:>10.1f}us"
+            f"  rss {metrics['peak_rss_kb'] / 1024:>6.1f}MB"
+        )
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "records": args.records,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+    print(f"wrote {args.output}")
+
+
+def compare(args) -> int:
+    """
+    Print per metric change, returns number of regressions over threshold
+    """
+    with open(args.base) as base_file, open(args.new) as new_file:
+        base = {r["name"]: r["metrics"] for r in json.load(base_file)["results"]}
+        new = {r["name"]: r["metrics"] for r in json.load(new_file)["results"]}
+
+    regressions = 0
+    metrics = args.metric or list(METRICS)
+    for name in sorted(base.keys() & new.keys()):
+        for metric in metrics:
+            higher_is_better = METRICS[metric]
+            before, after = base[name][metric], new[name][metric]
+            if not before:
+                continue
+            change = (after - before) / before * 100
+            worse = -change if higher_is_better else change
+            if worse > args.threshold:
+                regressions += 1
+                print(f"REGRESSION {name} {metric}: {before:.1f} -> {after:.1f} ({change:+.1f}%)")
+
+    print(f"{regressions} regression(s) over {args.threshold}%")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the suite")
+    run_parser.add_argument("--records", type=int, default=100_000)
+    run_parser.add_argument("--output", default="bench_results.json")
+    run_parser.add_argument("--filter", help="only run cases whose name contains this")
+
+    compare_parser = commands.add_parser("compare", help="diff two result files")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="percent")
+    compare_parser.add_argument(
+        "--metric",
+        action="append",
+        choices=list(METRICS),
+        help="metric to check, repeat for several, defaults to all",
+    )
+
+    case_parser = commands.add_parser("case", help=argparse.SUPPRESS)
+    case_parser.add_argument("params")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run_suite(args)
+    elif args.command == "compare":
+        sys.exit(1 if compare(args) else 0)
+    else:
+        print(json.dumps(run_case(json.loads(args.params))))
+
+
+if __name__ == "__main__":
+    main()
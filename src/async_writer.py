@@ -1,28 +1,179 @@
 from threading import Thread
 from queue import Queue, Empty
-from crimson_logger.src.crimson_writer import CrimsonWriter, CrimsonSink
+from crimson_logger.src.crimson_writer import CrimsonWriter, CrimsonSink, FlushRequest
+from crimson_logger.src.spill_queue import SpillQueue
+import time
+
+
+_STOP = object()
+
+
+def _approx_size(message) -> int:
+    # deferred formatting queues LogRecords, their text is not rendered yet
+    return len(message) if isinstance(message, str) else len(message.message)
 
 
 class AsyncWriter(CrimsonWriter, Thread):
-    def __init__(self):
+    """
+    Writes logs to sink on a background thread
+
+    The thread blocks on the queue while idle, stop() queues a sentinel
+    behind the records so it exits right after writing them. flush() queues
+    a FlushRequest the same way.
+
+    With batch_size > 0 the writer drains up to batch_size messages (or
+    batch_bytes worth) per wakeup, hands them to sink.write_batch and
+    flushes the sink by policy: every flush_records records, every
+    flush_bytes bytes or every flush_interval_ms milliseconds, whichever
+    comes first. With no flush policy set, the sink is flushed after every batch.
+
+    The queue is unbounded unless spool_dir is set, then at most
+    queue_capacity records are held in memory and the rest is spooled to
+    disk until the sink catches up, see spill_queue.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 0,
+        batch_bytes: int = 1_048_576,
+        flush_records: int = 0,
+        flush_bytes: int = 0,
+        flush_interval_ms: int = 0,
+        queue_capacity: int = 10_000,
+        spool_dir: str = "",
+    ):
         super().__init__(daemon=True)
-        self._queue = Queue()
-        self._active = True
+        self.spool = SpillQueue(queue_capacity, spool_dir) if spool_dir else None
+        self._queue = self.spool or Queue()
+        self._stopped = False
+        self._batch_size = batch_size
+        self._batch_bytes = batch_bytes
+        self._flush_records = flush_records
+        self._flush_bytes = flush_bytes
+        self._flush_interval = flush_interval_ms / 1000
 
     def set_sink(self, sink: CrimsonSink):
         self._sink = sink
         return self
 
     def run(self) -> None:
-        while self._active or not self._queue.empty():
+        try:
+            if self._batch_size > 0:
+                self._run_batched()
+            else:
+                self._run_single()
+        finally:
+            if self.spool:
+                self.spool.close()
+
+    def _run_single(self) -> None:
+        while True:
+            log = self._queue.get()
+            if log is _STOP:
+                break
+            if type(log) is FlushRequest:
+                self._sink.flush()
+                log.done.set()
+                continue
+
+            if self._metrics:
+                self._metrics.observe_queue_depth(self._queue.qsize() + 1)
+            self._sink.write(log)
+
+    def _run_batched(self) -> None:
+        pending_records = 0
+        pending_bytes = 0
+        last_flush = time.monotonic()
+
+        while True:
+            timeout = None
+            if self._flush_interval and pending_records:
+                timeout = max(0, last_flush + self._flush_interval - time.monotonic())
+
             try:
-                log = self._queue.get(timeout=1)
-                self._sink.write(log)
+                log = self._queue.get(timeout=timeout)
             except Empty:
+                # flush interval elapsed, don't leave records sitting in buffers
+                self._sink.flush()
+                pending_records = pending_bytes = 0
+                last_flush = time.monotonic()
                 continue
 
+            batch = []
+            batch_bytes = 0
+            control = None
+            while True:
+                if log is _STOP or type(log) is FlushRequest:
+                    control = log
+                    break
+                batch.append(log)
+                batch_bytes += _approx_size(log) + 1
+                if len(batch) >= self._batch_size or batch_bytes >= self._batch_bytes:
+                    break
+                try:
+                    log = self._queue.get_nowait()
+                except Empty:
+                    break
+
+            if batch:
+                if self._metrics:
+                    self._metrics.observe_queue_depth(self._queue.qsize() + len(batch))
+                self._sink.write_batch(batch)
+                pending_records += len(batch)
+                pending_bytes += batch_bytes
+
+                if self._should_flush(pending_records, pending_bytes, last_flush):
+                    self._sink.flush()
+                    pending_records = pending_bytes = 0
+                    last_flush = time.monotonic()
+
+            if control is _STOP:
+                break
+            if control is not None:
+                self._sink.flush()
+                pending_records = pending_bytes = 0
+                last_flush = time.monotonic()
+                control.done.set()
+
+        self._sink.flush()
+
+    def _should_flush(
+        self, pending_records: int, pending_bytes: int, last_flush: float
+    ) -> bool:
+        if not (self._flush_records or self._flush_bytes or self._flush_interval):
+            return True
+
+        return bool(
+            (self._flush_records and pending_records >= self._flush_records)
+            or (self._flush_bytes and pending_bytes >= self._flush_bytes)
+            or (
+                self._flush_interval
+                and time.monotonic() - last_flush >= self._flush_interval
+            )
+        )
+
     def write_to_sink(self, message: str) -> None:
         self._queue.put(message)
 
+    def flush(self, timeout: float = None) -> bool:
+        if self._stopped or not self.is_alive():
+            return self._queue.empty()
+
+        request = FlushRequest()
+        self._queue.put(request)
+        return request.done.wait(timeout)
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def dropped_records(self) -> int:
+        """
+        Records lost because the spool could not be written or read
+        """
+        return self.spool.dropped if self.spool else 0
+
     def stop(self):
-        self._active = False
+        if not self._stopped:
+            self._stopped = True
+            self._queue.put(_STOP)
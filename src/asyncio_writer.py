@@ -0,0 +1,170 @@
+from crimson_logger.src.crimson_writer import CrimsonWriter, CrimsonSink
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from collections import deque
+import asyncio
+
+
+class AsyncioWriter(CrimsonWriter):
+    """
+    Writer for asyncio applications, logging never blocks the event loop
+
+    write_to_sink only appends to a buffer, a task on the running loop
+    drains it in batches of batch_size and writes them to the sink on a
+    dedicated single thread executor. The task is started on the first
+    log call made inside a running loop.
+
+    Use `await aflush()` / `await aclose()` from coroutines,
+    stop() / join() drain what is left once the loop is gone
+    """
+
+    def __init__(self, batch_size: int = 512):
+        super().__init__()
+        self._batch_size = batch_size
+        self._buffer = deque()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="CrimsonAsyncioWriter"
+        )
+        self._loop = None
+        self._task = None
+        self._wakeup = None
+        self._write_lock = None
+        self._wakeup_pending = False
+        self._closed = False
+
+    def set_sink(self, sink: CrimsonSink):
+        self._sink = sink
+        return self
+
+    def write_to_sink(self, message: str) -> None:
+        self._buffer.append(message)
+        # one wakeup per drain cycle, not per record
+        if not self._wakeup_pending:
+            self._wakeup_pending = True
+            self._schedule_wakeup()
+
+    def _schedule_wakeup(self) -> None:
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+                return
+            except RuntimeError:
+                # loop the task was bound to has been closed
+                self._loop = None
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # no loop yet, records wait in buffer until one logs or aflush
+            self._wakeup_pending = False
+            return
+
+        self._start(loop)
+        self._wakeup.set()
+
+    def _start(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+        self._task = loop.create_task(self._drain())
+
+    def _take_batch(self) -> list[str]:
+        buffer = self._buffer
+        return [buffer.popleft() for _ in range(min(len(buffer), self._batch_size))]
+
+    async def _write_buffered(self) -> None:
+        async with self._write_lock:
+            if self._metrics:
+                self._metrics.observe_queue_depth(len(self._buffer))
+            while self._buffer:
+                batch = self._take_batch()
+                await self._loop.run_in_executor(
+                    self._executor, self._sink.write_batch, batch
+                )
+
+    async def _drain(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            self._wakeup_pending = False
+            await self._write_buffered()
+
+    async def aflush(self) -> None:
+        """
+        Wait until every record logged before the call is written and flushed
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._start(loop)
+
+        await self._write_buffered()
+        await loop.run_in_executor(self._executor, self._sink.flush)
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Blocking flush for threads other than the loop's, await aflush()
+        on the loop itself. Without a loop buffered records are written
+        on the executor.
+
+        Raises:
+            RuntimeError: if called from the loop's thread, waiting there
+                would deadlock the loop
+        """
+        if self._closed:
+            return not self._buffer
+
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            while self._buffer:
+                self._executor.submit(self._sink.write_batch, self._take_batch())
+            done = self._executor.submit(self._sink.flush)
+            try:
+                done.result(timeout)
+            except FutureTimeoutError:
+                return False
+            return True
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            raise RuntimeError("flush() would block the event loop, use await aflush()")
+
+        done = asyncio.run_coroutine_threadsafe(self.aflush(), loop)
+        try:
+            done.result(timeout)
+        except FutureTimeoutError:
+            return False
+        return True
+
+    async def aclose(self) -> None:
+        """
+        Flush and stop drain task
+        """
+        await self.aflush()
+        self.stop()
+        self._closed = True
+        self._executor.shutdown(wait=False)
+
+    def queue_depth(self) -> int:
+        return len(self._buffer)
+
+    def stop(self):
+        self._loop = None
+        if self._task and not self._task.done():
+            try:
+                self._task.cancel()
+            except RuntimeError:
+                # loop already closed
+                pass
+
+    def join(self):
+        if self._closed:
+            return
+
+        self._closed = True
+        # executor keeps FIFO order with batches the task already submitted
+        while self._buffer:
+            self._executor.submit(self._sink.write_batch, self._take_batch())
+        self._executor.submit(self._sink.flush)
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,115 @@
+"""
+Binary log file layout
+
+    header: MAGIC (4 bytes) + VERSION (1 byte)
+    entries: <I payload length> + payload
+
+payload starts with an entry type byte:
+    NAMESPACE_ENTRY: <H namespace id> + utf-8 namespace
+    RECORD_ENTRY:    <B level code> <H namespace id> <q timestamp ns> + utf-8 message
+
+Namespace ids are assigned per file, a namespace entry is written before
+the first record that uses it. Levels use the fixed LEVEL_CODES table.
+"""
+
+from crimson_logger.src.log_record import LogRecord
+import struct
+
+MAGIC = b"CRLG"
+VERSION = 1
+HEADER = MAGIC + bytes([VERSION])
+
+NAMESPACE_ENTRY = 1
+RECORD_ENTRY = 2
+
+LEVEL_CODES = ("DEBUG", "INFO", "WARN", "ERROR", "FATAL")
+_LEVEL_TO_CODE = {level: code for code, level in enumerate(LEVEL_CODES)}
+
+_LENGTH = struct.Struct("<I")
+_NAMESPACE = struct.Struct("<IBH")
+_RECORD = struct.Struct("<IBBHq")
+
+
+class BinaryRecordEncoder:
+    """
+    Encode LogRecords into the binary layout, keeps per-file namespace ids
+    Call reset() whenever a new file is started
+    """
+
+    def __init__(self) -> None:
+        self._namespace_ids = {}
+
+    def reset(self) -> None:
+        self._namespace_ids = {}
+
+    def encode(self, record: LogRecord) -> bytes:
+        namespace_id = self._namespace_ids.get(record.namespace)
+        definition = b""
+
+        if namespace_id is None:
+            namespace_id = len(self._namespace_ids)
+            self._namespace_ids[record.namespace] = namespace_id
+            name = record.namespace.encode("utf-8")
+            definition = (
+                _NAMESPACE.pack(len(name) + 3, NAMESPACE_ENTRY, namespace_id) + name
+            )
+
+        message = record.get_message().encode("utf-8")
+        return (
+            definition
+            + _RECORD.pack(
+                len(message) + 12,
+                RECORD_ENTRY,
+                _LEVEL_TO_CODE[record.level],
+                namespace_id,
+                record.timestamp_ns,
+            )
+            + message
+        )
+
+
+def iter_records(stream, namespaces: dict[int, str] = None):
+    """
+    Decode LogRecords from a binary log stream (file or gzip file object)
+
+    Args:
+        stream: binary stream at start of file, or at an entry boundary
+            when namespaces is given
+        namespaces (dict[int, str]): namespace ids defined before the
+            current position, from the file's sidecar index
+
+    Raises:
+        ValueError: if stream is not a crimson binary log
+    """
+    if namespaces is None:
+        header = stream.read(len(HEADER))
+        if header[: len(MAGIC)] != MAGIC:
+            raise ValueError("Not a crimson binary log file")
+        namespaces = {}
+
+    read = stream.read
+    while True:
+        length_bytes = read(_LENGTH.size)
+        if len(length_bytes) < _LENGTH.size:
+            return
+
+        (length,) = _LENGTH.unpack(length_bytes)
+        payload = read(length)
+        if len(payload) < length:
+            # torn write at end of file
+            return
+
+        if payload[0] == NAMESPACE_ENTRY:
+            (namespace_id,) = struct.unpack_from("<H", payload, 1)
+            namespaces[namespace_id] = payload[3:].decode("utf-8")
+
+        elif payload[0] == RECORD_ENTRY:
+            level_code, namespace_id, timestamp_ns = struct.unpack_from(
+                "<BHq", payload, 1
+            )
+            yield LogRecord(
+                LEVEL_CODES[level_code],
+                timestamp_ns,
+                namespaces[namespace_id],
+                payload[12:].decode("utf-8"),
+            )
@@ -0,0 +1,92 @@
+"""
+Block compressed archives
+
+Archive is a sequence of independent gzip members, one per `block_size`
+bytes of the rotated file, so any gzip tool reads it as one stream.
+The block table maps uncompressed offsets to compressed offsets and is
+stored next to the archive as `<file>.N.blocks`, letting readers seek to
+a block and decompress only from there.
+"""
+
+import bisect
+import gzip
+import json
+
+
+def blocks_path(archive_base: str) -> str:
+    return f"{archive_base}.blocks"
+
+
+def write_block_archive(src_path: str, dst_path: str, block_size: int) -> list:
+    """Compress src_path into dst_path as one gzip member per block
+
+    Returns:
+        block table, [uncompressed offset, compressed offset] per block
+    """
+    table = []
+    uncompressed_offset = 0
+    compressed_offset = 0
+
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        while True:
+            block = src.read(block_size)
+            if not block:
+                break
+            member = gzip.compress(block, mtime=0)
+            dst.write(member)
+            table.append([uncompressed_offset, compressed_offset])
+            uncompressed_offset += len(block)
+            compressed_offset += len(member)
+
+    return table
+
+
+def write_block_table(archive_base: str, block_size: int, table: list) -> None:
+    with open(blocks_path(archive_base), "w") as table_file:
+        json.dump({"block_size": block_size, "blocks": table}, table_file)
+
+
+def load_block_table(archive_base: str):
+    """
+    Block table of an archive, None for single stream archives
+    """
+    try:
+        with open(blocks_path(archive_base), "r") as table_file:
+            return json.load(table_file)["blocks"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+class _BlockArchiveFile(gzip.GzipFile):
+    """
+    GzipFile starting at a member boundary inside the archive, owns the raw file
+    """
+
+    def __init__(self, archive: str, compressed_offset: int) -> None:
+        raw = open(archive, "rb")
+        raw.seek(compressed_offset)
+        super().__init__(fileobj=raw, mode="rb")
+        self._raw = raw
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._raw.close()
+
+
+def open_at(archive: str, table: list, offset: int) -> gzip.GzipFile:
+    """Open block archive positioned at an uncompressed offset,
+    only the block holding the offset and later ones are decompressed
+
+    Args:
+        archive (str): path to .gz block archive
+        table (list): block table from load_block_table
+        offset (int): uncompressed offset to start reading at
+    """
+    position = bisect.bisect_right([start for start, _ in table], offset) - 1
+    block_start, compressed_offset = table[position] if position >= 0 else (0, 0)
+
+    stream = _BlockArchiveFile(archive, compressed_offset)
+    stream.seek(offset - block_start)
+    return stream
@@ -0,0 +1,108 @@
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.log_record import interpolate
+import threading
+
+
+class BoundLogger:
+    """
+    Logger bound to one namespace, created by CrimsonLogger.child()
+
+    Shares the parent's writer, sink, formatter and level rules. The
+    `[namespace] LEVEL [` prefix of every level is built once, and the
+    namespace threshold is looked up again only when the parent's rules
+    change (set_level, set_namespace_level, reload), so a plain text log
+    call only renders the timestamp and the message.
+
+    Rate limits / sampling / dedup, deferred formatting and metrics go
+    through the parent's write_log as usual.
+    """
+
+    __slots__ = ("_parent", "_namespace", "_lines", "_level")
+
+    def __init__(self, parent, namespace: str) -> None:
+        self._parent = parent
+        self._namespace = namespace
+        # level -> (ordinal, `[namespace] LEVEL [` prefix)
+        self._lines = {
+            level: (level.ordinal, parent._formatter.line_prefix(level.value, namespace))
+            for level in LogLevel
+        }
+        # (parent thresholds, threshold of namespace), swapped as one
+        self._level = (None, 0)
+
+    @property
+    def namespace(self) -> str:
+        return self._namespace
+
+    def _threshold(self) -> int:
+        thresholds, threshold = self._level
+        current = self._parent._thresholds
+        if thresholds is not current:
+            threshold = current[self._namespace]
+            self._level = (current, threshold)
+        return threshold
+
+    def child(self, suffix: str) -> "BoundLogger":
+        """Logger for `<namespace>.<suffix>`
+
+        Args:
+            suffix (str): dotted name below this logger's namespace
+        """
+        return self._parent.child(f"{self._namespace}.{suffix}")
+
+    def is_enabled_for(self, log_level: LogLevel) -> bool:
+        """Check if a level would be logged for this namespace
+
+        Args:
+            log_level (LogLevel): level to check
+        """
+        return log_level.ordinal >= self._threshold()
+
+    def write_log(self, log_level: LogLevel, content: str, *args):
+        """Writes log to the parent's sink under the bound namespace
+
+        Args:
+            log_level (LogLevel): Log levels - INFO, DEBUG, WARN, ERROR, FATAL
+            content (str): Log message to be written, or %/{} style template
+            *args: template arguments, only interpolated if log level is enabled
+        """
+        self._log(log_level, content, args)
+
+    def _log(self, log_level: LogLevel, content: str, args: tuple):
+        ordinal, prefix = self._lines[log_level]
+        parent = self._parent
+        if ordinal < self._threshold():
+            if parent._metrics:
+                parent._metrics.record_filtered(log_level.value)
+            return
+
+        if parent._filter or parent._deferred or parent._metrics:
+            parent.write_log(log_level, content, self._namespace, *args)
+            return
+
+        if parent._main_thread and threading.current_thread() is not parent._main_thread:
+            print("[WARN] Logger is configured for SINGLE thread")
+
+        if args:
+            content = interpolate(content, args)
+        parent._writer.write_to_sink(parent._formatter.format_prefixed(prefix, content))
+
+    def debug(self, content: str, *args):
+        """Writes DEBUG log, see write_log"""
+        self._log(LogLevel.DEBUG, content, args)
+
+    def info(self, content: str, *args):
+        """Writes INFO log, see write_log"""
+        self._log(LogLevel.INFO, content, args)
+
+    def warn(self, content: str, *args):
+        """Writes WARN log, see write_log"""
+        self._log(LogLevel.WARN, content, args)
+
+    def error(self, content: str, *args):
+        """Writes ERROR log, see write_log"""
+        self._log(LogLevel.ERROR, content, args)
+
+    def fatal(self, content: str, *args):
+        """Writes FATAL log, see write_log"""
+        self._log(LogLevel.FATAL, content, args)
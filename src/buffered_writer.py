@@ -0,0 +1,237 @@
+from threading import Thread, Event, Condition, Lock, current_thread, local
+from collections import deque
+from itertools import count
+import heapq
+from crimson_logger.src.crimson_writer import CrimsonWriter, CrimsonSink
+from crimson_logger.src.overflow_policy import OverflowPolicy
+
+
+class _ThreadBuffer:
+    """
+    Buffer owned by one producing thread, drained by the consolidator
+    """
+
+    __slots__ = ("records", "not_full", "dropped", "thread")
+
+    def __init__(self) -> None:
+        self.records = deque()
+        self.not_full = Condition(Lock())
+        self.dropped = 0  # only incremented by owning thread
+        self.thread = current_thread()
+
+
+class BufferedWriter(CrimsonWriter, Thread):
+    """
+    Writer for thread_model MULTI without a global lock or queue
+
+    Every producing thread appends (sequence, message) to its own buffer,
+    a consolidator thread periodically drains all buffers, merges them in
+    sequence order and writes the result to sink as one batch.
+
+    Order is guaranteed per thread only. The merge orders the records of
+    one drain cycle, a record that reaches its buffer after a cycle took
+    that buffer is written in a later batch, after records with a higher
+    sequence number from other threads.
+
+    On stop() producers are fenced before the final drain, a record
+    appended after it is drained by the producing thread itself. Once the
+    final drain is done the sink may be closed, later records are
+    counted as dropped.
+
+    When a thread's buffer holds `capacity` records, overflow_policy decides:
+        BLOCK - wait for consolidator to drain it
+        DROP_NEWEST - discard the incoming record
+        DROP_OLDEST - discard the oldest buffered record
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10_000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        drain_interval_ms: int = 10,
+    ):
+        super().__init__(daemon=True)
+        self._capacity = capacity
+        self._overflow_policy = overflow_policy
+        self._drain_interval = drain_interval_ms / 1000
+        self._sequence = count()
+        self._local = local()
+        self._buffers = []
+        self._buffers_lock = Lock()  # taken once per thread on registration
+        self._retired_drops = 0
+        self._wakeup = Event()
+        self._active = True
+        self._fenced = False  # set before the final drain
+        self._drain_lock = Lock()  # final drain vs producers' late drains
+        # drain cycles started / finished, flush() waits for one started after it
+        self._cycles = Condition(Lock())
+        self._cycles_started = 0
+        self._cycles_done = 0
+        self._finished = False
+
+    def set_sink(self, sink: CrimsonSink):
+        self._sink = sink
+        return self
+
+    def _register_buffer(self) -> _ThreadBuffer:
+        buffer = _ThreadBuffer()
+        self._local.buffer = buffer
+        with self._buffers_lock:
+            self._buffers.append(buffer)
+        return buffer
+
+    def write_to_sink(self, message: str) -> None:
+        try:
+            buffer = self._local.buffer
+        except AttributeError:
+            buffer = self._register_buffer()
+
+        records = buffer.records
+        if len(records) >= self._capacity:
+            if self._overflow_policy == OverflowPolicy.DROP_NEWEST:
+                buffer.dropped += 1
+                return
+
+            if self._overflow_policy == OverflowPolicy.DROP_OLDEST:
+                try:
+                    records.popleft()
+                    buffer.dropped += 1
+                except IndexError:
+                    # consolidator drained it in the meantime
+                    pass
+
+            else:
+                self._wakeup.set()
+                with buffer.not_full:
+                    while len(records) >= self._capacity and self._active:
+                        buffer.not_full.wait(self._drain_interval)
+
+        records.append((next(self._sequence), message))
+        if self._fenced:
+            # final drain may have missed this record
+            self._drain_late(buffer)
+
+    def _drain_late(self, buffer: _ThreadBuffer) -> None:
+        with self._drain_lock:
+            if not self._finished:
+                if self._drain():
+                    self._sink.flush()
+                return
+
+            # writer is done, sink may be closed already
+            records = buffer.records
+            while records:
+                try:
+                    records.popleft()
+                except IndexError:
+                    break
+                buffer.dropped += 1
+
+    @property
+    def dropped_records(self) -> int:
+        """
+        Total records dropped by overflow policy across all threads
+        """
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+        return self._retired_drops + sum(buffer.dropped for buffer in buffers)
+
+    def drop_counts(self) -> dict[str, int]:
+        """
+        Records dropped per live producing thread, keyed by thread name
+        """
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+        return {buffer.thread.name: buffer.dropped for buffer in buffers}
+
+    def queue_depth(self) -> int:
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+        return sum(len(buffer.records) for buffer in buffers)
+
+    def run(self) -> None:
+        while self._active:
+            self._wakeup.wait(self._drain_interval)
+            self._wakeup.clear()
+            self._drain_cycle()
+
+        self._fenced = True
+        with self._drain_lock:
+            self._drain_cycle()
+            self._sink.flush()
+            with self._cycles:
+                self._finished = True
+                self._cycles.notify_all()
+
+    def _drain_cycle(self) -> None:
+        with self._cycles:
+            self._cycles_started += 1
+            cycle = self._cycles_started
+
+        if self._drain():
+            self._sink.flush()
+
+        with self._cycles:
+            self._cycles_done = cycle
+            self._cycles.notify_all()
+
+    def _drain(self) -> bool:
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+
+        drained = []
+        for buffer in buffers:
+            records = buffer.records
+            # only take what is there now, producer keeps appending meanwhile
+            chunk = []
+            try:
+                for _ in range(len(records)):
+                    chunk.append(records.popleft())
+            except IndexError:
+                # DROP_OLDEST producer popped concurrently
+                pass
+            if chunk:
+                drained.append(chunk)
+
+            if self._overflow_policy == OverflowPolicy.BLOCK and chunk:
+                with buffer.not_full:
+                    buffer.not_full.notify_all()
+
+            if not buffer.thread.is_alive() and not records:
+                self._retire(buffer)
+
+        if not drained:
+            return False
+
+        if self._metrics:
+            self._metrics.observe_queue_depth(sum(len(chunk) for chunk in drained))
+
+        if len(drained) == 1:
+            batch = [message for _, message in drained[0]]
+        else:
+            batch = [message for _, message in heapq.merge(*drained)]
+
+        self._sink.write_batch(batch)
+        return True
+
+    def _retire(self, buffer: _ThreadBuffer) -> None:
+        with self._buffers_lock:
+            self._buffers.remove(buffer)
+            self._retired_drops += buffer.dropped
+
+    def flush(self, timeout: float = None) -> bool:
+        with self._cycles:
+            if self._finished or not self.is_alive():
+                return not self.queue_depth()
+
+            target = self._cycles_started + 1
+            self._wakeup.set()
+            if not self._cycles.wait_for(
+                lambda: self._cycles_done >= target or self._finished, timeout
+            ):
+                return False
+            return self._cycles_done >= target or not self.queue_depth()
+
+    def stop(self):
+        self._active = False
+        self._wakeup.set()
@@ -37,6 +37,9 @@ class CrimsonConfigParser:
                                 "sink_type",
                                 "thread_model",
                                 "write_mode",
+                                "overflow_policy",
+                                "file_format",
+                                "network_protocol",
                             ]:
                                 config[key] = val.upper()
                             else:
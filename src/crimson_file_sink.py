@@ -1,15 +1,39 @@
+from typing import Union
 from crimson_logger.src.crimson_log_config import CrimsonLogConfig
 from crimson_logger.src.crimson_sink import CrimsonSink
 import os
+import time
 import shutil
 import gzip
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore
 from crimson_logger.src.config_exception import ConfigException
+from crimson_logger.src.file_format import FileFormat
+from crimson_logger.src.binary_record_codec import BinaryRecordEncoder, HEADER
+from crimson_logger.src.log_record import LogRecord
+from crimson_logger.src.crimson_formatter import Formatter
+from crimson_logger.src.crimson_log_index import ArchiveIndexBuilder, write_index
+from crimson_logger.src.block_archive import write_block_archive, write_block_table
+
+
+_NEWLINE = b"\n"
 
 
 class CrimsonFileSink(CrimsonSink):
     """
     Write log to file
     - Can chain calls with instantiation
+    - Rotation renames the active file and reopens it, compression of the
+      rotated file to .N.gz runs on a background thread
+    - file_format BINARY writes LogRecords in the binary layout from
+      binary_record_codec, decode with crimson_log_decoder
+    - archive_index writes a `<file>.N.idx` sidecar next to every archive
+      for crimson_log_reader to skip archives and seek into them
+    - archive_block_size compresses archives as independent gzip members
+      with a `<file>.N.blocks` offset table, see block_archive
+    - bytes_io opens the text log unbuffered in binary mode and hands every
+      batch to the OS in one os.writev, skipping the `+ "\n"` copy, the text
+      layer's encode and the copy into its buffer
     """
 
     def __init__(self) -> None:
@@ -17,8 +41,21 @@ class CrimsonFileSink(CrimsonSink):
         self._type = "FILE"
         self._file_path = None
         self._max_file_size = 1_000_000  # (1MB)
+        self._config_max_file_size = None  # last seen config value
         self._file = None
         self._is_valid = False
+        self._size = 0  # bytes in active file, avoids a stat per write
+        self._archive_index = 0  # last used archive sequence number
+        self._compressor = None
+        self._pending_compressions = None
+        self._encoder = None  # set for BINARY file format
+        self._index = None  # set when archive_index is enabled
+        self._block_size = 0  # 0 keeps single stream archives
+        self._bytes_io = False
+
+    @property
+    def accepts_records(self) -> bool:
+        return self._encoder is not None
 
     def configure(self, config: CrimsonLogConfig, max_file_size: int = None):
         """
@@ -26,7 +63,7 @@ class CrimsonFileSink(CrimsonSink):
 
         Args:
             config (CrimsonLogConfig): Pass config object to configure file path
-            [optional] max_file_size: Set rotation file size
+            [optional] max_file_size: Set rotation file size, overrides config max_file_size
 
         Returns:
             instance of class
@@ -37,35 +74,167 @@ class CrimsonFileSink(CrimsonSink):
         dir_path = dir_path = os.path.dirname(self._file_path)
         os.makedirs(dir_path, exist_ok=True)
 
-        self._file = open(self._file_path, "a")
+        self._max_file_size = max_file_size or config.max_file_size
+        self._config_max_file_size = config.max_file_size
+
+        if config.file_format == FileFormat.BINARY:
+            self._encoder = BinaryRecordEncoder()
+
+        self._block_size = config.archive_block_size
+
+        # BINARY format already writes bytes
+        self._bytes_io = config.bytes_io and not self._encoder
 
-        if max_file_size:
-            self._max_file_size = max_file_size
+        self._open_file()
+
+        if config.archive_index:
+            self._index = ArchiveIndexBuilder(
+                interval=config.index_interval,
+                formatter=Formatter().configure(config),
+            )
+            # content from before this process can't be indexed
+            self._index.reset(partial=self._size > self._empty_size())
+
+        self._compressor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="CrimsonFileSinkCompressor"
+        )
+        self._pending_compressions = BoundedSemaphore(
+            max(1, config.max_pending_compressions)
+        )
+        self._scan_archives()
 
         return self
 
+    def reconfigure(self, config: CrimsonLogConfig):
+        """
+        Apply new rotation size, takes effect on the next write
+        A max_file_size passed to configure() is kept until the config's value changes
+        """
+        if config.max_file_size != self._config_max_file_size:
+            self._config_max_file_size = config.max_file_size
+            self._max_file_size = config.max_file_size
+
+    def _scan_archives(self):
+        """
+        Seed archive sequence number from files on disk, runs once at configure
+        Rotated files left uncompressed by a previous run are compressed again
+        """
+
+        dir_path = os.path.dirname(self._file_path) or "."
+        prefix = os.path.basename(self._file_path) + "."
+        uncompressed = []
+
+        for name in os.listdir(dir_path):
+            if not name.startswith(prefix):
+                continue
+
+            suffix = name[len(prefix) :]
+            is_archive = suffix.endswith(".gz")
+            if is_archive:
+                suffix = suffix[: -len(".gz")]
+            if not suffix.isdigit():
+                continue
+
+            self._archive_index = max(self._archive_index, int(suffix))
+            if not is_archive:
+                uncompressed.append(int(suffix))
+
+        for i in sorted(uncompressed):
+            self._compress_in_background(f"{self._file_path}.{i}")
+
     def _rotate(self):
         """
         rotates log file
         """
+        started = time.perf_counter_ns()
+
+        self._close_file()
+
+        self._archive_index += 1
+        rotated_path = f"{self._file_path}.{self._archive_index}"
+        os.replace(self._file_path, rotated_path)
 
+        self._open_file()
+
+        index = None
+        if self._index:
+            index = self._index.snapshot()
+            self._index.reset()
+
+        self._compress_in_background(rotated_path, index)
+
+        if self._metrics:
+            self._metrics.observe_rotation(time.perf_counter_ns() - started)
+
+    def _empty_size(self) -> int:
+        return len(HEADER) if self._encoder else 0
+
+    def _open_file(self):
+        """
+        Open active file for appending and seed its size
+        """
+        if self._encoder:
+            self._file = open(self._file_path, "ab")
+            self._size = os.path.getsize(self._file_path)
+            # namespace ids restart with every file
+            self._encoder.reset()
+            if not self._size:
+                self._file.write(HEADER)
+                self._size = len(HEADER)
+            return
+
+        if self._bytes_io:
+            self._file = open(self._file_path, "ab", buffering=0)
+            self._size = os.path.getsize(self._file_path)
+            return
+
+        self._file = open(self._file_path, "a", encoding="utf-8")
+        self._size = os.path.getsize(self._file_path)
+
+    def _close_file(self):
         self._file.close()
 
-        i = 1
-        while os.path.exists(f"{self._file_path}.{i}.gz"):
-            i += 1
+    def _compress_in_background(self, rotated_path: str, index: dict = None):
+        # blocks only when max_pending_compressions archives are still in flight
+        self._pending_compressions.acquire()
+        try:
+            self._compressor.submit(self._compress, rotated_path, index)
+        except Exception:
+            self._pending_compressions.release()
+            raise
+
+    def _compress(self, rotated_path: str, index: dict = None):
+        try:
+            if self._block_size:
+                table = write_block_archive(
+                    rotated_path, f"{rotated_path}.gz", self._block_size
+                )
+                write_block_table(rotated_path, self._block_size, table)
+            else:
+                with (
+                    open(rotated_path, "rb") as logfile,
+                    gzip.open(f"{rotated_path}.gz", "wb") as compressed_log,
+                ):
+                    shutil.copyfileobj(logfile, compressed_log)
+
+            if index:
+                write_index(rotated_path, index)
+
+            os.remove(rotated_path)
 
-        with (
-            open(self._file_path, "rb") as logfile,
-            gzip.open(f"{self._file_path}.{i}.gz", "wb") as compressed_log,
-        ):
-            shutil.copyfileobj(logfile, compressed_log)
+        except Exception as e:
+            print(f"[Error] Error while compressing {rotated_path}: {e}")
+            self._record_error()
 
-        open(self._file_path, "w").close()
-        self._file = open(self._file_path, "a")
+        finally:
+            self._pending_compressions.release()
 
     def _reached_size_limit(self):
-        return os.path.getsize(self._file_path) > self._max_file_size
+        return self._size > self._max_file_size
+
+    @staticmethod
+    def _encoded_len(data: str) -> int:
+        return len(data) if data.isascii() else len(data.encode("utf-8"))
 
     def _validate_config(self):
         errors = []
@@ -82,12 +251,12 @@ class CrimsonFileSink(CrimsonSink):
         else:
             self._is_valid = True
 
-    def write(self, message: str):
+    def write(self, message: Union[str, LogRecord]):
         """
         Write to file
 
         Args:
-            message (str): formatted message to write to file
+            message (str | LogRecord): formatted message, or record for BINARY format
 
         Raises:
             Exception: in case error while writing to file
@@ -99,8 +268,143 @@ class CrimsonFileSink(CrimsonSink):
             if self._reached_size_limit():
                 self._rotate()
 
-            self._file.write(message + "\n")
-            self._file.flush()
+            if self._encoder:
+                data = self._encoder.encode(message)
+                if self._index:
+                    self._index.add_record(message, self._size)
+                self._file.write(data)
+                self._flush_file()
+                self._size += len(data)
+                self._record_bytes(len(data))
+                return
+
+            if self._index:
+                self._index.add_line(message, self._size)
+
+            if self._bytes_io:
+                self._write_encoded((message,))
+                return
+
+            data = message + "\n"
+            self._file.write(data)
+            self._flush_file()
+            size = self._encoded_len(data)
+            self._size += size
+            self._record_bytes(size)
 
         except Exception as e:
             print(f"[Error] Error while writing to file: {e}")
+            self._record_error()
+
+    def write_batch(self, messages: Union[list[str], list[LogRecord]]):
+        """
+        Write a batch of messages to file as one joined write
+        Does not flush, writer decides when to call flush()
+
+        Args:
+            messages (list[str] | list[LogRecord]): formatted messages, or records for BINARY format
+        """
+        if not self._is_valid:
+            self._validate_config()
+
+        try:
+            if self._reached_size_limit():
+                self._rotate()
+
+            if self._encoder:
+                encode = self._encoder.encode
+                encoded = [encode(record) for record in messages]
+                if self._index:
+                    self._index_records(messages, encoded)
+                data = b"".join(encoded)
+                self._file.write(data)
+                self._size += len(data)
+                self._record_bytes(len(data))
+                return
+
+            if self._index:
+                self._index_lines(messages, self._size)
+
+            if self._bytes_io:
+                self._write_encoded(messages)
+                return
+
+            data = "\n".join(messages) + "\n"
+            self._file.write(data)
+            size = self._encoded_len(data)
+            self._size += size
+            self._record_bytes(size)
+
+        except Exception as e:
+            print(f"[Error] Error while writing to file: {e}")
+            self._record_error()
+
+    def _write_encoded(self, messages):
+        """
+        Encode messages once and hand them to the OS in one writev,
+        the trailing newline is its own iovec instead of a copy of the batch
+        """
+        data = "\n".join(messages).encode("utf-8")
+        total = len(data) + 1
+        fd = self._file.fileno()
+
+        written = os.writev(fd, (data, _NEWLINE))
+        while written < total:
+            # partial write, resume after what the OS took
+            if written < len(data):
+                written += os.writev(fd, (memoryview(data)[written:], _NEWLINE))
+            else:
+                written += os.write(fd, _NEWLINE)
+
+        self._size += total
+        self._record_bytes(total)
+
+    def _index_records(self, records: list[LogRecord], encoded: list[bytes]):
+        offset = self._size
+        for record, data in zip(records, encoded):
+            self._index.add_record(record, offset)
+            offset += len(data)
+
+    def _index_lines(self, messages: list[str], offset: int):
+        for message in messages:
+            self._index.add_line(message, offset)
+            offset += self._encoded_len(message) + 1
+
+    def flush(self):
+        """
+        Flush buffered writes to file
+        """
+        try:
+            self._flush_file()
+
+        except Exception as e:
+            print(f"[Error] Error while flushing file: {e}")
+            self._record_error()
+
+    def _flush_file(self):
+        if not self._metrics:
+            self._file.flush()
+            return
+
+        started = time.perf_counter_ns()
+        self._file.flush()
+        self._metrics.observe_flush(time.perf_counter_ns() - started)
+
+    def _record_bytes(self, count: int):
+        if self._metrics:
+            self._metrics.add_bytes_written(count)
+
+    def _record_error(self):
+        if self._metrics:
+            self._metrics.record_write_error()
+
+    def close(self):
+        """
+        Close file, waits for pending archive compressions
+        """
+        if self._file and not self._file.closed:
+            self.flush()
+            self._close_file()
+
+        if self._compressor:
+            self._compressor.shutdown(wait=True)
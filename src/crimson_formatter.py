@@ -1,15 +1,29 @@
 from datetime import datetime
+import time
 from crimson_logger.src.crimson_log_config import CrimsonLogConfig
 from crimson_logger.src.config_exception import ConfigException
+from crimson_logger.src.log_record import LogRecord
+
+
+_MAX_CACHED_PREFIXES = 4096
 
 
 class Formatter:
     """
     Configure formatter for logger
+
+    Timestamp is rendered with strftime at most once per second and cached,
+    sub-second parts (SSS) are filled in per call. `[namespace] LEVEL [`
+    prefixes are cached per (namespace, level).
+    Caches are swapped by single assignment so concurrent callers are safe,
+    configure() can be called again on a live formatter (logger.reload).
     """
 
     def __init__(self) -> None:
         self._ts_format = None
+        self._ts_parts = None
+        self._ts_cache = (None, None, ())
+        self._prefixes = {}
         self._is_valid = False
         self.replacement_map = {
             "dd": "%d",
@@ -30,6 +44,7 @@ class Formatter:
             hh - hour
             MM - minutes
             ss - seconds
+            SSS - milliseconds
 
         Args:
             config (CrimsonLogConfig): set format from config
@@ -44,9 +59,68 @@ class Formatter:
             formatter = formatter.replace(key, self.replacement_map[key])
 
         self._ts_format = formatter
+        self._is_valid = False
+        # strftime pieces around millisecond slots, rendered once per second,
+        # cache entries rendered from older parts are ignored
+        self._ts_parts = tuple(formatter.split("SSS"))
 
         return self
 
+    def _format_ts(self, timestamp_ns: int) -> str:
+        second, parts, rendered = self._ts_cache
+        current_second = timestamp_ns // 1_000_000_000
+
+        if second != current_second or parts is not self._ts_parts:
+            parts = self._ts_parts
+            local_time = time.localtime(current_second)
+            rendered = tuple(time.strftime(part, local_time) for part in parts)
+            self._ts_cache = (current_second, parts, rendered)
+
+        if len(rendered) == 1:
+            return rendered[0]
+
+        millis = f"{timestamp_ns // 1_000_000 % 1000:03d}"
+        return millis.join(rendered)
+
+    def _prefix(self, log_level: str, namespace: str) -> str:
+        key = (namespace, log_level)
+        prefix = self._prefixes.get(key)
+
+        if prefix is None:
+            prefix = self.line_prefix(log_level, namespace)
+            if len(self._prefixes) >= _MAX_CACHED_PREFIXES:
+                self._prefixes = {}
+            self._prefixes[key] = prefix
+
+        return prefix
+
+    @staticmethod
+    def line_prefix(log_level: str, namespace: str) -> str:
+        """
+        Part of the line before the timestamp, `[namespace] LEVEL [`
+        """
+        return f"[{namespace}] {log_level} ["
+
+    @property
+    def ts_resolution_ns(self) -> int:
+        """
+        Smallest time step the configured format can show
+        """
+        return 1_000_000 if len(self._ts_parts) > 1 else 1_000_000_000
+
+    def parse_ts(self, formatted_ts: str) -> int:
+        """Parse a timestamp rendered by this formatter back to epoch ns,
+        used by readers of text logs
+
+        Args:
+            formatted_ts (str): timestamp as written in the log line
+
+        Raises:
+            ValueError: if text does not match the format
+        """
+        parsed = datetime.strptime(formatted_ts, "%f".join(self._ts_parts))
+        return int(parsed.timestamp()) * 1_000_000_000 + parsed.microsecond * 1000
+
     def _is_valid_strftime_format(self) -> bool:
         try:
             datetime.now().strftime(self._ts_format)
@@ -87,9 +161,50 @@ class Formatter:
             self._validate()
 
         try:
-            formatted_ts = datetime.now().strftime(self._ts_format)
-            log_msg = f"[{namespace}] {log_level} [{formatted_ts}] {message_content}"
+            formatted_ts = self._format_ts(time.time_ns())
+            log_msg = f"{self._prefix(log_level, namespace)}{formatted_ts}] {message_content}"
             return log_msg
 
         except Exception as e:
             print(f"[ERROR] Some error occurred: {e}")
+
+    def format_prefixed(self, prefix: str, message_content: str) -> str:
+        """Get formatted message for a prefix from line_prefix(), used by
+        bound loggers that keep their prefixes
+
+        Args:
+            prefix (str): `[namespace] LEVEL [` part of the line
+            message_content (str): log message
+
+        Raises:
+            Exception: when formatting error occurs
+        """
+        if not self._is_valid:
+            self._validate()
+
+        try:
+            return f"{prefix}{self._format_ts(time.time_ns())}] {message_content}"
+
+        except Exception as e:
+            print(f"[ERROR] Some error occurred: {e}")
+
+    def format_record(self, record: LogRecord) -> str:
+        """Get formatted message for a deferred record, uses the record's timestamp
+        and interpolates template args
+
+        Args:
+            record (LogRecord): record captured by the logger
+
+        Raises:
+            Exception: when formatting error occurs
+        """
+        if not self._is_valid:
+            self._validate()
+
+        try:
+            formatted_ts = self._format_ts(record.timestamp_ns)
+            prefix = self._prefix(record.level, record.namespace)
+            return f"{prefix}{formatted_ts}] {record.get_message()}"
+
+        except Exception as e:
+            print(f"[ERROR] Some error occurred: {e}")
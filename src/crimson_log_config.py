@@ -1,7 +1,13 @@
 from crimson_logger.src.log_level import LogLevel
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from crimson_logger.src.write_mode import WriteMode
 from crimson_logger.src.thread_model import ThreadModel
+from crimson_logger.src.overflow_policy import OverflowPolicy
+from crimson_logger.src.file_format import FileFormat
+from crimson_logger.src.namespace_levels import (
+    parse_namespace_levels,
+    parse_namespace_rules,
+)
 
 
 @dataclass
@@ -14,6 +20,37 @@ class CrimsonLogConfig:
     thread_model: ThreadModel = ThreadModel.SINGLE
     write_mode: WriteMode = WriteMode.SYNC
     file_location: str = "logs/application.log"
+    max_file_size: int = 1_000_000
+    bytes_io: bool = False
+    batch_size: int = 0
+    batch_bytes: int = 1_048_576
+    flush_records: int = 0
+    flush_bytes: int = 0
+    flush_interval_ms: int = 0
+    queue_capacity: int = 10_000
+    spool_dir: str = ""
+    max_pending_compressions: int = 2
+    thread_buffer_capacity: int = 10_000
+    overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK
+    deferred_formatting: bool = False
+    file_format: FileFormat = FileFormat.TEXT
+    archive_index: bool = False
+    index_interval: int = 1000
+    archive_block_size: int = 0
+    enable_metrics: bool = False
+    close_at_exit: bool = False
+    namespace_levels: dict[str, LogLevel] = field(default_factory=dict)
+    rate_limits: dict[str, float] = field(default_factory=dict)
+    rate_limit_burst: int = 0
+    sample_rates: dict[str, float] = field(default_factory=dict)
+    dedup: bool = False
+    dedup_summary_interval_ms: int = 5000
+    network_protocol: str = "TCP"
+    network_buffer_bytes: int = 4_194_304
+    network_timeout_ms: int = 1000
+    network_backoff_max_ms: int = 30_000
+    sqlite_partition_hours: int = 24
+    sqlite_retention_partitions: int = 0
 
     @staticmethod
     def from_dict(cfg: dict[str, str]):
@@ -28,6 +65,38 @@ class CrimsonLogConfig:
             thread_model=ThreadModel(cfg.get("thread_model", "SINGLE")),
             write_mode=WriteMode(cfg.get("write_mode", "SYNC")),
             file_location=cfg.get("file_location", ""),
+            max_file_size=int(cfg.get("max_file_size", 1_000_000)),
+            bytes_io=cfg.get("bytes_io", "false").lower() == "true",
             db_ip_address=cfg.get("db_ip_address"),
             db_port=cfg.get("db_port", ""),
+            batch_size=int(cfg.get("batch_size", 0)),
+            batch_bytes=int(cfg.get("batch_bytes", 1_048_576)),
+            flush_records=int(cfg.get("flush_records", 0)),
+            flush_bytes=int(cfg.get("flush_bytes", 0)),
+            flush_interval_ms=int(cfg.get("flush_interval_ms", 0)),
+            queue_capacity=int(cfg.get("queue_capacity", 10_000)),
+            spool_dir=cfg.get("spool_dir", ""),
+            max_pending_compressions=int(cfg.get("max_pending_compressions", 2)),
+            thread_buffer_capacity=int(cfg.get("thread_buffer_capacity", 10_000)),
+            overflow_policy=OverflowPolicy(cfg.get("overflow_policy", "BLOCK")),
+            deferred_formatting=cfg.get("deferred_formatting", "false").lower()
+            == "true",
+            file_format=FileFormat(cfg.get("file_format", "TEXT")),
+            archive_index=cfg.get("archive_index", "false").lower() == "true",
+            index_interval=int(cfg.get("index_interval", 1000)),
+            archive_block_size=int(cfg.get("archive_block_size", 0)),
+            enable_metrics=cfg.get("enable_metrics", "false").lower() == "true",
+            close_at_exit=cfg.get("close_at_exit", "false").lower() == "true",
+            namespace_levels=parse_namespace_levels(cfg.get("namespace_levels", "")),
+            rate_limits=parse_namespace_rules(cfg.get("rate_limits", ""), float),
+            rate_limit_burst=int(cfg.get("rate_limit_burst", 0)),
+            sample_rates=parse_namespace_rules(cfg.get("sample_rates", ""), float),
+            dedup=cfg.get("dedup", "false").lower() == "true",
+            dedup_summary_interval_ms=int(cfg.get("dedup_summary_interval_ms", 5000)),
+            network_protocol=cfg.get("network_protocol", "TCP"),
+            network_buffer_bytes=int(cfg.get("network_buffer_bytes", 4_194_304)),
+            network_timeout_ms=int(cfg.get("network_timeout_ms", 1000)),
+            network_backoff_max_ms=int(cfg.get("network_backoff_max_ms", 30_000)),
+            sqlite_partition_hours=int(cfg.get("sqlite_partition_hours", 24)),
+            sqlite_retention_partitions=int(cfg.get("sqlite_retention_partitions", 0)),
         )
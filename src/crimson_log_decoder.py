@@ -0,0 +1,49 @@
+"""
+Render binary crimson log files (and their .gz archives) as text
+
+Usage:
+    python -m crimson_logger.src.crimson_log_decoder logs/app.log logs/app.log.1.gz
+"""
+
+from crimson_logger.src.binary_record_codec import iter_records
+from crimson_logger.src.crimson_formatter import Formatter
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.log_level import LogLevel
+import argparse
+import gzip
+import sys
+
+
+def decode_file(path: str, formatter: Formatter, out=None) -> None:
+    # resolved per call, sys.stdout may be replaced after import
+    out = out or sys.stdout
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as stream:
+        for record in iter_records(stream):
+            out.write(formatter.format_record(record) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("files", nargs="+", help="binary log files, oldest first")
+    parser.add_argument(
+        "--ts-format",
+        default="dd-mm-yyyy hh:MM:ss",
+        help="timestamp format, same tokens as ts_format in config",
+    )
+    args = parser.parse_args(argv)
+
+    config = CrimsonLogConfig(
+        ts_format=args.ts_format,
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.DEBUG,
+    )
+    formatter = Formatter().configure(config)
+
+    for path in args.files:
+        decode_file(path, formatter)
+
+
+if __name__ == "__main__":
+    main()
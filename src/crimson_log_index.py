@@ -0,0 +1,134 @@
+from crimson_logger.src.crimson_formatter import Formatter
+from crimson_logger.src.log_record import LogRecord
+import json
+
+
+def split_line(line: str) -> tuple[str, str, str, str]:
+    """
+    Split a text log line `[namespace] LEVEL [ts] message`
+
+    Returns:
+        namespace, level, formatted timestamp, message
+
+    Raises:
+        ValueError: if line is not in the text layout
+    """
+    namespace_end = line.index("] ")
+    level_end = line.index(" [", namespace_end + 2)
+    ts_end = line.index("] ", level_end + 2)
+    return (
+        line[1:namespace_end],
+        line[namespace_end + 2 : level_end],
+        line[level_end + 2 : ts_end],
+        line[ts_end + 2 :],
+    )
+
+
+def index_path(archive_base: str) -> str:
+    """
+    Sidecar index path for archive `<file>.N` / `<file>.N.gz`
+    """
+    return f"{archive_base}.idx"
+
+
+def load_index(archive_base: str):
+    """
+    Load sidecar index of an archive, None if it has none
+    """
+    try:
+        with open(index_path(archive_base), "r") as index_file:
+            return json.load(index_file)
+    except (OSError, ValueError):
+        return None
+
+
+class ArchiveIndexBuilder:
+    """
+    Collects the sidecar index of the active file while the sink writes it
+
+    Index holds min/max timestamp (ns), per level counts, namespaces in
+    order of first appearance and a sparse list of [timestamp, offset]
+    (offset in the uncompressed file) every `interval` records.
+
+    Text lines only have their timestamp parsed for sparse offsets and
+    for the last line, level and namespace are split out of every line.
+    """
+
+    def __init__(self, interval: int = 1000, formatter: Formatter = None) -> None:
+        self._interval = interval
+        self._formatter = formatter
+        self.reset()
+
+    def reset(self, partial: bool = False) -> None:
+        """
+        Start index for a new file, partial if file already had content
+        that was not seen by this builder, partial files get no index
+        """
+        self._partial = partial
+        self._count = 0
+        self._levels = {}
+        self._namespaces = {}
+        self._offsets = []
+        self._min_ts = None
+        self._max_ts = None
+        self._last_ts = None
+
+    def add_record(self, record: LogRecord, offset: int) -> None:
+        ts = record.timestamp_ns
+        self._add(record.level, record.namespace)
+        if self._count % self._interval == 1 or self._interval == 1:
+            self._offsets.append([ts, offset])
+        if self._min_ts is None or ts < self._min_ts:
+            self._min_ts = ts
+        if self._max_ts is None or ts > self._max_ts:
+            self._max_ts = ts
+
+    def add_line(self, line: str, offset: int) -> None:
+        try:
+            namespace, level, formatted_ts, _ = split_line(line)
+        except ValueError:
+            return
+
+        self._add(level, namespace)
+        self._last_ts = formatted_ts
+        if self._count % self._interval == 1 or self._interval == 1:
+            ts = self._formatter.parse_ts(formatted_ts)
+            self._offsets.append([ts, offset])
+            if self._min_ts is None:
+                self._min_ts = ts
+
+    def _add(self, level: str, namespace: str) -> None:
+        self._count += 1
+        self._levels[level] = self._levels.get(level, 0) + 1
+        if namespace not in self._namespaces:
+            self._namespaces[namespace] = len(self._namespaces)
+
+    def snapshot(self):
+        """
+        Index of the file written so far, None if it can't be trusted
+        """
+        if self._partial or not self._count:
+            return None
+
+        max_ts = self._max_ts
+        if self._last_ts is not None:
+            # text timestamps are truncated, cover the whole last step
+            max_ts = (
+                self._formatter.parse_ts(self._last_ts)
+                + self._formatter.ts_resolution_ns
+                - 1
+            )
+
+        return {
+            "records": self._count,
+            "min_ts": self._min_ts,
+            "max_ts": max_ts,
+            "levels": dict(self._levels),
+            "namespaces": list(self._namespaces),
+            "offsets": list(self._offsets),
+        }
+
+
+def write_index(archive_base: str, index: dict) -> None:
+    with open(index_path(archive_base), "w") as index_file:
+        json.dump(index, index_file)
@@ -0,0 +1,258 @@
+"""
+Query active and rotated crimson logs by time range, level and namespace
+
+Usage:
+    python -m crimson_logger.src.crimson_log_reader logs/app.log \\
+        --since 2024-01-02T03:00:00 --until 2024-01-02T04:00:00 \\
+        --level ERROR --level FATAL --namespace payments.*
+"""
+
+from crimson_logger.src.binary_record_codec import iter_records
+from crimson_logger.src.block_archive import load_block_table, open_at
+from crimson_logger.src.crimson_formatter import Formatter
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.crimson_log_index import load_index, split_line
+from crimson_logger.src.file_format import FileFormat
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.log_record import LogRecord
+from datetime import datetime
+import argparse
+import bisect
+import gzip
+import os
+import sys
+
+# records in a file can be slightly out of order (threads racing on a
+# timestamp), keep reading this far past the end of the range
+_ORDER_SLACK_NS = 1_000_000_000
+
+
+class CrimsonLogReader:
+    """
+    Reads `<file>.N.gz` archives oldest first, then the active file
+
+    Archives with a sidecar index (archive_index in config) are skipped
+    without decompressing when their time range, levels or namespaces
+    can't match, and reading starts at the closest sparse offset before
+    the range start. Archives without an index are scanned.
+    Block compressed archives are entered at the block holding that
+    offset, single stream archives are decompressed up to it.
+    """
+
+    def __init__(self, config: CrimsonLogConfig) -> None:
+        self._file_path = config.file_location
+        self._binary = config.file_format == FileFormat.BINARY
+        self._formatter = Formatter().configure(config)
+        self._parsed_ts = {}
+
+    def _files(self) -> list[tuple[str, str]]:
+        """
+        (path to read, archive base for index) oldest first
+        """
+        dir_path = os.path.dirname(self._file_path) or "."
+        prefix = os.path.basename(self._file_path) + "."
+        archives = {}
+
+        for name in os.listdir(dir_path):
+            if not name.startswith(prefix):
+                continue
+            suffix = name[len(prefix) :]
+            compressed = suffix.endswith(".gz")
+            if compressed:
+                suffix = suffix[: -len(".gz")]
+            if not suffix.isdigit():
+                continue
+            # rotated file still being compressed is read as is, .gz may be partial
+            if not compressed or int(suffix) not in archives:
+                archives[int(suffix)] = os.path.join(dir_path, name)
+
+        files = [
+            (archives[i], f"{self._file_path}.{i}") for i in sorted(archives)
+        ]
+        if os.path.exists(self._file_path):
+            files.append((self._file_path, None))
+        return files
+
+    def query(
+        self,
+        start_ns: int = None,
+        end_ns: int = None,
+        levels=None,
+        namespaces=None,
+    ):
+        """Stream matching records in time order
+
+        Args:
+            start_ns (int): inclusive range start, epoch ns
+            end_ns (int): inclusive range end, epoch ns
+            levels (iterable[str | LogLevel]): levels to keep
+            namespaces (iterable[str]): exact names, or `prefix.*` for a subtree
+
+        Yields:
+            LogRecord
+        """
+        levels = {getattr(level, "value", level) for level in levels} if levels else None
+        namespaces = list(namespaces) if namespaces else None
+
+        for path, archive_base in self._files():
+            index = load_index(archive_base) if archive_base else None
+            offset = 0
+
+            if index:
+                if not self._index_may_match(index, start_ns, end_ns, levels, namespaces):
+                    continue
+                offset = self._seek_offset(index, start_ns)
+
+            for record in self._read(path, archive_base, offset, index):
+                if start_ns is not None and record.timestamp_ns < start_ns:
+                    continue
+                if end_ns is not None and record.timestamp_ns > end_ns:
+                    if record.timestamp_ns > end_ns + _ORDER_SLACK_NS:
+                        return
+                    continue
+                if levels and record.level not in levels:
+                    continue
+                if namespaces and not _namespace_matches(record.namespace, namespaces):
+                    continue
+                yield record
+
+    @staticmethod
+    def _index_may_match(index: dict, start_ns, end_ns, levels, namespaces) -> bool:
+        if start_ns is not None and index["max_ts"] < start_ns:
+            return False
+        if end_ns is not None and index["min_ts"] > end_ns:
+            return False
+        if levels and not any(index["levels"].get(level) for level in levels):
+            return False
+        if namespaces and not any(
+            _namespace_matches(name, namespaces) for name in index["namespaces"]
+        ):
+            return False
+        return True
+
+    @staticmethod
+    def _seek_offset(index: dict, start_ns) -> int:
+        if start_ns is None or not index["offsets"]:
+            return 0
+        timestamps = [ts for ts, _ in index["offsets"]]
+        # last sparse entry strictly before start, minus slack for disorder
+        position = bisect.bisect_left(timestamps, start_ns - _ORDER_SLACK_NS) - 1
+        return index["offsets"][position][1] if position >= 0 else 0
+
+    def _open(self, path: str, archive_base: str, offset: int):
+        if not path.endswith(".gz"):
+            stream = open(path, "rb")
+        else:
+            table = load_block_table(archive_base) if offset else None
+            if table:
+                return open_at(path, table, offset)
+            stream = gzip.open(path, "rb")
+
+        stream.seek(offset)
+        return stream
+
+    def _read(self, path: str, archive_base: str, offset: int, index: dict):
+        with self._open(path, archive_base, offset) as stream:
+            if self._binary:
+                if offset:
+                    yield from iter_records(
+                        stream, namespaces=dict(enumerate(index["namespaces"]))
+                    )
+                else:
+                    yield from iter_records(stream)
+            else:
+                yield from self._read_lines(stream)
+
+    def _read_lines(self, stream):
+        record = None
+        for raw in _until_nul(stream):
+            line = raw.decode("utf-8").rstrip("\n")
+            try:
+                namespace, level, formatted_ts, message = split_line(line)
+                ts = self._parse_ts(formatted_ts)
+            except ValueError:
+                # continuation of a multi-line message
+                if record is not None:
+                    record.message += "\n" + line
+                continue
+
+            if record is not None:
+                yield record
+            record = LogRecord(level, ts, namespace, message)
+
+        if record is not None:
+            yield record
+
+    def _parse_ts(self, formatted_ts: str) -> int:
+        ts = self._parsed_ts.get(formatted_ts)
+        if ts is None:
+            if len(self._parsed_ts) > 4096:
+                self._parsed_ts = {}
+            ts = self._parsed_ts[formatted_ts] = self._formatter.parse_ts(formatted_ts)
+        return ts
+
+
+def _until_nul(stream):
+    """
+    Lines of stream up to the first NUL byte, a live MMAP file ends in
+    a zero filled preallocated tail
+    """
+    for raw in stream:
+        nul = raw.find(b"\x00")
+        if nul < 0:
+            yield raw
+            continue
+        if nul:
+            yield raw[:nul]
+        return
+
+
+def _namespace_matches(namespace: str, patterns: list[str]) -> bool:
+    for pattern in patterns:
+        if pattern.endswith(".*"):
+            root = pattern[:-2]
+            if namespace == root or namespace.startswith(root + "."):
+                return True
+        elif namespace == pattern:
+            return True
+    return False
+
+
+def _to_ns(value: str) -> int:
+    return int(datetime.fromisoformat(value).timestamp() * 1_000_000_000)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("file", help="active log file (file_location)")
+    parser.add_argument("--since", help="ISO timestamp, local time")
+    parser.add_argument("--until", help="ISO timestamp, local time")
+    parser.add_argument("--level", action="append", help="repeat for several")
+    parser.add_argument("--namespace", action="append", help="name or prefix.*")
+    parser.add_argument("--ts-format", default="dd-mm-yyyy hh:MM:ss")
+    parser.add_argument("--binary", action="store_true", help="file_format BINARY")
+    args = parser.parse_args(argv)
+
+    config = CrimsonLogConfig(
+        ts_format=args.ts_format,
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.DEBUG,
+        file_location=args.file,
+        file_format=FileFormat.BINARY if args.binary else FileFormat.TEXT,
+    )
+    reader = CrimsonLogReader(config)
+    formatter = Formatter().configure(config)
+
+    records = reader.query(
+        start_ns=_to_ns(args.since) if args.since else None,
+        end_ns=_to_ns(args.until) if args.until else None,
+        levels=[level.upper() for level in args.level] if args.level else None,
+        namespaces=args.namespace,
+    )
+    for record in records:
+        sys.stdout.write(formatter.format_record(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
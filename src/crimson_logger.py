@@ -1,3 +1,4 @@
+from typing import Optional, Union
 from crimson_logger.src.crimson_log_config import CrimsonLogConfig
 from crimson_logger.src.crimson_config_parser import CrimsonConfigParser
 from crimson_logger.src.crimson_writer import CrimsonWriter
@@ -6,38 +7,305 @@ from crimson_logger.src.crimson_formatter import Formatter
 from crimson_logger.src.log_level import LogLevel
 from crimson_logger.src.sync_writer import SyncWriter
 from crimson_logger.src.async_writer import AsyncWriter
+from crimson_logger.src.buffered_writer import BufferedWriter
+from crimson_logger.src.process_writer import ProcessWriter
+from crimson_logger.src.asyncio_writer import AsyncioWriter
+from crimson_logger.src.fan_out_writer import FanOutWriter
+from crimson_logger.src.record_formatting_sink import RecordFormattingSink
+from crimson_logger.src.log_record import LogRecord, interpolate
 from crimson_logger.src.crimson_file_sink import CrimsonFileSink
+from crimson_logger.src.crimson_metrics import CrimsonMetrics
+from crimson_logger.src.namespace_levels import NamespaceThresholds, normalize_prefix
+from crimson_logger.src.record_filter import RecordFilter
+from crimson_logger.src.bound_logger import BoundLogger
+from crimson_logger.src.crimson_mmap_file_sink import CrimsonMmapFileSink
+from crimson_logger.src.crimson_network_sink import CrimsonNetworkSink
+from crimson_logger.src.crimson_sqlite_sink import CrimsonSqliteSink
 from crimson_logger.src.config_exception import ConfigException
 from crimson_logger.src.write_mode import WriteMode
+from crimson_logger.src.overflow_policy import OverflowPolicy
 from crimson_logger.src.thread_model import ThreadModel
+from crimson_logger.src.file_format import FileFormat
+import atexit
+import dataclasses
 import threading
+import asyncio
+import os
+import time
+
+
+# settings baked into the built writer / sink, reload keeps the old values
+_REBUILD_FIELDS = (
+    "sink_type",
+    "write_mode",
+    "thread_model",
+    "file_location",
+    "file_format",
+    "bytes_io",
+    "db_ip_address",
+    "db_port",
+    "deferred_formatting",
+    "enable_metrics",
+    "close_at_exit",
+    "batch_size",
+    "batch_bytes",
+    "flush_records",
+    "flush_bytes",
+    "flush_interval_ms",
+    "queue_capacity",
+    "spool_dir",
+    "thread_buffer_capacity",
+    "overflow_policy",
+    "max_pending_compressions",
+    "archive_index",
+    "index_interval",
+    "archive_block_size",
+    "network_protocol",
+    "sqlite_partition_hours",
+)
+
+
+def _disabled(content: str, namespace: str, *args):
+    """
+    Bound in place of level methods below the logger's threshold
+    """
+    return None
 
 
 class CrimsonLogger:
     """
     Logger Class
+
+    Level methods below the configured log level are replaced by a no-op
+    on the instance, so disabled calls cost a single function call.
+    With enable_metrics the no-op also counts the filtered record.
+
+    namespace_levels rules override the level per namespace prefix, then
+    only methods below every rule's level are no-ops and the rest check
+    a per namespace threshold cache.
+
+    rate_limits / sample_rates / dedup add a RecordFilter stage after the
+    level check, see record_filter.
+
+    reload() applies a changed config while queued records stay in the
+    writer. State read on the hot path is replaced by single attribute
+    assignments, so log calls never take a lock to read the config.
     """
 
     def __init__(
-        self, config: CrimsonLogConfig, writer: CrimsonWriter, formatter: Formatter
+        self,
+        config: CrimsonLogConfig,
+        writer: CrimsonWriter,
+        formatter: Formatter,
+        sink: CrimsonSink = None,
+        metrics: CrimsonMetrics = None,
     ):
         self._config = config
         self._writer = writer
         self._formatter = formatter
-        self._log_level = config.log_level
+        self._sink = sink
+        self._metrics = metrics
+        self._filter = (
+            RecordFilter(config, emit=self._emit)
+            if RecordFilter.is_configured(config)
+            else None
+        )
+        # sinks that encode records themselves get LogRecords, not text
+        self._deferred = (
+            config.deferred_formatting
+            or getattr(sink, "accepts_records", False)
+            or getattr(writer, "accepts_records", False)
+        )
         self._main_thread = (
             threading.current_thread()
             if self._config.thread_model == ThreadModel.SINGLE
             else None
         )
+        self._watcher = None
+        self._closed = False
+        self._apply_levels(self._thresholds_for(config.log_level, config.namespace_levels))
+        if config.close_at_exit:
+            atexit.register(self.close)
+
+    def _thresholds_for(
+        self, log_level: LogLevel, rules: dict[str, LogLevel]
+    ) -> NamespaceThresholds:
+        """
+        Thresholds checked by log calls. A FanOutWriter gets the configured
+        levels for its main sink, log calls then pass down to the lowest
+        level of its other sinks, which filter for themselves.
+        """
+        thresholds = NamespaceThresholds(log_level, rules)
+        if not hasattr(self._writer, "set_thresholds"):
+            return thresholds
+
+        self._writer.set_thresholds(thresholds)
+        return NamespaceThresholds(log_level, rules, widen_to=self._writer.min_level)
+
+    def reload(self, config: CrimsonLogConfig):
+        """Apply a changed config to the running logger without rebuilding it
+        Levels, namespace rules, ts_format, rate limits / sampling / dedup and
+        sink settings (max_file_size, network buffer / timeout / backoff, sqlite
+        retention) are swapped in, records already queued in the writer are
+        kept. Settings in _REBUILD_FIELDS (sink type, write mode, batching,
+        queue sizes ...) need a new logger, they are ignored with a warning.
+        Sinks added with their own config keep it
+
+        Args:
+            config (CrimsonLogConfig): new config
+
+        Raises:
+            ConfigException: if ts_format is invalid, nothing is changed then
+        """
+        Formatter().configure(config)._validate()
+
+        kept = {}
+        for name in _REBUILD_FIELDS:
+            if getattr(config, name) != getattr(self._config, name):
+                print(f"[WARN] Changing {name} needs a rebuilt logger, ignored on reload")
+                kept[name] = getattr(self._config, name)
+        if kept:
+            config = dataclasses.replace(config, **kept)
+
+        self._formatter.configure(config)
+
+        if hasattr(self._writer, "reconfigure"):
+            self._writer.reconfigure(config)
+        elif self._sink:
+            self._sink.reconfigure(config)
+
+        if self._filter:
+            self._filter.flush_summaries()
+        self._filter = (
+            RecordFilter(config, emit=self._emit)
+            if RecordFilter.is_configured(config)
+            else None
+        )
+
+        self._apply_levels(self._thresholds_for(config.log_level, config.namespace_levels))
+        self._config = config
+
+    def reload_from_file(self, config_file: str):
+        """Parse config file and reload(), see reload
+
+        Args:
+            config_file (str): config file the logger was built from
+        """
+        cfg = CrimsonConfigParser.parse(config_file=config_file)
+        self.reload(CrimsonLogConfig.from_dict(cfg))
+
+    def watch_config(self, config_file: str, interval_s: float = 2.0):
+        """Reload when the config file's mtime changes, checked every interval_s
+        on a background thread. Stopped by close()
+
+        Args:
+            config_file (str): config file to watch
+            interval_s (float): seconds between mtime checks
+        """
+        if self._watcher:
+            return
+
+        stopped = threading.Event()
+        last_mtime = os.stat(config_file).st_mtime_ns
+
+        def watch():
+            nonlocal last_mtime
+            while not stopped.wait(interval_s):
+                try:
+                    mtime = os.stat(config_file).st_mtime_ns
+                    if mtime != last_mtime:
+                        last_mtime = mtime
+                        self.reload_from_file(config_file)
+                except Exception as e:
+                    print(f"[Error] Error while reloading {config_file}: {e}")
+
+        thread = threading.Thread(target=watch, daemon=True, name="CrimsonConfigWatcher")
+        self._watcher = (thread, stopped)
+        thread.start()
+
+    def set_level(self, log_level: LogLevel):
+        """Change log level at runtime, rebinds disabled level methods to a no-op
+        Namespace rules are kept
+
+        Args:
+            log_level (LogLevel): new default level
+        """
+        self._apply_levels(self._thresholds_for(log_level, self._thresholds.rules))
+
+    def set_namespace_level(self, prefix: str, log_level: Optional[LogLevel]):
+        """Set or remove the level rule for a namespace prefix at runtime
 
-    def write_log(self, log_level: LogLevel, content: str, namespace: str):
+        Args:
+            prefix (str): namespace prefix, `payments` and `payments.*` both
+                cover `payments` and everything below it
+            log_level (LogLevel | None): level for the prefix, None removes the rule
+        """
+        rules = dict(self._thresholds.rules)
+        prefix = normalize_prefix(prefix)
+        if log_level is None:
+            rules.pop(prefix, None)
+        else:
+            rules[prefix] = log_level
+        self._apply_levels(self._thresholds_for(self._thresholds.default_level, rules))
+
+    def _apply_levels(self, thresholds: NamespaceThresholds):
+        # swapped in by a single assignment, cache of the old rules goes with it
+        self._thresholds = thresholds
+        self._log_level = thresholds.default_level
+        self._threshold = thresholds.floor.ordinal
+
+        for level in LogLevel:
+            method = level.value.lower()
+            if level.ordinal < self._threshold:
+                setattr(self, method, self._filtered(level))
+            else:
+                # fall back to class method
+                self.__dict__.pop(method, None)
+
+    def _filtered(self, log_level: LogLevel):
+        if not self._metrics:
+            return _disabled
+
+        record_filtered = self._metrics.record_filtered
+        level = log_level.value
+
+        def filtered(content: str, namespace: str, *args):
+            record_filtered(level)
+
+        return filtered
+
+    def is_enabled_for(self, log_level: LogLevel, namespace: str = None) -> bool:
+        """Check if a level would be logged, to skip building expensive messages
+
+        Args:
+            log_level (LogLevel): level to check
+            namespace (str): namespace to check, without it the check is
+                whether any namespace logs the level
+        """
+        if namespace is None:
+            return log_level.ordinal >= self._threshold
+        return log_level.ordinal >= self._thresholds[namespace]
+
+    def child(self, namespace: str) -> BoundLogger:
+        """Logger bound to a namespace, for namespaces that log a lot
+
+        Args:
+            namespace (str): namespace passed on every call of the child
+
+        Returns:
+            BoundLogger sharing this logger's writer, sink and level rules,
+            `child.info(content, *args)` instead of `info(content, namespace, *args)`
+        """
+        return BoundLogger(self, namespace)
+
+    def write_log(self, log_level: LogLevel, content: str, namespace: str, *args):
         """Writes log to configured sink
 
         Args:
             log_level (LogLevel): Log levels - INFO, DEBUG, WARN, ERROR, FATAL
-            content (str): Log message to be written
+            content (str): Log message to be written, or %/{} style template
             namespace (str): source of the log
+            *args: template arguments, only interpolated if log level is enabled
 
         Returns:
             None
@@ -47,25 +315,75 @@ class CrimsonLogger:
             Exception: For cases like lock issues etc
         """
 
-        if log_level >= self._log_level:
-            if self._config.thread_model == ThreadModel.SINGLE:
-                # decoupled write mode from thread model
-                # at this point we can only warn if thread mode is not respected by user
-                if (
-                    self._main_thread
-                    and threading.current_thread() != self._main_thread
-                ):
-                    print("[WARN] Logger is configured for SINGLE thread")
-
+        if log_level.ordinal >= self._thresholds[namespace]:
+            # decoupled write mode from thread model, _main_thread is only set for SINGLE
+            # at this point we can only warn if thread mode is not respected by user
+            if (
+                self._main_thread
+                and threading.current_thread() is not self._main_thread
+            ):
+                print("[WARN] Logger is configured for SINGLE thread")
+
+            if self._filter and not self._filter.allow(
+                log_level, content, namespace, args
+            ):
+                if self._metrics:
+                    self._metrics.record_dropped(log_level.value)
+                return
+
+            self._emit(log_level, content, namespace, args)
+
+        elif self._metrics:
+            self._metrics.record_filtered(log_level.value)
+
+    def _emit(self, log_level: LogLevel, content: str, namespace: str, args=()):
+        if self._deferred:
+            # formatting and interpolation run on the writer side
+            msg = LogRecord(log_level.value, time.time_ns(), namespace, content, args)
+        else:
+            if args:
+                content = interpolate(content, args)
             msg = self._formatter.format_message(log_level.value, content, namespace)
+
+        if self._metrics:
+            self._write_measured(log_level, msg)
+        else:
             self._writer.write_to_sink(msg)
 
-    def debug(self, content: str, namespace: str):
+    def _write_measured(self, log_level: LogLevel, msg: Union[str, LogRecord]):
+        started = time.perf_counter_ns()
+        self._writer.write_to_sink(msg)
+        self._metrics.observe_enqueue(time.perf_counter_ns() - started)
+        self._metrics.record_accepted(log_level.value)
+
+    @property
+    def metrics(self) -> Optional[CrimsonMetrics]:
+        """
+        Live metrics, None unless enable_metrics is set in config
+        """
+        return self._metrics
+
+    def metrics_snapshot(self) -> dict:
+        """Counters and gauges for logger, writer and sink, cheap enough to poll
+
+        Returns:
+            dict with sections records (accepted / filtered / dropped per level,
+            writer_dropped), queue (depth, high_water_mark), enqueue_latency_ns
+            (count, sum, buckets keyed by upper bound) and sink (bytes_written,
+            flush_count, flush_ns, rotation_count, rotation_ns, write_errors),
+            empty dict if metrics are disabled
+        """
+        if not self._metrics:
+            return {}
+        return self._metrics.snapshot()
+
+    def debug(self, content: str, namespace: str, *args):
         """Writes DEBUG log to configured sink
 
         Args:
-            content (str): Log message to be written
+            content (str): Log message to be written, or %/{} style template
             namespace (str): source of the log
+            *args: template arguments, only interpolated if log level is enabled
 
         Returns:
             None
@@ -75,14 +393,15 @@ class CrimsonLogger:
             Exception: For cases like lock issues etc
         """
 
-        self.write_log(LogLevel.DEBUG, content=content, namespace=namespace)
+        self.write_log(LogLevel.DEBUG, content, namespace, *args)
 
-    def info(self, content: str, namespace: str):
+    def info(self, content: str, namespace: str, *args):
         """Writes INFO log to configured sink
 
         Args:
-            content (str): Log message to be written
+            content (str): Log message to be written, or %/{} style template
             namespace (str): source of the log
+            *args: template arguments, only interpolated if log level is enabled
 
         Returns:
             None
@@ -91,14 +410,15 @@ class CrimsonLogger:
             ValueError: if format config is wrong
             Exception: For cases like lock issues etc
         """
-        self.write_log(LogLevel.INFO, content=content, namespace=namespace)
+        self.write_log(LogLevel.INFO, content, namespace, *args)
 
-    def warn(self, content: str, namespace: str):
+    def warn(self, content: str, namespace: str, *args):
         """Writes WARN log to configured sink
 
         Args:
-            content (str): Log message to be written
+            content (str): Log message to be written, or %/{} style template
             namespace (str): source of the log
+            *args: template arguments, only interpolated if log level is enabled
 
         Returns:
             None
@@ -107,14 +427,15 @@ class CrimsonLogger:
             ValueError: if format config is wrong
             Exception: For cases like lock issues etc
         """
-        self.write_log(LogLevel.WARN, content=content, namespace=namespace)
+        self.write_log(LogLevel.WARN, content, namespace, *args)
 
-    def error(self, content: str, namespace: str):
+    def error(self, content: str, namespace: str, *args):
         """Writes ERROR log to configured sink
 
         Args:
-            content (str): Log message to be written
+            content (str): Log message to be written, or %/{} style template
             namespace (str): source of the log
+            *args: template arguments, only interpolated if log level is enabled
 
         Returns:
             None
@@ -123,14 +444,15 @@ class CrimsonLogger:
             ValueError: if format config is wrong
             Exception: For cases like lock issues etc
         """
-        self.write_log(LogLevel.ERROR, content=content, namespace=namespace)
+        self.write_log(LogLevel.ERROR, content, namespace, *args)
 
-    def fatal(self, content: str, namespace: str):
+    def fatal(self, content: str, namespace: str, *args):
         """Writes FATAL log to configured sink
 
         Args:
-            content (str): Log message to be written
+            content (str): Log message to be written, or %/{} style template
             namespace (str): source of the log
+            *args: template arguments, only interpolated if log level is enabled
 
         Returns:
             None
@@ -139,22 +461,75 @@ class CrimsonLogger:
             ValueError: if format config is wrong
             Exception: For cases like lock issues etc
         """
-        self.write_log(LogLevel.FATAL, content=content, namespace=namespace)
+        self.write_log(LogLevel.FATAL, content, namespace, *args)
 
-    def close(self):
+    def flush(self, timeout: float = None) -> bool:
         """
-        Function to close logger in case it is ASYNC
+        Block until every record logged before the call has reached the sink
+
+        Args:
+            timeout (float): seconds to wait at most, None waits until done
+
+        Returns:
+            False if timeout expired first
         """
-        if self._config.write_mode == WriteMode.ASYNC:
-            self._writer.stop()
-            self._writer.join()
+        return self._writer.flush(timeout)
 
-        # in case of custom writers which is may be like async
+    def close(self):
+        """
+        Drain writer and close sink, later calls do nothing
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._config.close_at_exit:
+            atexit.unregister(self.close)
+
+        if self._watcher:
+            thread, stopped = self._watcher
+            stopped.set()
+            thread.join()
+            self._watcher = None
+
+        if self._filter:
+            self._filter.flush_summaries()
+
+        # writers running their own thread / process
         if hasattr(self._writer, "stop"):
             self._writer.stop()
         if hasattr(self._writer, "join"):
             self._writer.join()
 
+        # writer has drained, sink can release file handles / background work
+        # unless it lives in another process owned by the writer
+        if self._sink and not getattr(self._writer, "owns_sink", False):
+            self._sink.close()
+
+    async def aflush(self):
+        """
+        Wait until logged records are written to sink, for ASYNCIO write mode
+        Other writers are flushed on a thread so the loop is not blocked
+        """
+        if hasattr(self._writer, "aflush"):
+            await self._writer.aflush()
+        elif self._sink:
+            await asyncio.get_running_loop().run_in_executor(None, self._sink.flush)
+
+    async def aclose(self):
+        """
+        Close logger from a coroutine without blocking the event loop
+        """
+        if hasattr(self._writer, "aclose"):
+            if self._filter:
+                self._filter.flush_summaries()
+            await self._writer.aclose()
+            if self._sink:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._sink.close
+                )
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, self.close)
+
 
 class CrimsonLoggerBuilder:
     """
@@ -168,6 +543,12 @@ class CrimsonLoggerBuilder:
             name (str): Logger name, defaults to CrimsonLogger
         """
         self._name = name
+        self._config = None
+        self._sink = None
+        self._writer = None
+        self._formatter = None
+        self._record_formatter = None
+        self._extra_sinks = []
 
     def with_custom_sink(self, sink: CrimsonSink):
         """Set custom sink
@@ -190,10 +571,11 @@ class CrimsonLoggerBuilder:
         return self
 
     def set_sink(self):
-        """Set Library provided sink (FileSink)
+        """Set Library provided sink (FileSink, MmapFileSink, NetworkSink or SqliteSink)
 
         Raises:
-            ConfigException: if config has not been set before this step
+            ConfigException: if config has not been set before this step,
+                or sink_type MMAP is combined with file_format BINARY
         """
         if not self._config:
             raise ConfigException(
@@ -202,6 +584,16 @@ class CrimsonLoggerBuilder:
 
         if self._config.sink_type == "FILE":
             self._sink = CrimsonFileSink().configure(self._config)
+        elif self._config.sink_type == "MMAP":
+            if self._config.file_format == FileFormat.BINARY:
+                raise ConfigException(
+                    "[ERROR] MMAP sink writes text only, use sink_type FILE for file_format BINARY"
+                )
+            self._sink = CrimsonMmapFileSink().configure(self._config)
+        elif self._config.sink_type == "NETWORK":
+            self._sink = CrimsonNetworkSink().configure(self._config)
+        elif self._config.sink_type == "SQLITE":
+            self._sink = CrimsonSqliteSink().configure(self._config)
         else:
             raise ConfigException(
                 "[ERROR] Configuration is not for file type sink \n"
@@ -209,8 +601,64 @@ class CrimsonLoggerBuilder:
             )
         return self
 
+    def add_sink(
+        self,
+        sink: CrimsonSink,
+        log_level: LogLevel = None,
+        capacity: int = None,
+        overflow_policy: OverflowPolicy = None,
+        name: str = None,
+        config: CrimsonLogConfig = None,
+    ):
+        """Attach an additional sink, logs fan out to the main sink and every added one
+        With added sinks set_writer builds a FanOutWriter: each sink gets its own
+        bounded queue and drain thread, so a slow sink can't stall the others
+
+        Args:
+            sink (CrimsonSink): sink instance, configured here
+            log_level (LogLevel): minimum level for this sink, defaults to config log_level
+            capacity (int): queue size, defaults to thread_buffer_capacity
+            overflow_policy (OverflowPolicy): defaults to DROP_OLDEST, so a full
+                queue never blocks the caller
+            name (str): key for this sink in lag metrics
+            config (CrimsonLogConfig): config to configure sink with, e.g. another
+                file_location, defaults to logger config
+
+        Raises:
+            ConfigException: if config or main sink has not been set, or writer is already set
+        """
+        if not self._config:
+            raise ConfigException(
+                "[ERROR] Config init is the first step, please use `with_config(__config_path))` method first"
+            )
+
+        if not self._sink:
+            raise ConfigException(
+                "[ERROR] Sink set up is required before this step, please use set_sink or use_custom_sink method"
+            )
+
+        if self._writer:
+            raise ConfigException(
+                "[ERROR] Sinks must be added before the writer is set"
+            )
+
+        sink.configure(config or self._config)
+        self._extra_sinks.append(
+            {
+                "sink": sink,
+                "log_level": log_level or self._config.log_level,
+                "capacity": capacity,
+                "overflow_policy": overflow_policy,
+                "name": name,
+                "own_config": config is not None,
+            }
+        )
+
+        return self
+
     def set_writer(self):
         """Sets writer based on write_mode in config
+        FanOutWriter is used instead if sinks were added with add_sink
 
         Raises:
             ConfigException: if config or writer has not been set before this step
@@ -220,20 +668,55 @@ class CrimsonLoggerBuilder:
                 "[ERROR] Config init is the first step, please use `with_config(__config_path))` method first"
             )
 
-        if self._config.write_mode == WriteMode.SYNC:
-            self._writer = SyncWriter().set_sink(self._sink)
+        if self._extra_sinks:
+            self._writer = self._fan_out_writer()
+            self._writer.start()
+
+        elif self._config.write_mode == WriteMode.SYNC:
+            self._writer = SyncWriter().set_sink(self._writer_sink())
             if self._config.thread_model == ThreadModel.MULTI:
                 print(
                     "[WARN] thread_model MULTI with Sync Writer may block calling threads"
                 )
 
         elif self._config.write_mode == WriteMode.ASYNC:
-            self._writer = AsyncWriter().set_sink(self._sink)
+            self._writer = AsyncWriter(
+                batch_size=self._config.batch_size,
+                batch_bytes=self._config.batch_bytes,
+                flush_records=self._config.flush_records,
+                flush_bytes=self._config.flush_bytes,
+                flush_interval_ms=self._config.flush_interval_ms,
+                queue_capacity=self._config.queue_capacity,
+                spool_dir=self._config.spool_dir,
+            ).set_sink(self._writer_sink())
             self._writer.start()
             if self._config.thread_model == ThreadModel.SINGLE:
                 print(
                     "[WARN] thread_model SINGLE with Async Writer may delay logs until close() is called"
                 )
+
+        elif self._config.write_mode == WriteMode.BUFFERED:
+            self._writer = BufferedWriter(
+                capacity=self._config.thread_buffer_capacity,
+                overflow_policy=self._config.overflow_policy,
+            ).set_sink(self._writer_sink())
+            self._writer.start()
+            if self._config.thread_model == ThreadModel.SINGLE:
+                print(
+                    "[WARN] Buffered Writer is meant for thread_model MULTI, use SYNC or ASYNC for SINGLE"
+                )
+
+        elif self._config.write_mode == WriteMode.PROCESS:
+            self._writer = ProcessWriter(
+                batch_size=self._config.batch_size or 256,
+                flush_interval_ms=self._config.flush_interval_ms or 50,
+            ).set_sink(self._writer_sink())
+            self._writer.start()
+
+        elif self._config.write_mode == WriteMode.ASYNCIO:
+            self._writer = AsyncioWriter(
+                batch_size=self._config.batch_size or 512
+            ).set_sink(self._writer_sink())
         else:
             raise ConfigException(
                 "[ERROR] Unknown writer type passed, please use `with_custom_writer` while building"
@@ -241,6 +724,61 @@ class CrimsonLoggerBuilder:
 
         return self
 
+    def _fan_out_writer(self) -> FanOutWriter:
+        # added sinks keep the writer's DROP_OLDEST unless given a policy,
+        # overflow_policy from config only applies to the main sink
+        writer = FanOutWriter(
+            capacity=self._config.thread_buffer_capacity,
+            batch_size=self._config.batch_size or 256,
+        ).add_sink(
+            self._record_sink(self._sink),
+            # logger hands over its level and namespace rules on build
+            log_level=self._config.log_level,
+            overflow_policy=self._config.overflow_policy,
+            name=self._config.sink_type,
+            follow_logger=True,
+        )
+
+        for i, extra in enumerate(self._extra_sinks, start=1):
+            writer.add_sink(
+                self._record_sink(extra["sink"]),
+                log_level=extra["log_level"],
+                capacity=extra["capacity"],
+                overflow_policy=extra["overflow_policy"],
+                name=extra["name"] or f"{type(extra['sink']).__name__}-{i}",
+                own_config=extra["own_config"],
+            )
+
+        return writer
+
+    def _record_sink(self, sink: CrimsonSink) -> CrimsonSink:
+        if sink.accepts_records:
+            return sink
+        return RecordFormattingSink(sink, self._shared_formatter())
+
+    def _shared_formatter(self) -> Formatter:
+        """
+        Formatter used by writer side formatting, the same instance becomes the
+        logger's formatter so logger.reload reconfigures both
+        """
+        if not self._record_formatter:
+            self._record_formatter = self._formatter or Formatter().configure(
+                self._config
+            )
+        return self._record_formatter
+
+    def _writer_sink(self) -> CrimsonSink:
+        """
+        Sink handed to the writer, with deferred formatting the writer
+        receives LogRecords and formats them through a wrapping sink
+        """
+        if self._sink.accepts_records:
+            return self._sink
+
+        if self._config.deferred_formatting:
+            return RecordFormattingSink(self._sink, self._shared_formatter())
+        return self._sink
+
     def with_custom_writer(self, writer: CrimsonWriter):
         """Set custom writer
 
@@ -262,7 +800,7 @@ class CrimsonLoggerBuilder:
             )
 
         self._writer = writer
-        self._writer.set_sink(self._sink)
+        self._writer.set_sink(self._writer_sink())
 
         if hasattr(self._writer, "start"):
             self._writer.start()
@@ -280,7 +818,7 @@ class CrimsonLoggerBuilder:
                 "[ERROR] Config init is the first step, please use `with_config(__config_path))` method first"
             )
 
-        self._formatter = Formatter()
+        self._formatter = self._record_formatter or Formatter()
         self._formatter.configure(config=self._config)
 
         return self
@@ -323,6 +861,20 @@ class CrimsonLoggerBuilder:
                 "LoggerBuilder not fully initialized. Missing Attributes"
             )
 
+        metrics = None
+        if self._config.enable_metrics:
+            metrics = CrimsonMetrics()
+            self._sink.set_metrics(metrics)
+            for extra in self._extra_sinks:
+                extra["sink"].set_metrics(metrics)
+            if hasattr(self._writer, "set_metrics"):
+                self._writer.set_metrics(metrics)
+                metrics.watch_writer(self._writer)
+
         return CrimsonLogger(
-            config=self._config, writer=self._writer, formatter=self._formatter
+            config=self._config,
+            writer=self._writer,
+            formatter=self._formatter,
+            sink=self._sink,
+            metrics=metrics,
         )
@@ -0,0 +1,222 @@
+from threading import Lock, current_thread, local
+
+
+class _Shard:
+    """
+    Counters owned by one thread, only that thread writes them
+    """
+
+    __slots__ = (
+        "accepted",
+        "filtered",
+        "dropped",
+        "enqueue_buckets",
+        "enqueue_count",
+        "enqueue_ns",
+        "queue_high_water_mark",
+        "bytes_written",
+        "flush_count",
+        "flush_ns",
+        "rotation_count",
+        "rotation_ns",
+        "write_errors",
+        "thread",
+    )
+
+    def __init__(self, thread=None) -> None:
+        self.accepted = {}
+        self.filtered = {}
+        self.dropped = {}
+        self.enqueue_buckets = [0] * 65
+        self.enqueue_count = 0
+        self.enqueue_ns = 0
+        self.queue_high_water_mark = 0
+        self.bytes_written = 0
+        self.flush_count = 0
+        self.flush_ns = 0
+        self.rotation_count = 0
+        self.rotation_ns = 0
+        self.write_errors = 0
+        self.thread = thread
+
+    def merge(self, other: "_Shard") -> None:
+        """
+        Add counters of a shard whose thread has exited
+        """
+        for name in ("accepted", "filtered", "dropped"):
+            counts = getattr(self, name)
+            for level, count in getattr(other, name).items():
+                counts[level] = counts.get(level, 0) + count
+        for i, count in enumerate(other.enqueue_buckets):
+            self.enqueue_buckets[i] += count
+        self.queue_high_water_mark = max(
+            self.queue_high_water_mark, other.queue_high_water_mark
+        )
+        for name in (
+            "enqueue_count",
+            "enqueue_ns",
+            "bytes_written",
+            "flush_count",
+            "flush_ns",
+            "rotation_count",
+            "rotation_ns",
+            "write_errors",
+        ):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+
+class CrimsonMetrics:
+    """
+    Runtime counters and gauges for logger, writer and sink
+
+    Every thread updates its own shard, so recording takes no lock.
+    snapshot() sums all shards, values read from other threads may lag
+    by a few updates.
+
+    Enqueue latency is a histogram of power of two buckets in ns,
+    bucket `le` holds observations <= le.
+
+    Shards of exited threads are folded into one retired shard when a new
+    thread registers or on snapshot, so thread churn doesn't grow them.
+    """
+
+    def __init__(self) -> None:
+        self._local = local()
+        self._shards = []
+        self._shards_lock = Lock()  # taken once per thread on registration
+        self._retired = _Shard()
+        self._writer = None
+
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard(current_thread())
+            with self._shards_lock:
+                self._retire_exited()
+                self._shards.append(shard)
+            return shard
+
+    def _retire_exited(self) -> None:
+        # called with _shards_lock held, an exited thread no longer writes its shard
+        live = []
+        for shard in self._shards:
+            if shard.thread.is_alive():
+                live.append(shard)
+            else:
+                self._retired.merge(shard)
+        self._shards = live
+
+    def watch_writer(self, writer) -> None:
+        """
+        Writer whose queue depth and overflow drops are read at snapshot time
+        """
+        self._writer = writer
+
+    def record_accepted(self, level: str) -> None:
+        counts = self._shard().accepted
+        counts[level] = counts.get(level, 0) + 1
+
+    def record_filtered(self, level: str) -> None:
+        counts = self._shard().filtered
+        counts[level] = counts.get(level, 0) + 1
+
+    def record_dropped(self, level: str) -> None:
+        counts = self._shard().dropped
+        counts[level] = counts.get(level, 0) + 1
+
+    def observe_enqueue(self, duration_ns: int) -> None:
+        shard = self._shard()
+        shard.enqueue_buckets[duration_ns.bit_length()] += 1
+        shard.enqueue_count += 1
+        shard.enqueue_ns += duration_ns
+
+    def observe_queue_depth(self, depth: int) -> None:
+        shard = self._shard()
+        if depth > shard.queue_high_water_mark:
+            shard.queue_high_water_mark = depth
+
+    def add_bytes_written(self, count: int) -> None:
+        self._shard().bytes_written += count
+
+    def observe_flush(self, duration_ns: int) -> None:
+        shard = self._shard()
+        shard.flush_count += 1
+        shard.flush_ns += duration_ns
+
+    def observe_rotation(self, duration_ns: int) -> None:
+        shard = self._shard()
+        shard.rotation_count += 1
+        shard.rotation_ns += duration_ns
+
+    def record_write_error(self) -> None:
+        self._shard().write_errors += 1
+
+    def snapshot(self) -> dict:
+        """
+        Current totals across all threads
+        """
+        with self._shards_lock:
+            self._retire_exited()
+            shards = [self._retired, *self._shards]
+
+        def merged(attribute: str) -> dict[str, int]:
+            totals = {}
+            for shard in shards:
+                for level, count in list(getattr(shard, attribute).items()):
+                    totals[level] = totals.get(level, 0) + count
+            return totals
+
+        def total(attribute: str) -> int:
+            return sum(getattr(shard, attribute) for shard in shards)
+
+        buckets = [0] * 65
+        for shard in shards:
+            for i, count in enumerate(shard.enqueue_buckets):
+                buckets[i] += count
+
+        snapshot = {
+            "records": {
+                "accepted": merged("accepted"),
+                "filtered": merged("filtered"),
+                "dropped": merged("dropped"),
+                "writer_dropped": 0,
+            },
+            "queue": {
+                "depth": 0,
+                "high_water_mark": max(
+                    (shard.queue_high_water_mark for shard in shards), default=0
+                ),
+            },
+            "enqueue_latency_ns": {
+                "count": total("enqueue_count"),
+                "sum": total("enqueue_ns"),
+                "buckets": {
+                    (1 << i) - 1: count for i, count in enumerate(buckets) if count
+                },
+            },
+            "sink": {
+                "bytes_written": total("bytes_written"),
+                "flush_count": total("flush_count"),
+                "flush_ns": total("flush_ns"),
+                "rotation_count": total("rotation_count"),
+                "rotation_ns": total("rotation_ns"),
+                "write_errors": total("write_errors"),
+            },
+        }
+
+        if self._writer is not None:
+            try:
+                snapshot["queue"]["depth"] = self._writer.queue_depth()
+                # overflow drops in the writer happen after the level is gone
+                snapshot["records"]["writer_dropped"] = getattr(
+                    self._writer, "dropped_records", 0
+                )
+                if hasattr(self._writer, "sink_lag"):
+                    snapshot["sinks"] = self._writer.sink_lag()
+                if getattr(self._writer, "spool", None):
+                    snapshot["spool"] = self._writer.spool.stats()
+            except Exception as e:
+                print(f"[Error] Error while reading writer metrics: {e}")
+
+        return snapshot
@@ -0,0 +1,120 @@
+from crimson_logger.src.crimson_file_sink import CrimsonFileSink
+import mmap
+import os
+
+
+class CrimsonMmapFileSink(CrimsonFileSink):
+    """
+    Write log to preallocated memory mapped segments
+    - Segment size is the rotation size (max_file_size)
+    - Records are copied into the mapped region, no write/flush syscall per line
+    - When a record does not fit, the segment is truncated to its used length
+      and rotated with the same .N / .N.gz scheme as CrimsonFileSink
+    - Data copied into the map lives in the page cache, so it survives
+      the process dying (not the host)
+    - Text format only
+    """
+
+    accepts_records = False
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._type = "MMAP"
+        self._map = None
+        self._segment_size = 0
+
+    def _open_file(self):
+        """
+        Open active file and map a segment, existing content is kept
+        """
+        fd = os.open(self._file_path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._file = os.fdopen(fd, "r+b")
+
+        existing = os.fstat(fd).st_size
+        self._map_segment(max(self._max_file_size, existing))
+
+        # preallocated tail is zero filled, data ends after last complete line
+        self._size = self._map.rfind(b"\n", 0, existing) + 1
+        if existing > self._size:
+            self._map[self._size : existing] = bytes(existing - self._size)
+
+    def _map_segment(self, segment_size: int):
+        self._file.truncate(segment_size)
+        self._map = mmap.mmap(self._file.fileno(), segment_size)
+        self._segment_size = segment_size
+
+    def _close_file(self):
+        # drop unused preallocated tail
+        self._map.close()
+        self._file.truncate(self._size)
+        self._file.close()
+
+    def _write_bytes(self, data: bytes) -> int:
+        """
+        Copy data into the map, rolling segments as needed
+
+        Returns:
+            offset in active file the data was written at
+        """
+        end = self._size + len(data)
+
+        if end > self._segment_size:
+            if self._size:
+                self._rotate()
+
+            if len(data) > self._segment_size:
+                # single record / batch larger than a segment gets its own
+                self._map.close()
+                self._map_segment(len(data))
+
+            end = len(data)
+
+        offset = end - len(data)
+        self._map[offset:end] = data
+        self._size = end
+        self._record_bytes(len(data))
+        return offset
+
+    def write(self, message: str):
+        """
+        Write to mapped segment
+
+        Args:
+            message (str): formatted message to write to file
+        """
+        if not self._is_valid:
+            self._validate_config()
+
+        try:
+            offset = self._write_bytes((message + "\n").encode("utf-8"))
+            if self._index:
+                self._index.add_line(message, offset)
+
+        except Exception as e:
+            print(f"[Error] Error while writing to file: {e}")
+            self._record_error()
+
+    def write_batch(self, messages: list[str]):
+        """
+        Write a batch of messages to mapped segment as one copy
+
+        Args:
+            messages (list[str]): formatted messages to write to file
+        """
+        if not self._is_valid:
+            self._validate_config()
+
+        try:
+            offset = self._write_bytes(("\n".join(messages) + "\n").encode("utf-8"))
+            if self._index:
+                self._index_lines(messages, offset)
+
+        except Exception as e:
+            print(f"[Error] Error while writing to file: {e}")
+            self._record_error()
+
+    def flush(self):
+        """
+        No-op, records are visible in page cache as soon as they are copied
+        """
+        pass
@@ -0,0 +1,207 @@
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.crimson_sink import CrimsonSink
+from crimson_logger.src.config_exception import ConfigException
+from collections import deque
+import socket
+import struct
+import time
+
+
+FRAME_HEADER = struct.Struct(">I")
+MAX_FRAME_BYTES = 1_048_576
+MAX_DATAGRAM_BYTES = 65_000
+_INITIAL_BACKOFF = 0.1
+
+
+class CrimsonNetworkSink(CrimsonSink):
+    """
+    Send logs to db_ip_address:db_port over TCP (or UDP)
+    - Records are sent in length-prefixed frames: 4 byte big-endian payload
+      length, then utf-8 lines separated by `\\n`. A frame carries every
+      record written since the last flush (up to 1MB), so batched writers
+      send one frame per drain cycle
+    - TCP connection is kept open and reused, after a failure it is
+      reconnected with exponential backoff up to network_backoff_max_ms
+    - While the peer is down records are buffered up to
+      network_buffer_bytes, oldest records are dropped beyond that
+    - A frame that failed mid-send is sent again, the peer may see
+      records twice
+    - UDP sends one frame per datagram, lost datagrams are not detected
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._type = "NETWORK"
+        self._address = None
+        self._protocol = "TCP"
+        self._socket = None
+        self._pending = deque()  # encoded lines waiting to be sent
+        self._pending_bytes = 0
+        self._buffer_bytes = 4_194_304
+        self._timeout = 1.0
+        self._backoff = _INITIAL_BACKOFF
+        self._backoff_max = 30.0
+        self._next_attempt = 0.0
+        self._max_frame_bytes = MAX_FRAME_BYTES
+        self.dropped_records = 0
+
+    def configure(self, config: CrimsonLogConfig):
+        """
+        Configure peer address from db_ip_address and db_port
+
+        Args:
+            config (CrimsonLogConfig): network_protocol, network_buffer_bytes,
+                network_timeout_ms and network_backoff_max_ms are used as well
+
+        Raises:
+            ConfigException: if address is missing or protocol is unknown
+
+        Returns:
+            instance of class
+        """
+        if not config.db_ip_address or not config.db_port:
+            raise ConfigException(
+                "Network Sink needs db_ip_address and db_port in config"
+            )
+
+        self._address = (config.db_ip_address, int(config.db_port))
+        self._protocol = config.network_protocol
+        if self._protocol not in ("TCP", "UDP"):
+            raise ConfigException(f"Unknown network_protocol {self._protocol}")
+
+        self._buffer_bytes = config.network_buffer_bytes
+        self._timeout = config.network_timeout_ms / 1000
+        self._backoff_max = config.network_backoff_max_ms / 1000
+        if self._protocol == "UDP":
+            self._max_frame_bytes = MAX_DATAGRAM_BYTES
+
+        return self
+
+    def reconfigure(self, config: CrimsonLogConfig):
+        """
+        Apply new buffer limit, timeout and backoff, peer address is kept
+        """
+        self._buffer_bytes = config.network_buffer_bytes
+        self._timeout = config.network_timeout_ms / 1000
+        self._backoff_max = config.network_backoff_max_ms / 1000
+
+    def _connect(self):
+        if self._protocol == "UDP":
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.connect(self._address)
+        else:
+            sock = socket.create_connection(self._address, timeout=self._timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket = sock
+
+    def _disconnect(self):
+        if self._socket:
+            try:
+                self._socket.close()
+            except OSError:
+                pass
+            self._socket = None
+
+    def _buffer(self, data: bytes):
+        if len(data) > self._max_frame_bytes and self._protocol == "UDP":
+            print(f"[Error] Log record of {len(data)} bytes does not fit a datagram")
+            self.dropped_records += 1
+            return
+
+        self._pending.append(data)
+        self._pending_bytes += len(data)
+
+        while self._pending_bytes > self._buffer_bytes and len(self._pending) > 1:
+            self._pending_bytes -= len(self._pending.popleft())
+            self.dropped_records += 1
+
+    def _take_frame(self) -> list[bytes]:
+        lines = []
+        size = 0
+        pending = self._pending
+        while pending and (not lines or size + len(pending[0]) <= self._max_frame_bytes):
+            line = pending.popleft()
+            lines.append(line)
+            size += len(line)
+        self._pending_bytes -= size
+        return lines
+
+    def _send_pending(self):
+        if time.monotonic() < self._next_attempt:
+            # peer is down, keep buffering until backoff expires
+            return
+
+        try:
+            if not self._socket:
+                self._connect()
+
+            while self._pending:
+                lines = self._take_frame()
+                payload = b"".join(lines)
+                try:
+                    self._socket.sendall(FRAME_HEADER.pack(len(payload)) + payload)
+                except OSError:
+                    # resend whole frame after reconnect
+                    self._pending.extendleft(reversed(lines))
+                    self._pending_bytes += len(payload)
+                    raise
+
+                if self._metrics:
+                    self._metrics.add_bytes_written(len(payload))
+
+            self._backoff = _INITIAL_BACKOFF
+
+        except OSError as e:
+            print(f"[Error] Error while sending logs to {self._address}: {e}")
+            if self._metrics:
+                self._metrics.record_write_error()
+            self._disconnect()
+            self._next_attempt = time.monotonic() + self._backoff
+            self._backoff = min(self._backoff * 2, self._backoff_max)
+
+    def write(self, message: str):
+        """
+        Send a single message
+
+        Args:
+            message (str): formatted message
+        """
+        self._buffer((message + "\n").encode("utf-8"))
+        self.flush()
+
+    def write_batch(self, messages: list[str]):
+        """
+        Buffer a batch of messages, sent as one frame on flush()
+
+        Args:
+            messages (list[str]): formatted messages in arrival order
+        """
+        for message in messages:
+            self._buffer((message + "\n").encode("utf-8"))
+
+    def flush(self):
+        """
+        Send buffered messages, returns without sending during reconnect backoff
+        """
+        if not self._pending:
+            return
+
+        if not self._metrics:
+            self._send_pending()
+            return
+
+        started = time.perf_counter_ns()
+        self._send_pending()
+        self._metrics.observe_flush(time.perf_counter_ns() - started)
+
+    def close(self):
+        """
+        Try to send what is still buffered and close the connection
+        """
+        self._next_attempt = 0.0
+        self.flush()
+        if self._pending:
+            print(
+                f"[Error] {len(self._pending)} log records could not be sent to {self._address}"
+            )
+        self._disconnect()
@@ -7,8 +7,17 @@ class CrimsonSink(ABC):
     DB sinks must use db_ip_address and db_port from config
 
     All the classes must be implemented for sink to work
+
+    Sinks with accepts_records = True receive LogRecord objects instead of
+    formatted strings and do their own encoding
+
+    With enable_metrics the builder passes a CrimsonMetrics through
+    set_metrics, sinks report bytes / flushes / errors to self._metrics
     """
 
+    accepts_records = False
+    _metrics = None
+
     @abstractmethod
     def configure(self, config: CrimsonLogConfig):
         pass
@@ -16,3 +25,36 @@ class CrimsonSink(ABC):
     @abstractmethod
     def write(self, message: str):
         pass
+
+    def set_metrics(self, metrics):
+        self._metrics = metrics
+
+    def write_batch(self, messages: list[str]):
+        """
+        Write a batch of messages, used by batched writers
+        Sinks can override this to write the whole batch in one go
+
+        Args:
+            messages (list[str]): formatted messages in arrival order
+        """
+        for message in messages:
+            self.write(message)
+
+    def flush(self):
+        """
+        Flush buffered output, no-op unless sink buffers writes
+        """
+        pass
+
+    def reconfigure(self, config: CrimsonLogConfig):
+        """
+        Apply changed settings on a running sink, called by logger.reload
+        Default keeps the sink as configured
+        """
+        pass
+
+    def close(self):
+        """
+        Release resources held by sink, called when logger is closed
+        """
+        pass
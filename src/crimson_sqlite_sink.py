@@ -0,0 +1,182 @@
+from typing import Optional
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.crimson_sink import CrimsonSink
+from crimson_logger.src.log_record import LogRecord
+import os
+import sqlite3
+import time
+
+
+_HOUR_NS = 3_600_000_000_000
+_TABLE_PREFIX = "logs_"
+
+
+class CrimsonSqliteSink(CrimsonSink):
+    """
+    Write LogRecords as rows (ts, level, namespace, message) to a SQLite file
+    - Database is file_location, opened in WAL mode
+    - A batch is inserted with one executemany inside one transaction,
+      batched writers commit once per drain cycle
+    - ts is epoch nanoseconds, indexed alone and together with namespace
+    - Rows are partitioned into one table per sqlite_partition_hours
+      (`logs_<period>`), the `logs` view reads all of them. Beyond
+      sqlite_retention_partitions the oldest table is dropped and its pages
+      released, so the file stays bounded. sqlite_partition_hours:0 keeps a
+      single `logs` table without pruning
+    """
+
+    accepts_records = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._type = "SQLITE"
+        self._db_path = None
+        self._conn = None
+        self._partition_ns = 24 * _HOUR_NS
+        self._retention = 0
+        self._partitions = []  # period numbers with a table, ascending
+
+    def configure(self, config: CrimsonLogConfig):
+        """
+        Open database at file_location and load existing partitions
+
+        Args:
+            config (CrimsonLogConfig): sqlite_partition_hours and
+                sqlite_retention_partitions are used as well
+
+        Returns:
+            instance of class
+        """
+        self._db_path = config.file_location
+        dir_path = os.path.dirname(self._db_path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+
+        self._partition_ns = config.sqlite_partition_hours * _HOUR_NS
+        self._retention = config.sqlite_retention_partitions
+
+        # writer threads differ from the building thread, writes are serialized by the writer
+        self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        # only takes effect on a new database, lets dropped partitions shrink the file
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        if not self._partition_ns:
+            self._create_table("logs")
+            return self
+
+        self._partitions = sorted(
+            int(name[len(_TABLE_PREFIX) :])
+            for (name,) in self._conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name LIKE ?",
+                (_TABLE_PREFIX + "%",),
+            )
+            if name[len(_TABLE_PREFIX) :].isdigit()
+        )
+        return self
+
+    def reconfigure(self, config: CrimsonLogConfig):
+        """
+        Apply new retention, applied when the next partition is created
+        """
+        self._retention = config.sqlite_retention_partitions
+
+    def _create_table(self, table: str):
+        with self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(ts INTEGER NOT NULL, level TEXT NOT NULL, namespace TEXT NOT NULL, message TEXT)"
+            )
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_ts ON {table} (ts)")
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {table}_namespace ON {table} (namespace, ts)"
+            )
+
+    def _table(self, timestamp_ns: int) -> Optional[str]:
+        if not self._partition_ns:
+            return "logs"
+
+        period = timestamp_ns // self._partition_ns
+        if period not in self._partitions:
+            self._add_partition(period)
+            if period not in self._partitions:
+                # older than retention, would be pruned right away
+                return None
+        return f"{_TABLE_PREFIX}{period}"
+
+    def _add_partition(self, period: int):
+        self._create_table(f"{_TABLE_PREFIX}{period}")
+        self._partitions.append(period)
+        self._partitions.sort()
+
+        dropped = False
+        while self._retention and len(self._partitions) > self._retention:
+            oldest = self._partitions.pop(0)
+            self._conn.execute(f"DROP TABLE IF EXISTS {_TABLE_PREFIX}{oldest}")
+            dropped = True
+
+        self._conn.execute("DROP VIEW IF EXISTS logs")
+        self._conn.execute(
+            "CREATE VIEW logs AS "
+            + " UNION ALL ".join(
+                f"SELECT * FROM {_TABLE_PREFIX}{p}" for p in self._partitions
+            )
+        )
+        self._conn.commit()
+
+        if dropped:
+            self._conn.execute("PRAGMA incremental_vacuum")
+
+    def _insert(self, records: list[LogRecord]):
+        rows = {}
+        for record in records:
+            rows.setdefault(self._table(record.timestamp_ns), []).append(
+                (record.timestamp_ns, record.level, record.namespace, record.get_message())
+            )
+
+        rows.pop(None, None)
+        with self._conn:
+            for table, table_rows in rows.items():
+                self._conn.executemany(
+                    f"INSERT INTO {table} (ts, level, namespace, message) VALUES (?, ?, ?, ?)",
+                    table_rows,
+                )
+
+    def write(self, message: LogRecord):
+        """
+        Insert a single record in its own transaction
+
+        Args:
+            message (LogRecord): record captured by the logger
+        """
+        self.write_batch([message])
+
+    def write_batch(self, messages: list[LogRecord]):
+        """
+        Insert a batch of records in one transaction
+
+        Args:
+            messages (list[LogRecord]): records in arrival order
+        """
+        try:
+            if not self._metrics:
+                self._insert(messages)
+                return
+
+            started = time.perf_counter_ns()
+            self._insert(messages)
+            self._metrics.observe_flush(time.perf_counter_ns() - started)
+
+        except Exception as e:
+            print(f"[Error] Error while writing to {self._db_path}: {e}")
+            if self._metrics:
+                self._metrics.record_write_error()
+
+    def close(self):
+        """
+        Close database, checkpoints the WAL into the main file
+        """
+        if self._conn:
+            self._conn.close()
+            self._conn = None
@@ -1,13 +1,19 @@
 from crimson_logger.src.crimson_sink import CrimsonSink
 from abc import ABC, abstractmethod
+from threading import Event
 
 
 class CrimsonWriter(ABC):
     """Create Custom Writer for writing logs
 
     Must implement all methods
+
+    Queueing writers override queue_depth and report their high water mark
+    to self._metrics when enable_metrics is set
     """
 
+    _metrics = None
+
     @abstractmethod
     def set_sink(self, sink: CrimsonSink):
         pass
@@ -15,3 +21,38 @@ class CrimsonWriter(ABC):
     @abstractmethod
     def write_to_sink(self, message: str) -> None:
         pass
+
+    def set_metrics(self, metrics):
+        self._metrics = metrics
+
+    def queue_depth(self) -> int:
+        """
+        Records waiting to be written to sink
+        """
+        return 0
+
+    def flush(self, timeout: float = None) -> bool:
+        """Block until every record written before the call has reached the sink
+
+        Args:
+            timeout (float): seconds to wait at most, None waits until done
+
+        Returns:
+            True if records were flushed within timeout
+        """
+        sink = getattr(self, "_sink", None)
+        if sink:
+            sink.flush()
+        return True
+
+
+class FlushRequest:
+    """
+    Queued behind records by flush(), the draining thread flushes the sink
+    and sets `done` once it reaches the request
+    """
+
+    __slots__ = ("done",)
+
+    def __init__(self) -> None:
+        self.done = Event()
@@ -0,0 +1,321 @@
+from typing import Optional
+from threading import Thread
+from queue import Queue, Empty, Full
+import time
+from crimson_logger.src.crimson_writer import CrimsonWriter, CrimsonSink, FlushRequest
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.log_record import LogRecord
+from crimson_logger.src.overflow_policy import OverflowPolicy
+from crimson_logger.src.namespace_levels import NamespaceThresholds
+
+
+_LEVEL_ORDINALS = {level.value: level.ordinal for level in LogLevel}
+_STOP = object()
+
+
+class _SinkLane(Thread):
+    """
+    Bounded queue and drain thread for one sink of a FanOutWriter
+    """
+
+    def __init__(
+        self,
+        name: str,
+        sink: CrimsonSink,
+        log_level: LogLevel,
+        capacity: int,
+        overflow_policy: OverflowPolicy,
+        batch_size: int,
+    ):
+        super().__init__(daemon=True, name=f"CrimsonFanOut-{name}")
+        self.sink_name = name
+        self.sink = sink
+        self.log_level = log_level
+        self.threshold = log_level.ordinal
+        # per namespace thresholds set by the logger, replace log_level
+        self.thresholds = None
+        # sink configured with its own config, left alone on reload
+        self.own_config = False
+        self.overflow_policy = overflow_policy
+        self.queue = Queue(maxsize=capacity)
+        self.batch_size = batch_size
+        self.written = 0  # only updated by drain thread
+        self.dropped = 0
+        self.metrics = None
+
+    def put(self, record: LogRecord) -> None:
+        if self.overflow_policy == OverflowPolicy.BLOCK:
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+            return
+        except Full:
+            pass
+
+        self.dropped += 1
+        if self.overflow_policy == OverflowPolicy.DROP_OLDEST:
+            self._evict_oldest_record()
+            try:
+                self.queue.put_nowait(record)
+            except Full:
+                # another producer took the free slot
+                pass
+
+    def _evict_oldest_record(self) -> None:
+        # stop sentinel and flush requests are never dropped
+        queue = self.queue
+        with queue.mutex:
+            items = queue.queue
+            for i, item in enumerate(items):
+                if isinstance(item, LogRecord):
+                    del items[i]
+                    queue.not_full.notify()
+                    return
+
+    def run(self) -> None:
+        active = True
+        while active:
+            record = self.queue.get()
+            batch = []
+            flush_request = None
+            while True:
+                if record is _STOP:
+                    active = False
+                    break
+                if type(record) is FlushRequest:
+                    flush_request = record
+                    break
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    record = self.queue.get_nowait()
+                except Empty:
+                    break
+
+            if self.metrics:
+                self.metrics.observe_queue_depth(self.queue.qsize() + len(batch))
+
+            if batch:
+                try:
+                    self.sink.write_batch(batch)
+                    self.sink.flush()
+                except Exception as e:
+                    print(f"[Error] Error in sink {self.sink_name}: {e}")
+                self.written += len(batch)
+
+            if flush_request:
+                # batches are flushed as they are written
+                flush_request.done.set()
+
+        self.sink.close()
+
+    def stop(self) -> None:
+        # sentinel bypasses the drop policies
+        self.queue.put(_STOP)
+
+    def request_flush(self, timeout: float = None) -> Optional[FlushRequest]:
+        request = FlushRequest()
+        # like the sentinel, waits for room instead of being dropped
+        try:
+            self.queue.put(request, timeout=timeout)
+        except Full:
+            return None
+        return request
+
+    def lag(self) -> dict:
+        try:
+            oldest = self.queue.queue[0]
+        except IndexError:
+            oldest = None
+
+        lag_ms = 0
+        if isinstance(oldest, LogRecord):
+            lag_ms = max(0, (time.time_ns() - oldest.timestamp_ns) // 1_000_000)
+
+        return {
+            "depth": self.queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "lag_ms": lag_ms,
+        }
+
+
+class FanOutWriter(CrimsonWriter):
+    """
+    Writes every record to several sinks, each with its own bounded queue
+    and drain thread, so a slow sink only backs up its own queue
+
+    Receives LogRecords (accepts_records) and filters them per sink by
+    minimum level before queueing. A sink added with follow_logger uses
+    the logger's per namespace thresholds instead, the logger replaces
+    them through set_thresholds whenever its levels change. Sinks that expect text must be wrapped
+    in a RecordFormattingSink. When a sink's queue holds `capacity`
+    records its overflow_policy applies, see BufferedWriter. Sinks drop
+    their oldest record by default so a full queue never blocks the
+    caller. Sinks with BLOCK are filled after all others, a full one
+    stalls the caller but no other sink.
+
+    Sinks are closed by the writer once their queue is drained on stop()
+    """
+
+    accepts_records = True
+    owns_sink = True
+
+    def __init__(
+        self,
+        capacity: int = 10_000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        batch_size: int = 256,
+    ):
+        super().__init__()
+        self._capacity = capacity
+        self._overflow_policy = overflow_policy
+        self._batch_size = batch_size
+        self._lanes = []
+        self._put_order = []  # lanes with BLOCK last
+
+    def set_sink(self, sink: CrimsonSink):
+        return self.add_sink(sink)
+
+    def add_sink(
+        self,
+        sink: CrimsonSink,
+        log_level: LogLevel = LogLevel.DEBUG,
+        capacity: int = None,
+        overflow_policy: OverflowPolicy = None,
+        name: str = None,
+        follow_logger: bool = False,
+        own_config: bool = False,
+    ):
+        """Attach a sink with its own queue
+
+        Args:
+            sink (CrimsonSink): configured sink, receives LogRecords
+            log_level (LogLevel): minimum level written to this sink
+            capacity (int): queue size, defaults to writer capacity
+            overflow_policy (OverflowPolicy): defaults to writer policy
+            name (str): key in sink_lag(), defaults to sink class and position
+            follow_logger (bool): filter with the logger's level and
+                namespace rules instead of log_level
+            own_config (bool): sink was configured with its own config,
+                reconfigure() skips it
+
+        Returns:
+            instance
+        """
+        lane = _SinkLane(
+            name=name or f"{type(sink).__name__}-{len(self._lanes)}",
+            sink=sink,
+            log_level=log_level,
+            capacity=capacity or self._capacity,
+            overflow_policy=overflow_policy or self._overflow_policy,
+            batch_size=self._batch_size,
+        )
+        if follow_logger:
+            lane.thresholds = NamespaceThresholds(log_level)
+        lane.own_config = own_config
+        self._lanes.append(lane)
+        self._put_order = sorted(
+            self._lanes, key=lambda lane: lane.overflow_policy == OverflowPolicy.BLOCK
+        )
+        return self
+
+    def set_thresholds(self, thresholds: NamespaceThresholds) -> None:
+        """
+        Swap in the logger's thresholds for sinks added with follow_logger
+        """
+        for lane in self._lanes:
+            if lane.thresholds is not None:
+                lane.thresholds = thresholds
+
+    @property
+    def min_level(self) -> Optional[LogLevel]:
+        """
+        Lowest level of the sinks with their own level, None if every
+        sink follows the logger
+        """
+        return min(
+            (lane.log_level for lane in self._lanes if lane.thresholds is None),
+            key=lambda level: level.ordinal,
+            default=None,
+        )
+
+    def reconfigure(self, config):
+        """
+        Pass changed config on to every sink but those added with their
+        own config, levels of the main sink are replaced by the logger
+        through set_thresholds
+        """
+        for lane in self._lanes:
+            if not lane.own_config:
+                lane.sink.reconfigure(config)
+
+    def set_metrics(self, metrics):
+        self._metrics = metrics
+        for lane in self._lanes:
+            lane.metrics = metrics
+
+    def start(self) -> None:
+        for lane in self._lanes:
+            lane.start()
+
+    def write_to_sink(self, message: LogRecord) -> None:
+        ordinal = _LEVEL_ORDINALS[message.level]
+        for lane in self._put_order:
+            thresholds = lane.thresholds
+            if thresholds is None:
+                if ordinal >= lane.threshold:
+                    lane.put(message)
+            elif ordinal >= thresholds[message.namespace]:
+                lane.put(message)
+
+    def queue_depth(self) -> int:
+        return sum(lane.queue.qsize() for lane in self._lanes)
+
+    @property
+    def dropped_records(self) -> int:
+        """
+        Records dropped by overflow policy across all sinks
+        """
+        return sum(lane.dropped for lane in self._lanes)
+
+    def sink_lag(self) -> dict[str, dict]:
+        """
+        Per sink queue depth, records written / dropped and age in ms of
+        the oldest record still queued
+        """
+        return {lane.sink_name: lane.lag() for lane in self._lanes}
+
+    def flush(self, timeout: float = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        def remaining():
+            return None if deadline is None else max(0, deadline - time.monotonic())
+
+        requests = []
+        for lane in self._lanes:
+            if not lane.is_alive():
+                continue
+            # a full queue counts against the deadline too
+            request = lane.request_flush(remaining())
+            if request is None:
+                return False
+            requests.append(request)
+
+        for request in requests:
+            if not request.done.wait(remaining()):
+                return False
+        return True
+
+    def stop(self):
+        for lane in self._lanes:
+            if lane.is_alive():
+                lane.stop()
+
+    def join(self):
+        for lane in self._lanes:
+            if lane.is_alive():
+                lane.join()
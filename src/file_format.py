@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class FileFormat(str, Enum):
+    TEXT = "TEXT"
+    BINARY = "BINARY"
@@ -10,16 +10,26 @@ class LogLevel(str, Enum):
     ERROR = "ERROR"
     FATAL = "FATAL"
 
+    @property
+    def ordinal(self) -> int:
+        return _ORDINAL_MAP[self.value]
+
     def __lt__(self, other):
         if isinstance(other, LogLevel):
             return _ORDINAL_MAP[self.value] < _ORDINAL_MAP[other.value]
         return NotImplemented
 
     def __le__(self, other):
-        return self == other or self < other
+        if isinstance(other, LogLevel):
+            return _ORDINAL_MAP[self.value] <= _ORDINAL_MAP[other.value]
+        return NotImplemented
 
     def __gt__(self, other):
-        return not self <= other
+        if isinstance(other, LogLevel):
+            return _ORDINAL_MAP[self.value] > _ORDINAL_MAP[other.value]
+        return NotImplemented
 
     def __ge__(self, other):
-        return not self < other
+        if isinstance(other, LogLevel):
+            return _ORDINAL_MAP[self.value] >= _ORDINAL_MAP[other.value]
+        return NotImplemented
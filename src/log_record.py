@@ -0,0 +1,88 @@
+import re
+
+
+# a space flag is left out, "50% of" is a literal % more often than `% o`
+_PERCENT_SPEC = re.compile(
+    r"%(?:%|(?:\([^)]*\))?[#0+-]*(?:\d+|\*)?(?:\.(?:\d+|\*))?[diouxXeEfFgGcrsa])"
+)
+_FORMAT_FIELD = re.compile(r"(?<!\{)\{\d*(?:![rsa])?(?::[^{}]*)?\}")
+_MAX_CACHED_TEMPLATES = 4096
+_STYLES = {}  # template -> True if %-style
+
+
+class LogRecord:
+    """
+    Compact log record captured on the calling thread
+    Formatting and template interpolation happen later, on the writer side
+
+    Attributes:
+        level (str): log level value, e.g. "INFO"
+        timestamp_ns (int): time.time_ns() when the log call was made
+        namespace (str): source of the log
+        message (str): message or %/{} style template
+        args (tuple): template arguments, empty when message is final
+    """
+
+    __slots__ = ("level", "timestamp_ns", "namespace", "message", "args")
+
+    def __init__(
+        self,
+        level: str,
+        timestamp_ns: int,
+        namespace: str,
+        message: str,
+        args: tuple = (),
+    ) -> None:
+        self.level = level
+        self.timestamp_ns = timestamp_ns
+        self.namespace = namespace
+        self.message = message
+        self.args = args
+
+    def get_message(self) -> str:
+        """
+        Message with template arguments interpolated
+        """
+        if not self.args:
+            return self.message
+        return interpolate(self.message, self.args)
+
+
+def _percent_style(template: str) -> bool:
+    """
+    True if template is %-style: it has a %-specifier (`%s`, `%5.2f`,
+    `%(name)s`, `%%`) or no str.format field (`{}`, `{0}`, `{:>5}`)
+    """
+    style = _STYLES.get(template)
+    if style is None:
+        style = bool(_PERCENT_SPEC.search(template)) or not _FORMAT_FIELD.search(template)
+        if len(_STYLES) >= _MAX_CACHED_TEMPLATES:
+            _STYLES.clear()
+        _STYLES[template] = style
+    return style
+
+
+def interpolate(template: str, args: tuple) -> str:
+    """
+    Interpolate args into template, str.format style if template has {}
+    fields and no %-specifier, else %-style. A literal % next to {} fields
+    (`"{} used 50% of disk"`) is kept as is.
+
+    Never raises, if the chosen style does not fit the other one is tried,
+    then the args are appended to the template
+    """
+    if _percent_style(template):
+        try:
+            return template % args
+        except (TypeError, ValueError, KeyError):
+            pass
+
+    try:
+        return template.format(*args)
+    except Exception:
+        pass
+
+    try:
+        return f"{template} args={args!r}"
+    except Exception:
+        return template
@@ -0,0 +1,106 @@
+from crimson_logger.src.log_level import LogLevel
+
+
+_MAX_CACHED_NAMESPACES = 4096
+
+
+def parse_namespace_rules(value: str, convert) -> dict:
+    """Parse a per namespace config value
+
+    Args:
+        value (str): comma separated `prefix=value` rules,
+            e.g. `payments.*=DEBUG,http=ERROR`
+        convert: callable applied to every value
+
+    Returns:
+        dict of namespace prefix to converted value, `.*` suffix is dropped
+        since a prefix always covers its children
+    """
+    rules = {}
+    for rule in value.split(","):
+        if not rule.strip():
+            continue
+        prefix, rule_value = rule.split("=", 1)
+        rules[normalize_prefix(prefix)] = convert(rule_value.strip())
+    return rules
+
+
+def parse_namespace_levels(value: str) -> dict[str, LogLevel]:
+    """Parse `namespace_levels` config value, e.g. `payments.*=DEBUG,http=ERROR`"""
+    return parse_namespace_rules(value, lambda level: LogLevel(level.upper()))
+
+
+def normalize_prefix(prefix: str) -> str:
+    prefix = prefix.strip()
+    if prefix.endswith(".*"):
+        prefix = prefix[: -len(".*")]
+    return "" if prefix == "*" else prefix
+
+
+def resolve_prefix(rules: dict, namespace: str, default=None):
+    """
+    Value of the rule with the longest dotted prefix of namespace,
+    `""` is the catch all rule
+    """
+    prefix = namespace
+    while prefix:
+        value = rules.get(prefix)
+        if value is not None:
+            return value
+        prefix = prefix.rpartition(".")[0]
+    return rules.get("", default)
+
+
+class NamespaceThresholds(dict):
+    """
+    Level threshold (LogLevel ordinal) per namespace string
+
+    A namespace is matched to the rule with the longest dotted prefix
+    (`payments.ledger` before `payments`), falling back to the default
+    level. The result is cached on first lookup, later lookups are a
+    single dict hit. Instances are never changed once rules change,
+    the logger swaps in a new one so the cache can't go stale.
+
+    widen_to lowers every namespace's threshold to that level, used by the
+    logger to let records through to extra sinks with a lower level.
+    default_level and rules keep the configured values.
+    """
+
+    def __init__(
+        self,
+        default_level: LogLevel,
+        rules: dict[str, LogLevel] = None,
+        widen_to: LogLevel = None,
+    ):
+        super().__init__()
+        self.default_level = default_level
+        self.rules = dict(rules or {})
+        self.widen_to = widen_to
+        self._ordinals = {prefix: level.ordinal for prefix, level in self.rules.items()}
+
+    @property
+    def floor(self) -> LogLevel:
+        """
+        Lowest level enabled for any namespace
+        """
+        levels = [self.default_level, *self.rules.values()]
+        if self.widen_to:
+            levels.append(self.widen_to)
+        return min(levels, key=lambda level: level.ordinal)
+
+    def resolve(self, namespace: str) -> int:
+        """
+        Walk rules from the full namespace up to its top level prefix
+        """
+        threshold = resolve_prefix(self._ordinals, namespace, self.default_level.ordinal)
+        if self.widen_to:
+            return min(threshold, self.widen_to.ordinal)
+        return threshold
+
+    def __missing__(self, namespace: str) -> int:
+        threshold = self.resolve(namespace)
+        if len(self) >= _MAX_CACHED_NAMESPACES:
+            # dynamic namespaces, don't grow without bound
+            self.clear()
+        self[namespace] = threshold
+        return threshold
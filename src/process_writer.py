@@ -0,0 +1,225 @@
+from crimson_logger.src.crimson_writer import CrimsonWriter, CrimsonSink
+from threading import Lock, Thread, Event
+from queue import Empty
+import multiprocessing
+import multiprocessing.util
+import os
+import time
+
+
+_ACK_POLL = 0.1  # seconds between checks that the writer process is alive
+
+
+class _FlushMarker:
+    """
+    Sent by flush() behind a process' batches, the writer process sends
+    `seq` back over that process' ack pipe once the sink is flushed.
+    The pipe end travels with the first marker of each process
+    """
+
+    __slots__ = ("producer", "seq", "ack")
+
+    def __init__(self, producer: int, seq: int, ack=None) -> None:
+        self.producer = producer
+        self.seq = seq
+        self.ack = ack
+
+
+def _serve(queue, sink: CrimsonSink) -> None:
+    """
+    Writer process loop, the only place the sink is written or rotated
+    """
+    acks = {}  # producer -> pipe end
+    active = True
+    while active:
+        batches = [queue.get()]
+        # coalesce whatever else producers have sent meanwhile
+        while True:
+            try:
+                batches.append(queue.get_nowait())
+            except Empty:
+                break
+
+        markers = []
+        for batch in batches:
+            if batch is None:
+                active = False
+            elif type(batch) is _FlushMarker:
+                markers.append(batch)
+            else:
+                sink.write_batch(batch)
+        sink.flush()
+
+        for marker in markers:
+            if marker.ack is not None:
+                acks[marker.producer] = marker.ack
+            try:
+                acks[marker.producer].send(marker.seq)
+            except (KeyError, OSError):
+                # producer gone
+                pass
+
+    sink.close()
+
+
+class ProcessWriter(CrimsonWriter):
+    """
+    Multi-process writer, one owning process writes to the sink
+
+    Producers in any process (parent, multiprocessing workers, pre-fork
+    children) buffer records locally and ship them to the writer process
+    in batches over a pipe backed queue. A batch is sent once it holds
+    batch_size records or flush_interval_ms after the first buffered record.
+
+    Sink is handed to the writer process by fork, the calling process
+    must not write to it after start()
+
+    Limitations:
+    - Records still buffered in a process are shipped by a multiprocessing
+      finalizer. A child from raw os.fork leaving through os._exit skips
+      it and loses them unless it calls flush() first
+    - Sink metrics (bytes, flushes, rotations, write errors) are recorded
+      in the writer process and never reach the parent's metrics snapshot
+    - flush() with no timeout in a forked child waits for good if the
+      writer process is gone, only the parent can tell it has exited
+    """
+
+    owns_sink = True
+
+    def __init__(self, batch_size: int = 256, flush_interval_ms: int = 50):
+        super().__init__()
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_ms / 1000
+        self._ctx = multiprocessing.get_context("fork")
+        self._queue = self._ctx.Queue()
+        self._process = None
+        self._owner_pid = None
+        self._pid = None
+
+    def set_sink(self, sink: CrimsonSink):
+        self._sink = sink
+        return self
+
+    def start(self):
+        self._process = self._ctx.Process(
+            target=_serve,
+            args=(self._queue, self._sink),
+            name="CrimsonProcessWriter",
+            daemon=True,
+        )
+        self._process.start()
+        self._owner_pid = os.getpid()
+        return self
+
+    def _init_producer(self) -> None:
+        # per process state, recreated after fork
+        self._pid = os.getpid()
+        self._pending = []
+        self._lock = Lock()
+        self._has_pending = Event()
+        # flush acknowledgements from the writer process
+        self._ack_recv = self._ack_send = None
+        self._ack_lock = Lock()
+        self._flush_seq = 0
+        self._acked = 0
+        self._flusher = Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+        # multiprocessing runs finalizers when worker processes exit,
+        # must run before the queue's own close finalizer (exitpriority 10)
+        multiprocessing.util.Finalize(self, self._send_pending, exitpriority=20)
+
+    def _flush_loop(self) -> None:
+        pid = self._pid
+        while pid == os.getpid():
+            self._has_pending.wait()
+            time.sleep(self._flush_interval)
+            self._send_pending()
+
+    def write_to_sink(self, message: str) -> None:
+        if self._pid != os.getpid():
+            self._init_producer()
+
+        with self._lock:
+            self._pending.append(message)
+            if len(self._pending) < self._batch_size:
+                self._has_pending.set()
+                return
+            batch, self._pending = self._pending, []
+            # put under the lock, batches and flush markers keep their order
+            self._queue.put(batch)
+
+    def _send_pending(self) -> None:
+        """
+        Send records buffered in this process to the writer process
+        """
+        if self._pid != os.getpid():
+            return
+
+        with self._lock:
+            self._has_pending.clear()
+            batch, self._pending = self._pending, []
+            if batch:
+                self._queue.put(batch)
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Send records buffered in this process to the writer process and
+        wait until it has written and flushed everything this process sent
+
+        Returns:
+            False if timeout expired or the writer process has exited
+        """
+        if self._pid != os.getpid():
+            # nothing was logged from this process
+            return True
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._has_pending.clear()
+            batch, self._pending = self._pending, []
+            self._flush_seq += 1
+            marker = _FlushMarker(self._pid, self._flush_seq)
+            if self._ack_recv is None:
+                self._ack_recv, self._ack_send = self._ctx.Pipe(duplex=False)
+                marker.ack = self._ack_send
+            # same queue, so the marker reaches the writer after the batches
+            if batch:
+                self._queue.put(batch)
+            self._queue.put(marker)
+
+        return self._wait_ack(marker.seq, deadline)
+
+    def _wait_ack(self, seq: int, deadline: float) -> bool:
+        remaining = None if deadline is None else max(0, deadline - time.monotonic())
+        if not self._ack_lock.acquire(timeout=-1 if remaining is None else remaining):
+            return False
+        try:
+            while self._acked < seq:
+                remaining = _ACK_POLL
+                if deadline is not None:
+                    remaining = min(remaining, deadline - time.monotonic())
+                    if remaining <= 0:
+                        return False
+                if self._ack_recv.poll(remaining):
+                    self._acked = self._ack_recv.recv()
+                elif self._writer_exited():
+                    return False
+            return True
+        finally:
+            self._ack_lock.release()
+
+    def _writer_exited(self) -> bool:
+        # only the process that started the writer can check on it
+        return (
+            self._owner_pid == os.getpid()
+            and self._process is not None
+            and not self._process.is_alive()
+        )
+
+    def stop(self):
+        self._send_pending()
+        self._queue.put(None)
+
+    def join(self, timeout: float = None):
+        if self._process:
+            self._process.join(timeout)
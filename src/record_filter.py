@@ -0,0 +1,147 @@
+import random
+import time
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.namespace_levels import resolve_prefix
+
+
+_MAX_TRACKED_NAMESPACES = 4096
+_SAMPLED_LEVELS = (LogLevel.DEBUG, LogLevel.INFO)
+
+
+class _NamespaceState:
+    """
+    Token bucket and last message of one namespace
+    """
+
+    __slots__ = (
+        "rate",
+        "burst",
+        "tokens",
+        "refilled_at",
+        "sample_rate",
+        "last_message",
+        "last_level",
+        "repeats",
+        "repeats_since",
+    )
+
+    def __init__(self, rate: float, burst: float, sample_rate: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.refilled_at = time.monotonic()
+        self.sample_rate = sample_rate
+        self.last_message = None
+        self.last_level = None
+        self.repeats = 0
+        self.repeats_since = 0.0
+
+
+class RecordFilter:
+    """
+    Per namespace filter stage in front of the writer
+
+    - rate_limits: token bucket per namespace, `rate` records per second
+      with bursts up to rate_limit_burst (defaults to one second of rate,
+      at least one record)
+    - sample_rates: fraction of DEBUG / INFO records kept
+    - dedup: identical consecutive messages (level, template and args) of a
+      namespace are suppressed and summarized as "last message repeated N
+      times" when a different message arrives or every
+      dedup_summary_interval_ms while repeats continue
+
+    Rules are resolved by longest dotted prefix like namespace_levels and
+    cached per namespace string. State is updated without a lock, under
+    concurrent producers counts are approximate.
+    """
+
+    def __init__(self, config: CrimsonLogConfig, emit) -> None:
+        """
+        Args:
+            config (CrimsonLogConfig): rate_limits, rate_limit_burst,
+                sample_rates, dedup and dedup_summary_interval_ms are used
+            emit: callable(log_level, content, namespace) writing a summary
+                line past the filter
+        """
+        self._rate_limits = config.rate_limits
+        self._burst = config.rate_limit_burst
+        self._sample_rates = config.sample_rates
+        self._dedup = config.dedup
+        self._summary_interval = config.dedup_summary_interval_ms / 1000
+        self._emit = emit
+        self._states = {}
+
+    @staticmethod
+    def is_configured(config: CrimsonLogConfig) -> bool:
+        return bool(config.rate_limits or config.sample_rates or config.dedup)
+
+    def _state(self, namespace: str) -> _NamespaceState:
+        rate = resolve_prefix(self._rate_limits, namespace, 0)
+        state = _NamespaceState(
+            rate=rate,
+            # a bucket below one token would never let a record through
+            burst=self._burst or max(1.0, rate),
+            sample_rate=resolve_prefix(self._sample_rates, namespace, 1.0),
+        )
+        if len(self._states) >= _MAX_TRACKED_NAMESPACES:
+            self.flush_summaries()
+            self._states = {}
+        self._states[namespace] = state
+        return state
+
+    def allow(self, log_level: LogLevel, content: str, namespace: str, args: tuple) -> bool:
+        """Decide if a record is passed on to the writer
+
+        Returns:
+            False if record is rate limited, sampled out or a repeat
+        """
+        state = self._states.get(namespace) or self._state(namespace)
+
+        if state.sample_rate < 1.0 and log_level in _SAMPLED_LEVELS:
+            if random.random() >= state.sample_rate:
+                return False
+
+        if self._dedup:
+            last = state.last_message
+            if (
+                last is not None
+                and log_level is state.last_level
+                and content == last[0]
+                and args == last[1]
+            ):
+                state.repeats += 1
+                if time.monotonic() - state.repeats_since >= self._summary_interval:
+                    self._summarize(state, namespace)
+                    state.repeats_since = time.monotonic()
+                return False
+
+            if state.repeats:
+                self._summarize(state, namespace)
+            state.last_message = (content, args)
+            state.last_level = log_level
+            state.repeats_since = time.monotonic()
+
+        if state.rate:
+            now = time.monotonic()
+            state.tokens = min(
+                state.burst, state.tokens + (now - state.refilled_at) * state.rate
+            )
+            state.refilled_at = now
+            if state.tokens < 1:
+                return False
+            state.tokens -= 1
+
+        return True
+
+    def _summarize(self, state: _NamespaceState, namespace: str) -> None:
+        repeats, state.repeats = state.repeats, 0
+        self._emit(state.last_level, f"last message repeated {repeats} times", namespace)
+
+    def flush_summaries(self) -> None:
+        """
+        Emit summaries for repeats still pending, called on logger close
+        """
+        for namespace, state in list(self._states.items()):
+            if state.repeats:
+                self._summarize(state, namespace)
@@ -0,0 +1,38 @@
+from crimson_logger.src.crimson_sink import CrimsonSink
+from crimson_logger.src.crimson_formatter import Formatter
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.log_record import LogRecord
+
+
+class RecordFormattingSink(CrimsonSink):
+    """
+    Formats LogRecords into text before passing them to the wrapped sink
+    Used for deferred formatting: formatting runs wherever the writer
+    calls the sink (writer thread, writer process, executor)
+    """
+
+    def __init__(self, sink: CrimsonSink, formatter: Formatter) -> None:
+        super().__init__()
+        self._sink = sink
+        self._formatter = formatter
+
+    def configure(self, config: CrimsonLogConfig):
+        self._sink.configure(config)
+        return self
+
+    def reconfigure(self, config: CrimsonLogConfig):
+        # formatter is shared with the logger and reconfigured there
+        self._sink.reconfigure(config)
+
+    def write(self, message: LogRecord):
+        self._sink.write(self._formatter.format_record(message))
+
+    def write_batch(self, messages: list[LogRecord]):
+        format_record = self._formatter.format_record
+        self._sink.write_batch([format_record(record) for record in messages])
+
+    def flush(self):
+        self._sink.flush()
+
+    def close(self):
+        self._sink.close()
@@ -0,0 +1,348 @@
+"""
+Spool layout
+
+    segments: `<spool_dir>/<number>.spool`, numbered in write order
+    entries: <I payload length> <B kind> <q spooled at ns> + payload
+
+payload by kind:
+    TEXT_ENTRY:   utf-8 message
+    RECORD_ENTRY: <q timestamp ns> <B level code> <H namespace length>
+                  + utf-8 namespace + utf-8 message
+
+Records are written with one unbuffered write each, so they are in the
+file (not a process buffer) once put() returns.
+"""
+
+from typing import Union
+from crimson_logger.src.binary_record_codec import LEVEL_CODES
+from crimson_logger.src.log_record import LogRecord
+from collections import deque
+from queue import Empty
+from threading import Condition, Lock
+import os
+import struct
+import time
+
+
+TEXT_ENTRY = 0
+RECORD_ENTRY = 1
+SEGMENT_SUFFIX = ".spool"
+
+_ENTRY = struct.Struct("<IBq")
+_RECORD = struct.Struct("<qBH")
+_LEVEL_TO_CODE = {level: code for code, level in enumerate(LEVEL_CODES)}
+_SEGMENT_BYTES = 4_194_304
+_REPLAY_CHUNK = 512
+
+
+def _encode(item: Union[str, LogRecord]) -> bytes:
+    if isinstance(item, str):
+        payload = item.encode("utf-8")
+        kind = TEXT_ENTRY
+    else:
+        namespace = item.namespace.encode("utf-8")
+        try:
+            message = item.get_message()
+        except Exception:
+            # bad template, keep it as logged
+            message = item.message
+        payload = (
+            _RECORD.pack(item.timestamp_ns, _LEVEL_TO_CODE[item.level], len(namespace))
+            + namespace
+            + message.encode("utf-8")
+        )
+        kind = RECORD_ENTRY
+
+    return _ENTRY.pack(len(payload), kind, time.time_ns()) + payload
+
+
+def _decode(kind: int, payload: bytes) -> Union[str, LogRecord]:
+    if kind == TEXT_ENTRY:
+        return payload.decode("utf-8")
+
+    timestamp_ns, level_code, namespace_len = _RECORD.unpack_from(payload)
+    start = _RECORD.size
+    return LogRecord(
+        level=LEVEL_CODES[level_code],
+        timestamp_ns=timestamp_ns,
+        namespace=payload[start : start + namespace_len].decode("utf-8"),
+        message=payload[start + namespace_len :].decode("utf-8"),
+    )
+
+
+class SpillQueue:
+    """
+    FIFO for AsyncWriter that keeps at most `capacity` records in memory
+
+    Once memory is full, records are appended to a spool in spool_dir
+    and every later record follows them there until the writer has
+    replayed the spool, so order is kept. The writer replays the spool
+    in chunks through the same memory queue.
+
+    Spooled records survive a restart: segments left by a previous run
+    are replayed before anything logged by the new one. A segment is
+    deleted when the writer comes back for records after it, a crash
+    in between replays the tail of that segment again.
+
+    Spooled LogRecords keep their fields, template args are interpolated
+    into the message when they are spooled.
+
+    Writer control items (stop / flush requests) never go to disk, they
+    are kept in memory at their position in the stream.
+    """
+
+    def __init__(
+        self, capacity: int, spool_dir: str, segment_bytes: int = _SEGMENT_BYTES
+    ):
+        self._capacity = max(1, capacity)
+        self._spool_dir = spool_dir
+        self._segment_bytes = segment_bytes
+        self._memory = deque()
+        self._not_empty = Condition(Lock())
+        self._controls = deque()  # (spool position, item) while spooling
+        self._written = 0  # records ever appended to spool
+        self._read = 0  # records replayed from spool
+        self._spool_bytes = 0
+        self._segments = deque()  # segment numbers not fully replayed, oldest first
+        self._segment_entries = {}  # records written per segment in _segments
+        self._finished = []  # replayed segments, deleted on next replay
+        self._out = None
+        self._out_segment = None
+        self._out_size = 0
+        self._in = None
+        self._in_segment = None
+        self._in_entries = 0
+        self._last_segment = 0
+        self._replay_lag_ns = 0
+        self.dropped = 0
+
+        os.makedirs(spool_dir, exist_ok=True)
+        self._load_segments()
+
+    def _path(self, segment: int) -> str:
+        return os.path.join(self._spool_dir, f"{segment:010d}{SEGMENT_SUFFIX}")
+
+    def _load_segments(self):
+        """
+        Pick up segments left by a previous run, a torn last entry is cut off
+        """
+        segments = sorted(
+            int(name[: -len(SEGMENT_SUFFIX)])
+            for name in os.listdir(self._spool_dir)
+            if name.endswith(SEGMENT_SUFFIX) and name[: -len(SEGMENT_SUFFIX)].isdigit()
+        )
+
+        for segment in segments:
+            self._last_segment = segment
+            path = self._path(segment)
+            entries, size = self._scan(path)
+            if not entries:
+                os.remove(path)
+                continue
+
+            if size != os.path.getsize(path):
+                print(f"[Error] Dropping incomplete spool entry at end of {path}")
+                os.truncate(path, size)
+
+            self._segments.append(segment)
+            self._segment_entries[segment] = entries
+            self._written += entries
+            self._spool_bytes += size
+
+    @staticmethod
+    def _scan(path: str) -> tuple[int, int]:
+        entries = 0
+        size = 0
+        with open(path, "rb") as f:
+            while True:
+                header = f.read(_ENTRY.size)
+                if len(header) < _ENTRY.size:
+                    break
+                length = _ENTRY.unpack(header)[0]
+                if len(f.read(length)) < length:
+                    break
+                entries += 1
+                size += _ENTRY.size + length
+        return entries, size
+
+    def _spooling(self) -> bool:
+        return (
+            self._written > self._read
+            or bool(self._controls)
+            or len(self._memory) >= self._capacity
+        )
+
+    def put(self, item) -> None:
+        with self._not_empty:
+            if not self._spooling():
+                self._memory.append(item)
+            elif isinstance(item, (str, LogRecord)):
+                self._spill(item)
+            else:
+                self._controls.append((self._written, item))
+            self._not_empty.notify()
+
+    def _spill(self, item: Union[str, LogRecord]) -> None:
+        data = _encode(item)
+        try:
+            if self._out is None or self._out_size >= self._segment_bytes:
+                self._open_segment()
+            self._out.write(data)
+        except OSError as e:
+            # memory must stay bounded, the record is lost
+            print(f"[Error] Error while spooling log record to {self._spool_dir}: {e}")
+            self.dropped += 1
+            return
+
+        self._out_size += len(data)
+        self._spool_bytes += len(data)
+        self._segment_entries[self._out_segment] += 1
+        self._written += 1
+
+    def _open_segment(self) -> None:
+        if self._out is not None:
+            self._out.close()
+        self._last_segment += 1
+        self._out_segment = self._last_segment
+        # unbuffered, records reach the file on every write
+        self._out = open(self._path(self._out_segment), "ab", buffering=0)
+        self._out_size = 0
+        self._segments.append(self._out_segment)
+        self._segment_entries[self._out_segment] = 0
+
+    def get(self, block: bool = True, timeout: float = None):
+        with self._not_empty:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while True:
+                if self._memory:
+                    return self._memory.popleft()
+
+                self._release_finished()
+                if self._written > self._read or self._controls:
+                    self._replay()
+                    continue
+
+                if not block:
+                    raise Empty
+                if deadline is None:
+                    self._not_empty.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise Empty
+                self._not_empty.wait(remaining)
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def _replay(self) -> None:
+        """
+        Move the next chunk of spooled records and controls into memory
+        """
+        while len(self._memory) < _REPLAY_CHUNK:
+            if self._controls and self._controls[0][0] == self._read:
+                self._memory.append(self._controls.popleft()[1])
+                continue
+            if self._read == self._written:
+                break
+
+            try:
+                item = self._read_entry()
+            except (OSError, ValueError, struct.error, KeyError, IndexError) as e:
+                print(f"[Error] Error while replaying spool {self._in_segment}: {e}")
+                self._skip_segment()
+                continue
+            if item is not None:
+                self._memory.append(item)
+
+        if self._read == self._written and self._in is not None:
+            # drained, next spill starts a new segment
+            self._finish_segment()
+
+    def _read_entry(self):
+        if self._in is None:
+            self._in_segment = self._segments[0]
+            self._in_entries = 0
+            self._in = open(self._path(self._in_segment), "rb")
+
+        if self._in_entries == self._segment_entries[self._in_segment]:
+            self._finish_segment()
+            return None
+
+        header = self._in.read(_ENTRY.size)
+        length, kind, spooled_at = _ENTRY.unpack(header)
+        item = _decode(kind, self._in.read(length))
+        self._in_entries += 1
+        self._read += 1
+        self._replay_lag_ns = time.time_ns() - spooled_at
+        return item
+
+    def _finish_segment(self) -> None:
+        if self._in is not None:
+            self._in.close()
+        self._in = None
+        if self._in_segment == self._out_segment:
+            self._out.close()
+            self._out = None
+            self._out_segment = None
+        self._segments.popleft()
+        del self._segment_entries[self._in_segment]
+        self._finished.append(self._in_segment)
+        self._in_segment = None
+
+    def _skip_segment(self) -> None:
+        # unreadable segment, count what it still held as dropped
+        if self._in_segment is None:
+            if not self._segments:
+                self.dropped += self._written - self._read
+                self._read = self._written
+                return
+            self._in_segment = self._segments[0]
+            self._in_entries = 0
+
+        skipped = self._segment_entries.get(self._in_segment, 0) - self._in_entries
+        self.dropped += skipped
+        self._read += skipped
+        self._finish_segment()
+
+    def _release_finished(self) -> None:
+        for segment in self._finished:
+            path = self._path(segment)
+            try:
+                self._spool_bytes -= os.path.getsize(path)
+                os.remove(path)
+            except OSError as e:
+                print(f"[Error] Error while removing spool segment {path}: {e}")
+        self._finished = []
+        if self._written == self._read:
+            self._replay_lag_ns = 0
+
+    def qsize(self) -> int:
+        return len(self._memory) + self._written - self._read
+
+    def empty(self) -> bool:
+        return not self.qsize()
+
+    def stats(self) -> dict:
+        """
+        Records and bytes currently spooled, and how long ago (ms) the
+        record replayed last was spooled
+        """
+        with self._not_empty:
+            return {
+                "records": self._written - self._read,
+                "bytes": self._spool_bytes,
+                "replay_lag_ms": self._replay_lag_ns // 1_000_000,
+                "dropped": self.dropped,
+            }
+
+    def close(self) -> None:
+        """
+        Close segment files, what is still spooled is replayed on next start
+        """
+        with self._not_empty:
+            self._release_finished()
+            for handle in (self._in, self._out):
+                if handle is not None:
+                    handle.close()
+            self._in = self._out = None
@@ -16,3 +16,8 @@ class SyncWriter(CrimsonWriter):
     def write_to_sink(self, message: str):
         with self.lock:
             self._sink.write(message)
+
+    def flush(self, timeout: float = None) -> bool:
+        with self.lock:
+            self._sink.flush()
+        return True
@@ -4,3 +4,6 @@ from enum import Enum
 class WriteMode(str, Enum):
     SYNC = "SYNC"
     ASYNC = "ASYNC"
+    BUFFERED = "BUFFERED"
+    PROCESS = "PROCESS"
+    ASYNCIO = "ASYNCIO"
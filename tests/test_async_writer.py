@@ -0,0 +1,97 @@
+from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.crimson_sink import CrimsonSink
+from crimson_logger.src.async_writer import AsyncWriter
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.write_mode import WriteMode
+from threading import Event
+import pytest
+import time
+
+
+class SlowSink(CrimsonSink):
+    def __init__(self, release: Event):
+        super().__init__()
+        self.release = release
+        self.messages = []
+
+    def configure(self, config):
+        return self
+
+    def write(self, message):
+        self.release.wait()
+        self.messages.append(message)
+
+    def write_batch(self, messages):
+        for message in messages:
+            self.write(message)
+
+
+def _logger(tmp_path, **kwargs):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        file_location=str(tmp_path / "async.log"),
+        write_mode=WriteMode.ASYNC,
+        **kwargs,
+    )
+    return (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+
+@pytest.mark.parametrize("batch_size", [0, 64])
+def test_flush_waits_for_records_logged_before(tmp_path, batch_size):
+    logger = _logger(tmp_path, batch_size=batch_size, flush_interval_ms=60_000)
+
+    for i in range(500):
+        logger.info(f"message {i}", "app")
+    assert logger.flush(timeout=5)
+
+    with open(tmp_path / "async.log") as f:
+        lines = f.readlines()
+    assert len(lines) == 500
+    assert lines[-1].endswith("message 499\n")
+
+    logger.close()
+
+
+@pytest.mark.parametrize("batch_size", [0, 64])
+def test_close_does_not_wait_for_poll_interval(tmp_path, batch_size):
+    logger = _logger(tmp_path, batch_size=batch_size)
+    logger.info("message", "app")
+
+    # idle writer blocks on its queue, stop wakes it right away
+    time.sleep(0.05)
+    started = time.monotonic()
+    logger.close()
+    assert time.monotonic() - started < 0.5
+
+    logger.close()  # second close is a no-op
+    with open(tmp_path / "async.log") as f:
+        assert len(f.readlines()) == 1
+
+
+def test_flush_times_out_on_slow_sink():
+    release = Event()
+    sink = SlowSink(release)
+    writer = AsyncWriter().set_sink(sink)
+    writer.start()
+
+    writer.write_to_sink("stuck")
+    assert not writer.flush(timeout=0.05)
+
+    release.set()
+    assert writer.flush(timeout=5)
+    assert sink.messages == ["stuck"]
+
+    writer.stop()
+    writer.join(timeout=5)
+    assert not writer.is_alive()
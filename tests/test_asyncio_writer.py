@@ -0,0 +1,133 @@
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.write_mode import WriteMode
+from crimson_logger.src.asyncio_writer import AsyncioWriter
+from crimson_logger.src.crimson_sink import CrimsonSink
+import asyncio
+import threading
+import pytest
+
+
+@pytest.fixture
+def config_obj(tmp_path):
+    return CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        write_mode=WriteMode.ASYNCIO,
+        file_location=str(tmp_path / "asyncio.log"),
+        batch_size=8,
+    )
+
+
+def build_logger(config):
+    return (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+
+def read_messages(config):
+    with open(config.file_location, "r") as log_file:
+        return [line.split("] ")[-1] for line in log_file.read().splitlines()]
+
+
+def test_asyncio_writer_aflush_and_aclose(config_obj):
+    logger = build_logger(config_obj)
+
+    async def handler(i):
+        logger.info(f"request {i}", "handler")
+        await asyncio.sleep(0)
+
+    async def main():
+        await asyncio.gather(*(handler(i) for i in range(50)))
+        await logger.aflush()
+        assert read_messages(config_obj) == [f"request {i}" for i in range(50)]
+
+        logger.info("closing", "main")
+        await logger.aclose()
+
+    asyncio.run(main())
+    assert read_messages(config_obj)[-1] == "closing"
+
+
+def test_asyncio_writer_close_after_loop(config_obj):
+    logger = build_logger(config_obj)
+
+    async def main():
+        for i in range(20):
+            logger.info(f"request {i}", "handler")
+
+    asyncio.run(main())
+    logger.info("outside loop", "main")
+    logger.close()
+
+    assert read_messages(config_obj) == [f"request {i}" for i in range(20)] + [
+        "outside loop"
+    ]
+
+
+class StalledSink(CrimsonSink):
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.messages = []
+
+    def configure(self, config):
+        return self
+
+    def write(self, message):
+        self.release.wait()
+        self.messages.append(message)
+
+    def write_batch(self, messages):
+        for message in messages:
+            self.write(message)
+
+
+def test_asyncio_writer_flush_times_out_on_slow_sink():
+    sink = StalledSink()
+    writer = AsyncioWriter().set_sink(sink)
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    loop_thread.start()
+
+    async def log():
+        # first log call inside the loop starts the drain task
+        writer.write_to_sink("stuck")
+
+    asyncio.run_coroutine_threadsafe(log(), loop).result(timeout=5)
+    try:
+        assert not writer.flush(timeout=0.05)
+    finally:
+        # executor threads are joined at exit, never leave them stuck
+        sink.release.set()
+
+    assert writer.flush(timeout=5)
+    assert sink.messages == ["stuck"]
+
+    asyncio.run_coroutine_threadsafe(writer.aclose(), loop).result(timeout=5)
+    loop.call_soon_threadsafe(loop.stop)
+    loop_thread.join(timeout=5)
+    loop.close()
+
+
+def test_asyncio_writer_flush_without_loop_times_out():
+    sink = StalledSink()
+    writer = AsyncioWriter().set_sink(sink)
+
+    writer.write_to_sink("stuck")
+    try:
+        assert not writer.flush(timeout=0.05)
+    finally:
+        sink.release.set()
+
+    assert writer.flush(timeout=5)
+    assert sink.messages == ["stuck"]
+    writer.join()
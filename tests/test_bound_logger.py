@@ -0,0 +1,67 @@
+from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.log_level import LogLevel
+import pytest
+import re
+
+
+def _logger(tmp_path, **kwargs):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        file_location=str(tmp_path / "child.log"),
+        **kwargs,
+    )
+    return (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+
+@pytest.mark.parametrize("deferred_formatting", [False, True])
+def test_child_writes_same_lines_as_parent(tmp_path, deferred_formatting):
+    logger = _logger(tmp_path, deferred_formatting=deferred_formatting)
+    ledger = logger.child("payments.ledger")
+
+    ledger.info("posted %d entries", 3)
+    logger.info("posted %d entries", "payments.ledger", 3)
+    ledger.debug("hidden")
+    ledger.child("audit").error("mismatch")
+    logger.close()
+
+    with open(tmp_path / "child.log") as f:
+        lines = [re.sub(r"\[\d\d-\d\d-\d{4} [\d:]+\]", "[ts]", line) for line in f]
+
+    assert lines == [
+        "[payments.ledger] INFO [ts] posted 3 entries\n",
+        "[payments.ledger] INFO [ts] posted 3 entries\n",
+        "[payments.ledger.audit] ERROR [ts] mismatch\n",
+    ]
+
+
+def test_child_follows_level_changes(tmp_path):
+    logger = _logger(tmp_path)
+    ledger = logger.child("payments.ledger")
+    http = logger.child("http")
+    assert not ledger.is_enabled_for(LogLevel.DEBUG)
+
+    logger.set_namespace_level("payments", LogLevel.DEBUG)
+    assert ledger.is_enabled_for(LogLevel.DEBUG)
+    assert not http.is_enabled_for(LogLevel.DEBUG)
+
+    logger.set_level(LogLevel.ERROR)
+    assert not http.is_enabled_for(LogLevel.WARN)
+    ledger.debug("still on")
+    http.warn("now off")
+    logger.close()
+
+    with open(tmp_path / "child.log") as f:
+        lines = f.readlines()
+    assert len(lines) == 1
+    assert lines[0].startswith("[payments.ledger] DEBUG [")
@@ -0,0 +1,147 @@
+from crimson_logger.src.buffered_writer import BufferedWriter
+from crimson_logger.src.crimson_sink import CrimsonSink
+from crimson_logger.src.overflow_policy import OverflowPolicy
+from threading import Event, Thread
+
+
+class ListSink(CrimsonSink):
+    def __init__(self) -> None:
+        self.messages = []
+
+    def configure(self, config):
+        return self
+
+    def write(self, message: str):
+        self.messages.append(message)
+
+
+def test_buffered_writer_keeps_per_thread_order():
+    sink = ListSink()
+    writer = BufferedWriter(capacity=64).set_sink(sink)
+    writer.start()
+
+    def produce(thread_id):
+        for i in range(500):
+            writer.write_to_sink(f"{thread_id}:{i}")
+
+    threads = [Thread(target=produce, args=(t,)) for t in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.stop()
+    writer.join()
+
+    assert len(sink.messages) == 8 * 500
+    for t in range(8):
+        own = [m for m in sink.messages if m.startswith(f"{t}:")]
+        assert own == [f"{t}:{i}" for i in range(500)]
+    assert writer.dropped_records == 0
+
+
+def test_buffered_writer_drop_policies():
+    for policy, kept in (
+        (OverflowPolicy.DROP_NEWEST, ["0", "1", "2"]),
+        (OverflowPolicy.DROP_OLDEST, ["7", "8", "9"]),
+    ):
+        sink = ListSink()
+        # consolidator is not started until producer is done
+        writer = BufferedWriter(capacity=3, overflow_policy=policy).set_sink(sink)
+        for i in range(10):
+            writer.write_to_sink(str(i))
+
+        assert writer.dropped_records == 7
+        writer.start()
+        writer.stop()
+        writer.join()
+        assert sink.messages == kept
+
+
+def test_buffered_writer_block_waits_for_drain():
+    sink = ListSink()
+    writer = BufferedWriter(capacity=2).set_sink(sink)
+    done = Event()
+
+    def produce():
+        for i in range(5):
+            writer.write_to_sink(str(i))
+        done.set()
+
+    producer = Thread(target=produce)
+    producer.start()
+    assert not done.wait(0.1)
+
+    writer.start()
+    assert done.wait(2)
+    writer.stop()
+    writer.join()
+    producer.join()
+    assert sink.messages == [str(i) for i in range(5)]
+    assert writer.dropped_records == 0
+
+
+def test_buffered_writer_accounts_for_records_logged_during_stop():
+    sink = ListSink()
+    writer = BufferedWriter(capacity=1_000_000).set_sink(sink)
+    writer.start()
+    producing = Event()
+
+    def produce(thread_id):
+        for i in range(20_000):
+            writer.write_to_sink(f"{thread_id}:{i}")
+            producing.set()
+
+    threads = [Thread(target=produce, args=(t,)) for t in range(4)]
+    for thread in threads:
+        thread.start()
+    producing.wait()
+    # stop while producers are still appending
+    writer.stop()
+    writer.join()
+    for thread in threads:
+        thread.join()
+
+    # every record is either written or, once the final drain is done, dropped
+    assert len(sink.messages) + writer.dropped_records == 4 * 20_000
+    for t in range(4):
+        own = [m for m in sink.messages if m.startswith(f"{t}:")]
+        assert own == [f"{t}:{i}" for i in range(len(own))]
+
+
+def test_buffered_writer_drops_records_logged_after_stop():
+    class ClosingSink(ListSink):
+        closed = False
+
+        def write(self, message: str):
+            assert not self.closed
+            super().write(message)
+
+        def flush(self):
+            assert not self.closed
+
+        def close(self):
+            self.closed = True
+
+    sink = ClosingSink()
+    writer = BufferedWriter().set_sink(sink)
+    writer.start()
+    writer.write_to_sink("before")
+    writer.stop()
+    writer.join()
+    sink.close()
+
+    errors = []
+
+    def produce():
+        try:
+            writer.write_to_sink("after")
+        except AssertionError as e:
+            errors.append(e)
+
+    thread = Thread(target=produce)
+    thread.start()
+    thread.join()
+
+    assert not errors
+    assert sink.messages == ["before"]
+    assert writer.dropped_records == 1
@@ -4,6 +4,8 @@ from crimson_logger.src.crimson_file_sink import CrimsonFileSink
 from crimson_logger.src.sync_writer import SyncWriter
 from crimson_logger.src.async_writer import AsyncWriter
 from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.write_mode import WriteMode
 import pytest
 import datetime
 
@@ -109,3 +111,107 @@ def test_05_if_logger_works(config_obj):
             assert log_text == line
     
     logger.close()
+
+
+def test_class_06_async_writer_batched(tmp_path):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        file_location=str(tmp_path / "batched.log"),
+    )
+    sink = CrimsonFileSink().configure(config)
+    writer = AsyncWriter(batch_size=16, flush_records=32).set_sink(sink)
+    writer.start()
+
+    messages = [f"Batched message {i}" for i in range(100)]
+    for msg in messages:
+        writer.write_to_sink(msg)
+    writer.stop()
+    writer.join()
+
+    with open(config.file_location, "r") as log_file:
+        assert log_file.read().splitlines() == messages
+
+
+def test_07_deferred_formatting(tmp_path):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        write_mode=WriteMode.ASYNC,
+        file_location=str(tmp_path / "deferred.log"),
+        deferred_formatting=True,
+    )
+    logger = (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+    class Unformattable:
+        def __str__(self):
+            raise AssertionError("disabled level must not interpolate")
+
+    logger.debug("skipped %s", "test_07", Unformattable())
+    logger.info("user %s logged in", "test_07", "bob")
+    logger.close()
+
+    with open(config.file_location, "r") as log_file:
+        lines = log_file.read().splitlines()
+
+    assert len(lines) == 1
+    assert lines[0].startswith("[test_07] INFO [")
+    assert lines[0].endswith("] user bob logged in")
+
+
+def test_08_disabled_levels_and_set_level(tmp_path):
+    class ListWriter(SyncWriter):
+        def __init__(self):
+            super().__init__()
+            self.messages = []
+
+        def write_to_sink(self, message: str):
+            self.messages.append(message)
+
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.WARN,
+        file_location=str(tmp_path / "levels.log"),
+    )
+    writer = ListWriter()
+    logger = (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .with_custom_writer(writer)
+        .set_formatter()
+        .build()
+    )
+
+    assert not logger.is_enabled_for(LogLevel.INFO)
+    assert logger.is_enabled_for(LogLevel.ERROR)
+    assert "debug" in logger.__dict__ and "warn" not in logger.__dict__
+
+    logger.debug("dropped", "test_08")
+    logger.info("dropped", "test_08")
+    logger.warn("kept", "test_08")
+    assert len(writer.messages) == 1
+
+    logger.set_level(LogLevel.DEBUG)
+    assert logger.is_enabled_for(LogLevel.DEBUG)
+    logger.debug("kept", "test_08")
+    assert len(writer.messages) == 2
+
+    logger.set_level(LogLevel.FATAL)
+    logger.error("dropped", "test_08")
+    logger.write_log(LogLevel.ERROR, "dropped", "test_08")
+    assert len(writer.messages) == 2
+    logger.close()
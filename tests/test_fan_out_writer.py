@@ -0,0 +1,246 @@
+from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.crimson_sink import CrimsonSink
+from crimson_logger.src.fan_out_writer import FanOutWriter
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.log_record import LogRecord
+from crimson_logger.src.overflow_policy import OverflowPolicy
+from threading import Event
+import threading
+import time
+
+
+class ListSink(CrimsonSink):
+    def __init__(self) -> None:
+        self.messages = []
+        self.closed = False
+
+    def configure(self, config):
+        return self
+
+    def write(self, message: str):
+        self.messages.append(message)
+
+    def close(self):
+        self.closed = True
+
+
+class StalledSink(ListSink):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = Event()
+
+    def write(self, message: str):
+        self.release.wait()
+        super().write(message)
+
+
+def _record(level: str, message: str) -> LogRecord:
+    return LogRecord(level, time.time_ns(), "fanout", message, ())
+
+
+def test_fan_out_slow_sink_does_not_stall_others():
+    fast, slow = ListSink(), StalledSink()
+    writer = (
+        FanOutWriter(capacity=5, overflow_policy=OverflowPolicy.DROP_NEWEST)
+        .add_sink(fast, name="fast", capacity=1000)
+        .add_sink(slow, name="slow")
+    )
+    writer.start()
+
+    for i in range(100):
+        writer.write_to_sink(_record("INFO", str(i)))
+
+    deadline = time.monotonic() + 5
+    while len(fast.messages) < 100 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(fast.messages) == 100
+
+    lag = writer.sink_lag()
+    assert lag["fast"]["written"] == 100 and lag["fast"]["dropped"] == 0
+    assert lag["slow"]["dropped"] > 0
+    assert lag["slow"]["depth"] <= 5
+
+    slow.release.set()
+    writer.stop()
+    writer.join()
+    assert fast.closed and slow.closed
+    assert len(slow.messages) == 100 - lag["slow"]["dropped"]
+
+
+def test_builder_add_sink_with_per_sink_level(tmp_path):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        file_location=str(tmp_path / "main.log"),
+    )
+    errors = ListSink()
+    everything = ListSink()
+    logger = (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .add_sink(errors, log_level=LogLevel.ERROR, name="errors")
+        .add_sink(everything, log_level=LogLevel.DEBUG)
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+    logger.debug("details %s", "app", 1)
+    logger.info("started", "app")
+    logger.error("failed", "app")
+    logger.close()
+
+    lines = (tmp_path / "main.log").read_text().splitlines()
+    assert [line.split("] ")[-1] for line in lines] == ["started", "failed"]
+    assert [m.split("] ")[-1] for m in errors.messages] == ["failed"]
+    assert [m.split("] ")[-1] for m in everything.messages] == [
+        "details 1",
+        "started",
+        "failed",
+    ]
+    assert errors.messages[0].startswith("[app] ERROR [")
+
+
+def test_fan_out_keeps_namespace_levels_for_main_sink(tmp_path):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.WARN,
+        file_location=str(tmp_path / "main.log"),
+        namespace_levels={"payments": LogLevel.DEBUG},
+    )
+    errors = ListSink()
+    everything = ListSink()
+    logger = (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .add_sink(errors, log_level=LogLevel.ERROR, name="errors")
+        .add_sink(everything, log_level=LogLevel.DEBUG, name="everything")
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+    for level in ("debug", "info", "warn", "error"):
+        getattr(logger, level)(level, "http")
+        getattr(logger, level)(level, "payments.ledger")
+    logger.close()
+
+    lines = (tmp_path / "main.log").read_text().splitlines()
+    assert [line.split(" [")[0] for line in lines] == [
+        "[payments.ledger] DEBUG",
+        "[payments.ledger] INFO",
+        "[http] WARN",
+        "[payments.ledger] WARN",
+        "[http] ERROR",
+        "[payments.ledger] ERROR",
+    ]
+    assert [m.split(" [")[0] for m in errors.messages] == [
+        "[http] ERROR",
+        "[payments.ledger] ERROR",
+    ]
+    assert len(everything.messages) == 8
+
+
+def test_drop_oldest_keeps_flush_requests_and_stop():
+    class SlowSink(ListSink):
+        def write(self, message):
+            time.sleep(0.001)
+            super().write(message)
+
+    sink = SlowSink()
+    writer = FanOutWriter(
+        capacity=4, overflow_policy=OverflowPolicy.DROP_OLDEST, batch_size=1
+    ).add_sink(sink, name="slow")
+    writer.start()
+
+    stop = Event()
+
+    def produce():
+        while not stop.is_set():
+            writer.write_to_sink(_record("INFO", "spam"))
+
+    producers = [threading.Thread(target=produce) for _ in range(2)]
+    for producer in producers:
+        producer.start()
+
+    try:
+        for _ in range(10):
+            assert writer.flush(timeout=2)
+    finally:
+        stop.set()
+        for producer in producers:
+            producer.join()
+
+    writer.stop()
+    writer.join()
+    assert sink.closed
+    assert writer.dropped_records > 0
+
+
+def test_builder_added_sink_does_not_block_caller_by_default(tmp_path):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        file_location=str(tmp_path / "main.log"),
+        thread_buffer_capacity=10,
+    )
+    slow = StalledSink()
+    logger = (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .add_sink(slow, name="slow")
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+    done = Event()
+
+    def produce():
+        for i in range(100):
+            logger.info(str(i), "app")
+        done.set()
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        assert done.wait(2)
+        assert logger._writer.sink_lag()["slow"]["dropped"] > 0
+    finally:
+        slow.release.set()
+        producer.join()
+        logger.close()
+
+    assert len((tmp_path / "main.log").read_text().splitlines()) == 100
+
+
+def test_fan_out_flush_times_out_on_full_stalled_sink():
+    slow = StalledSink()
+    writer = FanOutWriter(
+        capacity=2, overflow_policy=OverflowPolicy.DROP_NEWEST, batch_size=1
+    ).add_sink(slow, name="slow")
+    writer.start()
+
+    try:
+        for i in range(10):
+            writer.write_to_sink(_record("INFO", str(i)))
+
+        started = time.monotonic()
+        assert not writer.flush(timeout=0.2)
+        assert time.monotonic() - started < 1
+    finally:
+        slow.release.set()
+
+    assert writer.flush(timeout=2)
+    writer.stop()
+    writer.join()
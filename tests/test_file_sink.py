@@ -0,0 +1,217 @@
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.crimson_file_sink import CrimsonFileSink
+from crimson_logger.src.crimson_mmap_file_sink import CrimsonMmapFileSink
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.log_record import LogRecord
+from crimson_logger.src.file_format import FileFormat
+from crimson_logger.src.binary_record_codec import iter_records
+from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
+from crimson_logger.src.config_exception import ConfigException
+from crimson_logger.src import crimson_log_decoder
+import datetime
+import gzip
+import os
+import pytest
+
+
+@pytest.fixture
+def config_obj(tmp_path):
+    return CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        file_location=str(tmp_path / "rotate.log"),
+    )
+
+
+def test_rotation_boundary(config_obj):
+    # 10 byte lines, limit 35: rotates once 40 bytes are on disk
+    sink = CrimsonFileSink().configure(config_obj, max_file_size=35)
+    for i in range(5):
+        sink.write(f"message-{i}")
+    sink.close()
+
+    with gzip.open(f"{config_obj.file_location}.1.gz", "rt") as archive:
+        assert archive.read().splitlines() == [f"message-{i}" for i in range(4)]
+
+    with open(config_obj.file_location, "r") as log_file:
+        assert log_file.read().splitlines() == ["message-4"]
+
+
+def test_rotation_counts_existing_content(config_obj):
+    with open(config_obj.file_location, "w") as log_file:
+        log_file.write("previous-\n" * 3)
+
+    sink = CrimsonFileSink().configure(config_obj, max_file_size=35)
+    sink.write("message-0")
+    assert not os.path.exists(f"{config_obj.file_location}.1.gz")
+
+    sink.write("message-1")
+    sink.close()
+    with gzip.open(f"{config_obj.file_location}.1.gz", "rt") as archive:
+        assert archive.read().splitlines() == ["previous-"] * 3 + ["message-0"]
+
+
+def test_rotation_counts_encoded_bytes(config_obj):
+    # 2 byte chars, 9 chars + newline is 19 bytes on disk
+    sink = CrimsonFileSink().configure(config_obj, max_file_size=35)
+    for _ in range(3):
+        sink.write("é" * 9)
+    sink.close()
+
+    assert os.path.exists(f"{config_obj.file_location}.1.gz")
+
+
+def test_rotation_continues_archive_sequence(config_obj):
+    for i in (1, 2):
+        with gzip.open(f"{config_obj.file_location}.{i}.gz", "wt") as archive:
+            archive.write(f"archive-{i}\n")
+    # rotated but not compressed before previous process exited
+    with open(f"{config_obj.file_location}.3", "w") as rotated:
+        rotated.write("archive-3\n")
+
+    sink = CrimsonFileSink().configure(config_obj, max_file_size=5)
+    sink.write("message-0")
+    sink.write("message-1")
+    sink.close()
+
+    with gzip.open(f"{config_obj.file_location}.3.gz", "rt") as archive:
+        assert archive.read() == "archive-3\n"
+    with gzip.open(f"{config_obj.file_location}.4.gz", "rt") as archive:
+        assert archive.read() == "message-0\n"
+    assert not os.path.exists(f"{config_obj.file_location}.3")
+    assert not os.path.exists(f"{config_obj.file_location}.4")
+
+
+def test_mmap_sink_rolls_segments_and_truncates_tail(config_obj):
+    sink = CrimsonMmapFileSink().configure(config_obj, max_file_size=35)
+    assert os.path.getsize(config_obj.file_location) == 35
+
+    for i in range(5):
+        sink.write(f"message-{i}")
+    sink.close()
+
+    with gzip.open(f"{config_obj.file_location}.1.gz", "rt") as archive:
+        assert archive.read().splitlines() == [f"message-{i}" for i in range(3)]
+
+    with open(config_obj.file_location, "r") as log_file:
+        assert log_file.read() == "message-3\nmessage-4\n"
+
+
+def test_mmap_sink_rejects_binary_format(config_obj):
+    config_obj.sink_type = "MMAP"
+    config_obj.file_format = FileFormat.BINARY
+    with pytest.raises(ConfigException):
+        CrimsonLoggerBuilder().with_config(None, custom_config=config_obj).set_sink()
+    assert not os.path.exists(config_obj.file_location)
+
+
+def test_mmap_sink_appends_to_existing_file(config_obj):
+    sink = CrimsonMmapFileSink().configure(config_obj, max_file_size=1024)
+    sink.write_batch(["message-0", "message-1"])
+    # simulate crash: mapping never truncated, file still preallocated
+    sink._map.flush()
+
+    sink = CrimsonMmapFileSink().configure(config_obj, max_file_size=1024)
+    sink.write("message-2")
+    sink.close()
+
+    with open(config_obj.file_location, "r") as log_file:
+        assert log_file.read() == "message-0\nmessage-1\nmessage-2\n"
+
+
+def test_binary_format_round_trip(config_obj):
+    config_obj.file_format = FileFormat.BINARY
+    sink = CrimsonFileSink().configure(config_obj, max_file_size=100)
+    assert sink.accepts_records
+
+    records = [
+        LogRecord("INFO", 1_700_000_000_000_000_000 + i, f"ns{i % 2}", f"message {i}")
+        for i in range(6)
+    ]
+    sink.write(records[0])
+    sink.write_batch(records[1:5])
+    # after rotation namespaces are defined again in the new file
+    sink.write(LogRecord("ERROR", 1, "ns1", "user %s", ("bob",)))
+    sink.close()
+
+    decoded = []
+    for path in (f"{config_obj.file_location}.1.gz", config_obj.file_location):
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rb") as stream:
+            decoded += [
+                (r.level, r.timestamp_ns, r.namespace, r.message)
+                for r in iter_records(stream)
+            ]
+
+    expected = [(r.level, r.timestamp_ns, r.namespace, r.message) for r in records[:5]]
+    assert decoded == expected + [("ERROR", 1, "ns1", "user bob")]
+
+
+def test_decoder_cli_renders_binary_log(config_obj, capsys):
+    config_obj.file_format = FileFormat.BINARY
+    sink = CrimsonFileSink().configure(config_obj, max_file_size=60)
+    ts = int(datetime.datetime(2024, 1, 2, 3, 4, 5).timestamp()) * 1_000_000_000
+    sink.write_batch(
+        [
+            LogRecord("INFO", ts, "app", "started"),
+            LogRecord("WARN", ts + 1_000_000_000, "app.db", "slow query %dms", (42,)),
+        ]
+    )
+    sink.write(LogRecord("ERROR", ts + 2_000_000_000, "app", "failed"))
+    sink.close()
+
+    crimson_log_decoder.main(
+        [
+            f"{config_obj.file_location}.1.gz",
+            config_obj.file_location,
+            "--ts-format",
+            "yyyy-mm-dd hh:MM:ss",
+        ]
+    )
+
+    assert capsys.readouterr().out.splitlines() == [
+        "[app] INFO [2024-01-02 03:04:05] started",
+        "[app.db] WARN [2024-01-02 03:04:06] slow query 42ms",
+        "[app] ERROR [2024-01-02 03:04:07] failed",
+    ]
+
+
+def test_bytes_io_matches_text_path(config_obj, tmp_path):
+    messages = [f"message-{i} é" for i in range(50)] + ["x" * 100]
+    text_config = config_obj
+    bytes_config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        file_location=str(tmp_path / "bytes.log"),
+        bytes_io=True,
+    )
+
+    for config in (text_config, bytes_config):
+        sink = CrimsonFileSink().configure(config, max_file_size=400)
+        sink.write("first")
+        for start in range(0, len(messages), 7):
+            sink.write_batch(messages[start : start + 7])
+            sink.flush()
+        sink.close()
+
+    def read_all(path):
+        archives = sorted(
+            (p for p in os.listdir(tmp_path) if p.startswith(os.path.basename(path) + ".")),
+            key=lambda name: int(name.split(".")[2]),
+        )
+        lines = []
+        for name in archives:
+            with gzip.open(tmp_path / name, "rt", encoding="utf-8") as archive:
+                lines += archive.read().splitlines()
+        with open(path, encoding="utf-8") as log_file:
+            return lines + log_file.read().splitlines(), len(archives)
+
+    text_lines, text_archives = read_all(text_config.file_location)
+    bytes_lines, bytes_archives = read_all(bytes_config.file_location)
+    assert bytes_lines == ["first"] + messages
+    assert bytes_lines == text_lines
+    assert bytes_archives == text_archives > 0
@@ -1,7 +1,11 @@
 from crimson_logger.src.crimson_config_parser import CrimsonConfigParser
 from crimson_logger.src.crimson_log_config import CrimsonLogConfig
 from crimson_logger.src.crimson_formatter import Formatter
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.log_record import LogRecord, interpolate
+from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
 import datetime
+import threading
 
 
 def test_formatter_class():
@@ -20,3 +24,116 @@ def test_formatter_class():
     test_ts = datetime.datetime.now().strftime("%d-%m-%Y %H:%M:%S")
 
     assert formatted_text == f"[{namespace}] {log_level} [{test_ts}] {msg}"
+
+
+def test_format_record_uses_record_timestamp():
+    config_obj = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+    )
+    formatter = Formatter().configure(config_obj)
+    ts = datetime.datetime(2024, 1, 2, 3, 4, 5)
+    record = LogRecord(
+        "WARN", int(ts.timestamp() * 1e9), "deferred", "user %s took %dms", ("bob", 12)
+    )
+
+    assert (
+        formatter.format_record(record)
+        == "[deferred] WARN [02-01-2024 03:04:05] user bob took 12ms"
+    )
+
+    record = LogRecord("INFO", int(ts.timestamp() * 1e9), "deferred", "{} of {}", (1, 2))
+    assert formatter.format_record(record).endswith("] 1 of 2")
+
+
+def test_cached_timestamp_across_second_boundary():
+    config_obj = CrimsonLogConfig(
+        ts_format="hh:MM:ss.SSS",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+    )
+    formatter = Formatter().configure(config_obj)
+    base = int(datetime.datetime(2024, 1, 2, 3, 4, 5).timestamp()) * 1_000_000_000
+
+    def ts_of(offset_ms):
+        record = LogRecord("INFO", base + offset_ms * 1_000_000, "ns", "msg")
+        return formatter.format_record(record).split("[")[2].split("]")[0]
+
+    assert ts_of(0) == "03:04:05.000"
+    assert ts_of(999) == "03:04:05.999"
+    assert ts_of(1000) == "03:04:06.000"
+    # late record from previous second after cache moved on
+    assert ts_of(998) == "03:04:05.998"
+
+
+def test_cached_formatter_concurrent_use():
+    config_obj = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+    )
+    formatter = Formatter().configure(config_obj)
+    base = int(datetime.datetime(2024, 1, 2, 3, 4, 5).timestamp()) * 1_000_000_000
+    errors = []
+
+    def format_many(thread_id):
+        for i in range(2000):
+            second = (i + thread_id) % 5
+            record = LogRecord("INFO", base + second * 1_000_000_000, f"t{thread_id}", "m")
+            expected = f"[t{thread_id}] INFO [02-01-2024 03:04:0{5 + second}] m"
+            if formatter.format_record(record) != expected:
+                errors.append(record)
+
+    threads = [threading.Thread(target=format_many, args=(t,)) for t in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+
+
+def test_interpolate_mixed_templates():
+    assert interpolate("{} done 50%", ("upload",)) == "upload done 50%"
+    assert interpolate("%s done 50%%", ("upload",)) == "upload done 50%"
+    assert interpolate("{} of {}", (1, 2)) == "1 of 2"
+    # literal % next to {} fields is not read as a %-specifier
+    assert interpolate("{} used 50% of disk", (7,)) == "7 used 50% of disk"
+    assert interpolate("rate {}% ok", (5,)) == "rate 5% ok"
+    assert interpolate("{:>3}% done", (7,)) == "  7% done"
+    # a %-specifier wins, braces are then literal
+    assert interpolate("%s={x}", ("a",)) == "a={x}"
+    # neither style fits, nothing is raised on the caller's thread
+    assert interpolate("%d items {}{}", ("x",)) == "%d items {}{} args=('x',)"
+
+
+def test_logger_mixed_template_is_written(tmp_path):
+    for deferred in (False, True):
+        config = CrimsonLogConfig(
+            ts_format="dd-mm-yyyy hh:MM:ss",
+            db_ip_address=None,
+            db_port="",
+            log_level=LogLevel.INFO,
+            file_location=str(tmp_path / f"mixed-{deferred}.log"),
+            deferred_formatting=deferred,
+        )
+        logger = (
+            CrimsonLoggerBuilder()
+            .with_config(None, custom_config=config)
+            .set_sink()
+            .set_writer()
+            .set_formatter()
+            .build()
+        )
+        logger.info("{} done 50%", "upload", "backup")
+        logger.info("{} used 50% of disk", "upload", 7)
+        logger.close()
+
+        lines = (tmp_path / f"mixed-{deferred}.log").read_text().splitlines()
+        assert len(lines) == 2
+        assert lines[0].endswith("] backup done 50%")
+        assert lines[1].endswith("] 7 used 50% of disk")
@@ -0,0 +1,152 @@
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.crimson_file_sink import CrimsonFileSink
+from crimson_logger.src.crimson_mmap_file_sink import CrimsonMmapFileSink
+from crimson_logger.src.crimson_formatter import Formatter
+from crimson_logger.src.crimson_log_reader import CrimsonLogReader
+from crimson_logger.src import crimson_log_reader
+from crimson_logger.src.block_archive import open_at, write_block_archive
+from crimson_logger.src.file_format import FileFormat
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.log_record import LogRecord
+import datetime
+import gzip
+import os
+import pytest
+
+BASE_NS = int(datetime.datetime(2024, 1, 2, 3, 0, 0).timestamp()) * 1_000_000_000
+SECOND = 1_000_000_000
+
+
+@pytest.fixture(params=[FileFormat.TEXT, FileFormat.BINARY])
+def config_obj(tmp_path, request):
+    return CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.DEBUG,
+        file_location=str(tmp_path / "query.log"),
+        file_format=request.param,
+        archive_index=True,
+        index_interval=10,
+    )
+
+
+def write_records(config_obj):
+    """
+    60 records one second apart, INFO except every 20th is ERROR,
+    namespace changes every 20 records, file rotates every ~20 records
+    """
+    max_size = 1100 if config_obj.file_format == FileFormat.TEXT else 700
+    sink = CrimsonFileSink().configure(config_obj, max_file_size=max_size)
+    formatter = Formatter().configure(config_obj)
+    records = []
+    for i in range(60):
+        level = "ERROR" if i % 20 == 5 else "INFO"
+        namespace = ["payments.ledger", "http", "payments.api"][i // 20]
+        records.append(LogRecord(level, BASE_NS + i * SECOND, namespace, f"record {i}"))
+
+    for record in records:
+        sink.write(record if sink.accepts_records else formatter.format_record(record))
+    sink.close()
+    return records
+
+
+def messages(records):
+    return [record.message for record in records]
+
+
+def test_query_across_archives(config_obj):
+    records = write_records(config_obj)
+    reader = CrimsonLogReader(config_obj)
+    assert os.path.exists(config_obj.file_location + ".1.idx")
+
+    assert messages(reader.query()) == messages(records)
+    assert messages(
+        reader.query(start_ns=BASE_NS + 15 * SECOND, end_ns=BASE_NS + 44 * SECOND)
+    ) == [f"record {i}" for i in range(15, 45)]
+    assert messages(reader.query(levels=[LogLevel.ERROR])) == [
+        "record 5",
+        "record 25",
+        "record 45",
+    ]
+    assert messages(reader.query(namespaces=["payments.*"], levels=["ERROR"])) == [
+        "record 5",
+        "record 45",
+    ]
+
+
+def test_query_skips_archives_without_decompressing(config_obj, monkeypatch):
+    write_records(config_obj)
+    opened = []
+    real_open = gzip.open
+
+    def counting_open(path, *args, **kwargs):
+        opened.append(path)
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(crimson_log_reader.gzip, "open", counting_open)
+    reader = CrimsonLogReader(config_obj)
+
+    assert list(reader.query(levels=["DEBUG"])) == []
+    assert list(reader.query(namespaces=["grpc.*"])) == []
+    assert opened == []
+
+    assert messages(reader.query(start_ns=BASE_NS + 59 * SECOND)) == ["record 59"]
+    assert config_obj.file_location + ".1.gz" not in opened
+
+
+def test_query_block_compressed_archives(config_obj):
+    config_obj.archive_block_size = 128
+    records = write_records(config_obj)
+    archive = config_obj.file_location + ".1.gz"
+    assert os.path.exists(config_obj.file_location + ".1.blocks")
+
+    # still a valid gzip stream for standard tools
+    with gzip.open(archive, "rb") as stream:
+        assert stream.read()
+
+    reader = CrimsonLogReader(config_obj)
+    assert messages(reader.query()) == messages(records)
+    assert messages(
+        reader.query(start_ns=BASE_NS + 12 * SECOND, end_ns=BASE_NS + 16 * SECOND)
+    ) == [f"record {i}" for i in range(12, 17)]
+
+
+def test_block_archive_random_access(tmp_path):
+    data = b"".join(b"line %d\n" % i for i in range(5000))
+    raw = tmp_path / "raw.log"
+    raw.write_bytes(data)
+
+    table = write_block_archive(str(raw), str(tmp_path / "raw.log.gz"), 1000)
+    assert len(table) == len(data) // 1000 + 1
+    with gzip.open(tmp_path / "raw.log.gz", "rb") as stream:
+        assert stream.read() == data
+
+    for offset in (0, 999, 1000, 1001, 20_000, len(data) - 5):
+        with open_at(str(tmp_path / "raw.log.gz"), table, offset) as stream:
+            assert stream.read(50) == data[offset : offset + 50]
+
+
+def test_query_live_mmap_file(tmp_path):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.DEBUG,
+        sink_type="MMAP",
+        file_location=str(tmp_path / "mmap.log"),
+    )
+    sink = CrimsonMmapFileSink().configure(config, max_file_size=64 * 1024)
+    formatter = Formatter().configure(config)
+    for i in range(5):
+        record = LogRecord("INFO", BASE_NS + i * SECOND, "app", f"record {i}")
+        sink.write(formatter.format_record(record))
+    sink.flush()
+
+    try:
+        # segment is still mapped, its preallocated tail is zero filled
+        assert os.path.getsize(config.file_location) == 64 * 1024
+        found = list(CrimsonLogReader(config).query())
+        assert messages(found) == [f"record {i}" for i in range(5)]
+    finally:
+        sink.close()
@@ -0,0 +1,106 @@
+from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.write_mode import WriteMode
+from crimson_logger.src.crimson_metrics import CrimsonMetrics
+from threading import Thread
+
+
+def _build(tmp_path, **overrides):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        file_location=str(tmp_path / "metrics.log"),
+        enable_metrics=True,
+        **overrides,
+    )
+    return (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+
+def test_metrics_count_records_and_sink_io(tmp_path):
+    logger = _build(tmp_path, write_mode=WriteMode.ASYNC, batch_size=64)
+
+    def produce():
+        for i in range(200):
+            logger.info("message %d", "metrics", i)
+            logger.debug("hidden", "metrics")
+
+    threads = [Thread(target=produce) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    logger.error("boom", "metrics")
+    logger.close()
+
+    snapshot = logger.metrics_snapshot()
+    assert snapshot["records"]["accepted"] == {"INFO": 800, "ERROR": 1}
+    assert snapshot["records"]["filtered"] == {"DEBUG": 800}
+    assert snapshot["enqueue_latency_ns"]["count"] == 801
+    assert sum(snapshot["enqueue_latency_ns"]["buckets"].values()) == 801
+    assert snapshot["queue"]["depth"] == 0
+    assert 1 <= snapshot["queue"]["high_water_mark"] <= 801
+    assert snapshot["sink"]["bytes_written"] == (tmp_path / "metrics.log").stat().st_size
+    assert snapshot["sink"]["flush_count"] >= 1
+    assert snapshot["sink"]["write_errors"] == 0
+
+
+def test_metrics_rotation_and_disabled(tmp_path):
+    logger = _build(tmp_path)
+    logger._sink._max_file_size = 200
+    for i in range(50):
+        logger.info(f"line {i}", "metrics")
+    logger.close()
+
+    sink = logger.metrics_snapshot()["sink"]
+    assert sink["rotation_count"] >= 1
+    assert sink["rotation_ns"] > 0
+    assert sink["flush_count"] >= 50
+
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        file_location=str(tmp_path / "plain.log"),
+    )
+    plain = (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+    plain.close()
+    assert plain.metrics is None
+    assert plain.metrics_snapshot() == {}
+
+
+def test_metrics_retire_shards_of_exited_threads():
+    metrics = CrimsonMetrics()
+
+    def work():
+        metrics.record_accepted("INFO")
+        metrics.observe_queue_depth(7)
+        metrics.add_bytes_written(10)
+
+    for _ in range(200):
+        thread = Thread(target=work)
+        thread.start()
+        thread.join()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["records"]["accepted"] == {"INFO": 200}
+    assert snapshot["queue"]["high_water_mark"] == 7
+    assert snapshot["sink"]["bytes_written"] == 2000
+    assert len(metrics._shards) <= 1
@@ -0,0 +1,60 @@
+from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.namespace_levels import (
+    NamespaceThresholds,
+    parse_namespace_levels,
+)
+
+
+def test_longest_dotted_prefix_wins_and_is_cached():
+    thresholds = NamespaceThresholds(
+        LogLevel.WARN, parse_namespace_levels("payments.*=DEBUG,payments.ledger.audit=ERROR,http=error")
+    )
+
+    assert thresholds["payments"] == LogLevel.DEBUG.ordinal
+    assert thresholds["payments.ledger"] == LogLevel.DEBUG.ordinal
+    assert thresholds["payments.ledger.audit.x"] == LogLevel.ERROR.ordinal
+    assert thresholds["http"] == LogLevel.ERROR.ordinal
+    # prefix must end on a dot boundary
+    assert thresholds["httpx"] == LogLevel.WARN.ordinal
+    assert thresholds["orders"] == LogLevel.WARN.ordinal
+    assert "payments.ledger" in thresholds
+    assert thresholds.floor == LogLevel.DEBUG
+
+
+def test_logger_namespace_rules_and_runtime_change(tmp_path):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.WARN,
+        file_location=str(tmp_path / "ns.log"),
+        namespace_levels={"payments.ledger": LogLevel.DEBUG},
+    )
+    logger = (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+    logger.debug("posted", "payments.ledger.entries")
+    logger.debug("hidden", "payments")
+    logger.info("hidden", "http")
+    logger.warn("slow", "http")
+    assert logger.is_enabled_for(LogLevel.DEBUG, "payments.ledger")
+    assert not logger.is_enabled_for(LogLevel.DEBUG, "orders")
+
+    logger.set_namespace_level("payments.ledger.*", None)
+    logger.set_namespace_level("http", LogLevel.INFO)
+    logger.debug("hidden", "payments.ledger.entries")
+    logger.info("request", "http")
+    # no DEBUG rule left, debug() is a no-op again
+    assert "debug" in logger.__dict__
+    logger.close()
+
+    lines = (tmp_path / "ns.log").read_text().splitlines()
+    assert [line.split("] ")[-1] for line in lines] == ["posted", "slow", "request"]
@@ -0,0 +1,105 @@
+from crimson_logger.src.crimson_network_sink import CrimsonNetworkSink, FRAME_HEADER
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.log_level import LogLevel
+import socket
+import socketserver
+import threading
+
+
+class FrameHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        stream = self.request.makefile("rb")
+        try:
+            while True:
+                header = stream.read(FRAME_HEADER.size)
+                if len(header) < FRAME_HEADER.size:
+                    return
+                (length,) = FRAME_HEADER.unpack(header)
+                self.server.frames.append(stream.read(length))
+        finally:
+            self.server.disconnected.set()
+
+
+def _serve(port: int = 0):
+    socketserver.ThreadingTCPServer.allow_reuse_address = True
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", port), FrameHandler)
+    server.daemon_threads = True
+    server.frames = []
+    server.disconnected = threading.Event()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _config(port: int, **overrides) -> CrimsonLogConfig:
+    return CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address="127.0.0.1",
+        db_port=str(port),
+        log_level=LogLevel.INFO,
+        sink_type="NETWORK",
+        **overrides,
+    )
+
+
+def _lines(frames: list[bytes]) -> list[str]:
+    return [line for frame in frames for line in frame.decode().splitlines()]
+
+
+def test_network_sink_sends_batches_as_frames():
+    server = _serve()
+    sink = CrimsonNetworkSink().configure(_config(server.server_address[1]))
+
+    sink.write_batch([f"record {i}" for i in range(100)])
+    sink.flush()
+    sink.write("single")
+    sink.close()
+    assert server.disconnected.wait(5)
+    server.shutdown()
+    server.server_close()
+
+    assert len(server.frames) == 2
+    assert _lines(server.frames) == [f"record {i}" for i in range(100)] + ["single"]
+
+
+def test_network_sink_buffers_while_peer_is_down_and_reconnects():
+    probe = socket.socket()
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+
+    sink = CrimsonNetworkSink().configure(
+        _config(port, network_buffer_bytes=50, network_backoff_max_ms=1000)
+    )
+    for i in range(10):
+        sink.write(f"line {i}")  # 7 bytes each with newline
+
+    # only the newest records fitting the buffer are kept
+    assert sink.dropped_records == 3
+    assert sink._backoff > 0.1
+
+    server = _serve(port)
+    sink.close()
+    assert server.disconnected.wait(5)
+    server.shutdown()
+    server.server_close()
+
+    assert _lines(server.frames) == [f"line {i}" for i in range(3, 10)]
+
+
+def test_network_sink_udp():
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(2)
+
+    sink = CrimsonNetworkSink().configure(
+        _config(receiver.getsockname()[1], network_protocol="UDP")
+    )
+    sink.write_batch(["a", "b"])
+    sink.flush()
+    sink.close()
+
+    datagram = receiver.recv(65536)
+    receiver.close()
+    (length,) = FRAME_HEADER.unpack(datagram[: FRAME_HEADER.size])
+    assert datagram[FRAME_HEADER.size :] == b"a\nb\n"
+    assert length == 4
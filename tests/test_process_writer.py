@@ -0,0 +1,116 @@
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.write_mode import WriteMode
+from crimson_logger.src.thread_model import ThreadModel
+import multiprocessing
+import time
+
+
+def test_process_writer_single_owner(tmp_path):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        thread_model=ThreadModel.MULTI,
+        write_mode=WriteMode.PROCESS,
+        file_location=str(tmp_path / "process.log"),
+        batch_size=16,
+    )
+    logger = (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+    def produce(worker):
+        for i in range(100):
+            logger.info(f"record {i}", f"worker{worker}")
+
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=produce, args=(w,)) for w in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    logger.info("record 0", "parent")
+    logger.close()
+
+    with open(config.file_location, "r") as log_file:
+        lines = log_file.read().splitlines()
+
+    assert len(lines) == 401
+    for w in range(4):
+        own = [line.split("] ")[-1] for line in lines if f"[worker{w}]" in line]
+        assert own == [f"record {i}" for i in range(100)]
+
+
+def _process_config(tmp_path) -> CrimsonLogConfig:
+    return CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        thread_model=ThreadModel.MULTI,
+        write_mode=WriteMode.PROCESS,
+        file_location=str(tmp_path / "process.log"),
+        batch_size=1000,
+        flush_interval_ms=60_000,
+    )
+
+
+def test_process_writer_flush_waits_for_writer_process(tmp_path):
+    config = _process_config(tmp_path)
+    logger = (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+    def produce():
+        logger.info("from child", "worker")
+        assert logger.flush(timeout=5)
+        with open(config.file_location, "r") as log_file:
+            assert "from child" in log_file.read()
+
+    try:
+        for i in range(3):
+            logger.info(f"record {i}", "parent")
+            assert logger.flush(timeout=5)
+            with open(config.file_location, "r") as log_file:
+                assert len(log_file.read().splitlines()) == i + 1
+
+        child = multiprocessing.get_context("fork").Process(target=produce)
+        child.start()
+        child.join()
+        assert child.exitcode == 0
+    finally:
+        logger.close()
+
+
+def test_process_writer_flush_reports_unwritten_records(tmp_path):
+    config = _process_config(tmp_path)
+    logger = (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+    writer = logger._writer
+    writer._process.terminate()
+    writer._process.join()
+
+    logger.info("lost", "parent")
+    started = time.monotonic()
+    assert not logger.flush()
+    assert time.monotonic() - started < 2
+    assert not logger.flush(timeout=0.2)
@@ -0,0 +1,83 @@
+from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.log_level import LogLevel
+import random
+
+
+def _build(tmp_path, **overrides):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.DEBUG,
+        file_location=str(tmp_path / "filter.log"),
+        enable_metrics=True,
+        **overrides,
+    )
+    return (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+
+def _messages(tmp_path):
+    lines = (tmp_path / "filter.log").read_text().splitlines()
+    return [line.split("] ", 2)[-1] for line in lines]
+
+
+def test_dedup_summarizes_repeats(tmp_path):
+    logger = _build(tmp_path, dedup=True)
+    for _ in range(5):
+        logger.error("db down %s", "payments", "primary")
+    logger.error("db up", "payments")
+    for _ in range(3):
+        logger.error("db down %s", "payments", "primary")
+    logger.close()
+
+    assert _messages(tmp_path) == [
+        "db down primary",
+        "last message repeated 4 times",
+        "db up",
+        "db down primary",
+        "last message repeated 2 times",
+    ]
+    assert logger.metrics_snapshot()["records"]["dropped"] == {"ERROR": 6}
+
+
+def test_rate_limit_and_sampling_per_namespace(tmp_path):
+    random.seed(7)
+    logger = _build(
+        tmp_path,
+        rate_limits={"payments": 0.001},
+        rate_limit_burst=10,
+        sample_rates={"http": 0.25},
+    )
+    for i in range(100):
+        logger.error(f"failure {i}", "payments.gateway")
+        logger.info(f"request {i}", "http.client")
+        logger.error(f"request error {i}", "http.client")
+        logger.info(f"order {i}", "orders")
+    logger.close()
+
+    messages = _messages(tmp_path)
+    assert [m for m in messages if m.startswith("failure")] == [
+        f"failure {i}" for i in range(10)
+    ]
+    sampled = [m for m in messages if m.startswith("request ") and "error" not in m]
+    assert 10 < len(sampled) < 45
+    # sampling only applies to DEBUG and INFO
+    assert len([m for m in messages if m.startswith("request error")]) == 100
+    assert len([m for m in messages if m.startswith("order")]) == 100
+
+
+def test_fractional_rate_limit_lets_records_through(tmp_path):
+    logger = _build(tmp_path, rate_limits={"payments": 0.5})
+    for i in range(5):
+        logger.error(f"failure {i}", "payments")
+    logger.close()
+
+    assert _messages(tmp_path) == ["failure 0"]
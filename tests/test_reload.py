@@ -0,0 +1,221 @@
+from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.write_mode import WriteMode
+from crimson_logger.src.overflow_policy import OverflowPolicy
+from crimson_logger.src.crimson_file_sink import CrimsonFileSink
+import dataclasses
+import os
+import re
+import time
+
+
+def test_reload_keeps_queued_records(tmp_path):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        file_location=str(tmp_path / "reload.log"),
+        write_mode=WriteMode.ASYNC,
+        batch_size=64,
+        deferred_formatting=True,
+    )
+    logger = (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+    for i in range(1000):
+        logger.info(f"before {i}", "app")
+    logger.debug("hidden", "app")
+
+    logger.reload(
+        dataclasses.replace(
+            config,
+            log_level=LogLevel.DEBUG,
+            ts_format="yyyy-mm-dd",
+            file_location=str(tmp_path / "ignored.log"),
+        )
+    )
+    logger.debug("after", "app")
+    logger.close()
+
+    lines = (tmp_path / "reload.log").read_text().splitlines()
+    assert [line.split("] ")[-1] for line in lines] == [
+        f"before {i}" for i in range(1000)
+    ] + ["after"]
+    assert re.match(r"\[app\] DEBUG \[\d{4}-\d{2}-\d{2}\] after", lines[-1])
+    assert not os.path.exists(tmp_path / "ignored.log")
+
+
+def test_watch_config_reloads_on_change(tmp_path):
+    config_file = tmp_path / "config.txt"
+    config_file.write_text(
+        "ts_format:dd-mm-yyyy hh:MM:ss\n"
+        "log_level:INFO sink_type:FILE\n"
+        f"file_location:{tmp_path / 'watched.log'}\n"
+    )
+    logger = (
+        CrimsonLoggerBuilder()
+        .with_config(str(config_file))
+        .set_sink()
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+    logger.watch_config(str(config_file), interval_s=0.01)
+
+    config_file.write_text(
+        config_file.read_text().replace("log_level:INFO", "log_level:DEBUG")
+        + "max_file_size:100\n"
+    )
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    deadline = time.monotonic() + 5
+    while not logger.is_enabled_for(LogLevel.DEBUG) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert logger.is_enabled_for(LogLevel.DEBUG)
+
+    for i in range(10):
+        logger.debug(f"line {i}", "app")
+    logger.close()
+    # new rotation size applied to running sink
+    assert os.path.exists(f"{tmp_path / 'watched.log'}.1.gz")
+
+
+def test_reload_lowers_main_sink_level_when_fanning_out(tmp_path):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.WARN,
+        file_location=str(tmp_path / "main.log"),
+    )
+    errors = CrimsonFileSink()
+    logger = (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .add_sink(
+            errors,
+            log_level=LogLevel.ERROR,
+            config=dataclasses.replace(config, file_location=str(tmp_path / "errors.log")),
+        )
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+    logger.info("before", "app")
+    logger.reload(dataclasses.replace(config, log_level=LogLevel.DEBUG))
+    logger.debug("after", "app")
+    logger.error("failed", "app")
+    logger.close()
+
+    lines = (tmp_path / "main.log").read_text().splitlines()
+    assert [line.split("] ")[-1] for line in lines] == ["after", "failed"]
+    errors_lines = (tmp_path / "errors.log").read_text().splitlines()
+    assert [line.split("] ")[-1] for line in errors_lines] == ["failed"]
+
+
+def test_reload_keeps_explicit_rotation_size(tmp_path):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        file_location=str(tmp_path / "sized.log"),
+    )
+    sink = CrimsonFileSink().configure(config, max_file_size=100)
+
+    sink.reconfigure(dataclasses.replace(config, log_level=LogLevel.DEBUG))
+    assert sink._max_file_size == 100
+
+    sink.reconfigure(dataclasses.replace(config, max_file_size=500))
+    assert sink._max_file_size == 500
+    sink.close()
+
+
+def test_reload_warns_and_keeps_writer_settings(tmp_path, capsys):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        file_location=str(tmp_path / "buffered.log"),
+        write_mode=WriteMode.BUFFERED,
+        thread_buffer_capacity=64,
+    )
+    logger = (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+    logger.reload(
+        dataclasses.replace(
+            config,
+            log_level=LogLevel.DEBUG,
+            thread_buffer_capacity=8,
+            overflow_policy=OverflowPolicy.DROP_NEWEST,
+            batch_size=32,
+            flush_interval_ms=10,
+            bytes_io=True,
+        )
+    )
+    logger.close()
+
+    out = capsys.readouterr().out
+    for name in (
+        "thread_buffer_capacity",
+        "overflow_policy",
+        "batch_size",
+        "flush_interval_ms",
+        "bytes_io",
+    ):
+        assert f"Changing {name} needs a rebuilt logger" in out
+        assert getattr(logger._config, name) == getattr(config, name)
+    assert logger._config.log_level == LogLevel.DEBUG
+
+
+def test_reload_leaves_sinks_with_own_config_alone(tmp_path):
+    config = CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        file_location=str(tmp_path / "main.log"),
+    )
+    errors = CrimsonFileSink()
+    shared = CrimsonFileSink()
+    logger = (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .add_sink(
+            errors,
+            config=dataclasses.replace(
+                config, file_location=str(tmp_path / "errors.log"), max_file_size=50_000
+            ),
+        )
+        .add_sink(shared)
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+
+    logger.reload(dataclasses.replace(config, max_file_size=200))
+    logger.close()
+
+    assert logger._sink._max_file_size == 200
+    assert shared._max_file_size == 200
+    assert errors._max_file_size == 50_000
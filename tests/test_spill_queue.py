@@ -0,0 +1,100 @@
+from crimson_logger.src.spill_queue import SpillQueue
+from crimson_logger.src.async_writer import AsyncWriter
+from crimson_logger.src.crimson_sink import CrimsonSink
+from crimson_logger.src.crimson_metrics import CrimsonMetrics
+from crimson_logger.src.log_record import LogRecord
+from threading import Event
+from queue import Empty
+import os
+import pytest
+
+
+class StalledSink(CrimsonSink):
+    def __init__(self, release: Event):
+        super().__init__()
+        self.release = release
+        self.messages = []
+
+    def configure(self, config):
+        return self
+
+    def write(self, message):
+        self.release.wait()
+        self.messages.append(message)
+
+    def write_batch(self, messages):
+        for message in messages:
+            self.write(message)
+
+
+def _drain(queue: SpillQueue) -> list:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def test_overflow_is_spooled_and_replayed_in_order(tmp_path):
+    queue = SpillQueue(capacity=10, spool_dir=str(tmp_path), segment_bytes=256)
+
+    for i in range(100):
+        queue.put(f"message {i}")
+    queue.put(LogRecord("WARN", 123, "app.db", "slow query %d ms", (42,)))
+
+    stats = queue.stats()
+    assert stats["records"] == 91
+    assert stats["bytes"] > 0
+    assert len(queue._memory) == 10
+    assert len(os.listdir(tmp_path)) > 1
+
+    items = _drain(queue)
+    assert items[:100] == [f"message {i}" for i in range(100)]
+    record = items[100]
+    assert (record.level, record.timestamp_ns, record.namespace) == ("WARN", 123, "app.db")
+    assert record.get_message() == "slow query 42 ms"
+
+    # replayed segments are removed once the writer asks for more
+    with pytest.raises(Empty):
+        queue.get_nowait()
+    assert queue.stats()["bytes"] == 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_spool_survives_restart(tmp_path):
+    queue = SpillQueue(capacity=2, spool_dir=str(tmp_path))
+    for i in range(20):
+        queue.put(f"message {i}")
+    # process dies, only spooled records are left
+    queue.close()
+    with open(os.path.join(tmp_path, os.listdir(tmp_path)[0]), "ab") as f:
+        f.write(b"\x10\x00")  # torn write
+
+    restarted = SpillQueue(capacity=2, spool_dir=str(tmp_path))
+    restarted.put("new")
+    assert _drain(restarted) == [f"message {i}" for i in range(2, 20)] + ["new"]
+
+
+def test_async_writer_memory_bounded_while_sink_stalls(tmp_path):
+    release = Event()
+    sink = StalledSink(release)
+    metrics = CrimsonMetrics()
+    writer = AsyncWriter(queue_capacity=50, spool_dir=str(tmp_path / "spool"))
+    writer.set_sink(sink)
+    writer.set_metrics(metrics)
+    metrics.watch_writer(writer)
+    writer.start()
+
+    for i in range(1000):
+        writer.write_to_sink(f"message {i}")
+
+    assert len(writer.spool._memory) <= 50
+    assert metrics.snapshot()["spool"]["records"] >= 900
+
+    release.set()
+    assert writer.flush(timeout=5)
+    assert sink.messages == [f"message {i}" for i in range(1000)]
+    assert metrics.snapshot()["spool"]["records"] == 0
+
+    writer.stop()
+    writer.join(timeout=5)
+    assert not writer.is_alive()
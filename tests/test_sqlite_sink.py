@@ -0,0 +1,82 @@
+from crimson_logger.src.crimson_logger import CrimsonLoggerBuilder
+from crimson_logger.src.crimson_log_config import CrimsonLogConfig
+from crimson_logger.src.crimson_sqlite_sink import CrimsonSqliteSink
+from crimson_logger.src.log_level import LogLevel
+from crimson_logger.src.log_record import LogRecord
+from crimson_logger.src.write_mode import WriteMode
+import sqlite3
+
+HOUR_NS = 3_600_000_000_000
+
+
+def _config(tmp_path, **overrides) -> CrimsonLogConfig:
+    return CrimsonLogConfig(
+        ts_format="dd-mm-yyyy hh:MM:ss",
+        db_ip_address=None,
+        db_port="",
+        log_level=LogLevel.INFO,
+        sink_type="SQLITE",
+        file_location=str(tmp_path / "logs.db"),
+        **overrides,
+    )
+
+
+def test_sqlite_sink_from_builder(tmp_path):
+    config = _config(tmp_path, write_mode=WriteMode.ASYNC, batch_size=128)
+    logger = (
+        CrimsonLoggerBuilder()
+        .with_config(None, custom_config=config)
+        .set_sink()
+        .set_writer()
+        .set_formatter()
+        .build()
+    )
+    for i in range(500):
+        logger.info("order %d placed", "orders", i)
+    logger.error("payment failed", "payments.gateway")
+    logger.close()
+
+    with sqlite3.connect(tmp_path / "logs.db") as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        rows = conn.execute(
+            "SELECT level, namespace, message FROM logs ORDER BY ts, rowid"
+        ).fetchall()
+        plan = " ".join(
+            str(row)
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM logs WHERE namespace = 'orders'"
+            )
+        )
+
+    assert len(rows) == 501
+    assert rows[0] == ("INFO", "orders", "order 0 placed")
+    assert rows[-1] == ("ERROR", "payments.gateway", "payment failed")
+    assert "_namespace" in plan
+
+
+def test_sqlite_sink_prunes_old_partitions(tmp_path):
+    sink = CrimsonSqliteSink().configure(
+        _config(tmp_path, sqlite_partition_hours=1, sqlite_retention_partitions=2)
+    )
+    for hour in range(5):
+        sink.write_batch(
+            [
+                LogRecord("INFO", hour * HOUR_NS + i, "jobs", "hour %d", (hour,))
+                for i in range(10)
+            ]
+        )
+    # older than retention, dropped
+    sink.write(LogRecord("INFO", 0, "jobs", "late"))
+    sink.close()
+
+    with sqlite3.connect(tmp_path / "logs.db") as conn:
+        tables = [
+            name
+            for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
+            )
+        ]
+        messages = {m for (m,) in conn.execute("SELECT message FROM logs")}
+
+    assert tables == ["logs_3", "logs_4"]
+    assert messages == {"hour 3", "hour 4"}